@@ -1,3 +1,4 @@
+from .api.abilities.async_use_api import AsyncUseAPI
 from .api.abilities.use_api import UseAPI
 from .api.actions.delete import Delete
 from .api.actions.get import Get
@@ -5,11 +6,21 @@ from .api.actions.head import Head
 from .api.actions.patch import Patch
 from .api.actions.post import Post
 from .api.actions.put import Put
+from .api.actions.send import Send
+from .api.http_cache import HttpCache
+from .api.questions.latency import Latency
 from .api.questions.response import Response
-from .api.types import RequestMethod, Response, ResponseBodyFormat
+from .api.rate_limiter import RateLimiter
+from .api.retry import RetryPolicy
+from .api.token_provider import AsyncTokenProvider, Token, TokenProvider
+from .api.request_context_pool import APIRequestContextPool, AsyncAPIRequestContextPool, RequestContextPoolStats
+from .api.types import RequestMethod, Response, ResponseBodyFormat, ResponseFile, ResponseTiming
 
 from .shared.actions.sleep import Sleep
+from .shared.histogram import LatencyHistogram, LatencySamples
+from .shared.load_runner import LoadReport, LoadRunner
 
+from .web.abilities.async_browse_the_web import AsyncBrowseTheWeb
 from .web.abilities.browse_the_web import BrowseTheWeb
 from .web.actions.add import Add
 from .web.actions.check import Check
@@ -27,4 +38,7 @@ from .web.actions.select import Select
 from .web.actions.type import Type
 from .web.actions.wait import Wait
 from .web.questions.element import Element
+from .web.context_pool import AsyncBrowserContextPool, BrowserContextPool, ContextPoolMetrics
+from .web.request_blocking import RequestBlocking, RequestBlockingStats
+from .web.storage_state_cache import StorageStateCache
 from .web.types import Selector, SelectorOptions, SelectorOptionsState, SubSelector, SubSelectorOptions
\ No newline at end of file
@@ -1,3 +1,4 @@
+# from .abilities.async_use_api import AsyncUseAPI
 # from .abilities.use_api import UseAPI
 
 # from .actions.delete import Delete
@@ -6,7 +7,15 @@
 # from .actions.patch import Patch
 # from .actions.post import Post
 # from .actions.put import Put
+# from .actions.send import Send
 
+# from .questions.latency import Latency
 # from .questions.response import Response
 
-# from .types import RequestMethod, Response, ResponseBodyFormat
\ No newline at end of file
+# from .http_cache import HttpCache
+# from .rate_limiter import RateLimiter
+# from .retry import RetryPolicy
+# from .token_provider import AsyncTokenProvider, Token, TokenProvider
+# from .request_context_pool import APIRequestContextPool, AsyncAPIRequestContextPool, RequestContextPoolStats
+
+# from .types import RequestMethod, Response, ResponseBodyFormat, ResponseFile, ResponseTiming
\ No newline at end of file
@@ -0,0 +1,159 @@
+import asyncio
+from functools import partial
+from time import perf_counter_ns
+from typing import Any, Callable, Dict
+from playwright.async_api import APIRequestContext, APIResponse
+from ..request_context_pool import AsyncAPIRequestContextPool
+from ..retry import RetryAttempts, RetryPolicy
+from ..single_flight import COALESCED_METHODS, AsyncSingleFlight, flight_key
+from ..token_provider import AsyncTokenProvider
+from ..types import RawResponse, RequestFile, RequestMethod, Response, ResponseBodyFormat
+from ..utils import request_arguments
+from .use_api import UseAPI
+from testla_screenplay import Actor
+
+
+class AsyncUseAPI(UseAPI):
+    """This class represents the actor's ability to use an API via the asyncio based Playwright API.
+    send_request is a coroutine, which allows a single event loop to have many requests in flight. The checks are the same as for UseAPI."""
+
+    def __init__(self, request_context: APIRequestContext, max_concurrency: int = 10, json_decoder: Callable[[bytes], Any] | None = None):
+        super().__init__(request_context, json_decoder=json_decoder)
+        self.max_concurrency = max_concurrency
+        self.pool: AsyncAPIRequestContextPool | None = None
+        self.single_flight: AsyncSingleFlight | None = None
+        self.token_provider: AsyncTokenProvider | None = None
+
+    @staticmethod
+    def using(request_context: APIRequestContext, max_concurrency: int = 10, json_decoder: Callable[[bytes], Any] | None = None) -> 'AsyncUseAPI':
+        """Initialize this Ability by passing an already existing asynchronous Playwright APIRequestContext object.
+
+        :param request_context: the Playwright APIRequestContext that will be used.
+        :param max_concurrency: (optional) the default maximum number of requests Send.all() has in flight at the same time.
+        :param json_decoder: (optional) decodes JSON bodies, e.g. orjson.loads. Defaults to orjson if it is installed, json otherwise.
+        """
+        return AsyncUseAPI(request_context, max_concurrency=max_concurrency, json_decoder=json_decoder)
+
+    @staticmethod
+    async def from_pool(pool: AsyncAPIRequestContextPool, base_url: str | None = None, timeout: float | None = None, max_concurrency: int = 10,
+                        json_decoder: Callable[[bytes], Any] | None = None) -> 'AsyncUseAPI':
+        """Initialize this Ability with an APIRequestContext that is shared with other actors. Call release() once the actor is done.
+
+        :param pool: the pool to acquire the request context from.
+        :param base_url: (optional) the base URL of the request context.
+        :param timeout: (optional) maximum time in seconds to wait for a request context if the pool is full.
+        :param max_concurrency: (optional) see using().
+        :param json_decoder: (optional) see using().
+        """
+        ability = AsyncUseAPI(await pool.acquire(base_url=base_url, timeout=timeout), max_concurrency=max_concurrency, json_decoder=json_decoder)
+        ability.pool = pool
+        return ability
+
+    async def release(self) -> None:
+        """Give the request context back to the pool it was acquired from."""
+        if self.pool is None:
+            raise RuntimeError('Error: the request context was not acquired from an AsyncAPIRequestContextPool.')
+        pool, self.pool = self.pool, None
+        await pool.release(self.request_context)
+
+    def with_token_provider(self, token_provider: AsyncTokenProvider) -> 'AsyncUseAPI':
+        """Send an access token with every request. Share the token provider between the abilities of all actors, so the token is fetched once.
+
+        :param token_provider: the token provider.
+        """
+        self.token_provider = token_provider
+        return self
+
+    def with_request_coalescing(self) -> 'AsyncUseAPI':
+        """Share one request between identical GET and HEAD requests (same URL and headers) that are in flight at the same time,
+        e.g. coroutines polling the same status endpoint. Every caller gets its own copy of the response.
+        Only available for AsyncUseAPI: sync Playwright objects are bound to the thread that created them, so a UseAPI is never used concurrently."""
+        self.single_flight = AsyncSingleFlight()
+        return self
+
+    def get_coalescing_stats(self) -> Dict[str, int]:
+        """Get the number of requests that were sent and that shared the response of an identical request in flight."""
+        if self.single_flight is None:
+            return {'sent': 0, 'shared': 0}
+        return {'sent': self.single_flight.leaders, 'shared': self.single_flight.followers}
+
+    @staticmethod
+    def As(actor: Actor) -> 'AsyncUseAPI':
+        """Use this Ability as an Actor."""
+        return actor.with_ability_to(AsyncUseAPI)
+
+    def get_request_context(self) -> APIRequestContext:
+        """Get the request context object."""
+        return self.request_context
+
+    async def send_request(self, method: RequestMethod, url: str, headers: Dict[str, str] | None = None, data: object | None = None, response_format: ResponseBodyFormat | None = None, multipart: Dict[str, Any] | None = None,
+                           retry_policy: RetryPolicy | None = None) -> Response:
+        read_body = response_format != ResponseBodyFormat.NONE
+        retry_policy = retry_policy or self.retry_policy
+        if retry_policy is None or not retry_policy.retries(method):
+            raw = await self._exchange(method, url, headers, data, read_body, multipart)
+        else:
+            raw = await self._exchange_with_retries(retry_policy, method, url, headers, data, read_body, multipart)
+        return self._to_response(raw, response_format)
+
+    async def _exchange_with_retries(self, retry_policy: RetryPolicy, method: RequestMethod, url: str, headers: Dict[str, str] | None, data: object | None, read_body: bool, multipart: Dict[str, Any] | None) -> RawResponse:
+        """Exchange a request until it succeeds or the retry policy gives up. The last response is returned, the last error raised."""
+        attempts = RetryAttempts(retry_policy)
+        while True:
+            try:
+                raw = await self._exchange(method, url, headers, data, read_body, multipart)
+                backoff = attempts.next_backoff(response=raw)
+                if backoff is None:
+                    return attempts.result(raw)
+            except Exception as error:
+                backoff = attempts.next_backoff(error=error)
+                if backoff is None:
+                    raise
+            await asyncio.sleep(backoff)
+            attempts.backed_off(backoff)
+
+    async def _exchange(self, method: RequestMethod, url: str, headers: Dict[str, str] | None, data: object | None, read_body: bool, multipart: Dict[str, Any] | None = None) -> RawResponse:
+        """Send a request, share it with an identical request in flight, or answer it from the HTTP cache."""
+        if self.single_flight is None or method not in COALESCED_METHODS:
+            return await self._fetch(method, url, headers, data, read_body, multipart)
+        return await self.single_flight.do(flight_key(method, url, headers, read_body), partial(self._fetch, method, url, headers, data, read_body, multipart))
+
+    async def _fetch(self, method: RequestMethod, url: str, headers: Dict[str, str] | None, data: object | None, read_body: bool, multipart: Dict[str, Any] | None = None) -> RawResponse:
+        """Send a request, or answer it from the HTTP cache."""
+        cache_key = self._cache_key(method, url, headers, read_body)
+        if cache_key is None:
+            return await self._send(method, url, headers, data, read_body, multipart)
+        cached = self.http_cache.fresh(cache_key)
+        if cached is not None:
+            return cached
+        raw = await self._send(method, url, self.http_cache.conditional_headers(cache_key, headers), data, read_body)
+        return self.http_cache.update(cache_key, raw)
+
+    async def _send(self, method: RequestMethod, url: str, headers: Dict[str, str] | None, data: object | None, read_body: bool, multipart: Dict[str, Any] | None = None) -> RawResponse:
+        token = await self.token_provider.token() if self.token_provider is not None else None
+        headers, upload_bytes = self._prepare_request(headers, data, multipart, token)
+        if isinstance(data, RequestFile):
+            # read the file outside of the event loop
+            data = await asyncio.to_thread(data.read)
+
+        rate_limit_ns = 0
+        if self.rate_limiter is not None:
+            wait_start = perf_counter_ns()
+            await self.rate_limiter.acquire_async(url)
+            rate_limit_ns = perf_counter_ns() - wait_start
+
+        name, arguments = request_arguments(method, url, headers, data, multipart)
+        # track time before sending request, with a monotonic clock
+        start_time = perf_counter_ns()
+        res: APIResponse = await getattr(self.request_context, name)(**arguments)
+        # Playwright returns the response once it was received
+        headers_time = perf_counter_ns()
+        self._check_token(token, res.status)
+
+        body = await res.body() if read_body else None
+        body_time = perf_counter_ns()
+        # free the copy of the body kept by Playwright
+        await res.dispose()
+
+        return RawResponse(res.status, res.headers, body, headers_ns=headers_time - start_time, body_ns=body_time - headers_time,
+                           upload_bytes=upload_bytes, rate_limit_ns=rate_limit_ns)
@@ -1,24 +1,100 @@
-from time import time
-from typing import Any, Dict, Literal
+from time import perf_counter_ns, sleep
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, List, Literal, Tuple
 from playwright.sync_api import APIRequestContext, APIResponse
-from sqlalchemy import true
-from ..types import RequestMethod, Response, ResponseBodyFormat
+from ...shared.histogram import LatencySamples
+from ..http_cache import HttpCache
+from ..json_path import MISSING, first_mismatch
+from ..rate_limiter import RateLimiter
+from ..request_context_pool import APIRequestContextPool
+from ..retry import RetryAttempts, RetryPolicy
+from ..schema import SCHEMA_VALIDATORS, CompiledSchema
+from ..token_provider import TokenProvider
+from ..types import RawResponse, RequestFile, RequestMethod, Response, ResponseBodyFormat, ResponseTiming
+from ..utils import buffer_body, default_json_decoder, request_arguments, request_body_size, write_body_to_file
 from testla_screenplay import Ability, Actor
 
 
 class UseAPI(Ability):
     """This class represents the actor's ability to use an API."""
 
-    def __init__(self, request_context: APIRequestContext):
+    def __init__(self, request_context: APIRequestContext, json_decoder: Callable[[bytes], Any] | None = None):
         self.request_context = request_context
+        self.json_decoder = json_decoder or default_json_decoder()
+        self.pool: APIRequestContextPool | None = None
+        self.http_cache: HttpCache | None = None
+        self.rate_limiter: RateLimiter | None = None
+        self.retry_policy: RetryPolicy | None = None
+        self.token_provider: TokenProvider | None = None
 
     @staticmethod
-    def using(request_context: APIRequestContext) -> 'UseAPI':
+    def using(request_context: APIRequestContext, json_decoder: Callable[[bytes], Any] | None = None) -> 'UseAPI':
         """Initialize this Ability by passing an already existing Playwright APIRequestContext object.
         
         :param request_context: the Playwright APIRequestContext that will be used.
+        :param json_decoder: (optional) decodes JSON bodies, e.g. orjson.loads. Defaults to orjson if it is installed, json otherwise.
         """
-        return UseAPI(request_context)
+        return UseAPI(request_context, json_decoder=json_decoder)
+
+    @staticmethod
+    def from_pool(pool: APIRequestContextPool, base_url: str | None = None, json_decoder: Callable[[bytes], Any] | None = None) -> 'UseAPI':
+        """Initialize this Ability with an APIRequestContext that is shared with other actors. Call release() once the actor is done.
+
+        :param pool: the pool to acquire the request context from.
+        :param base_url: (optional) the base URL of the request context.
+        :param json_decoder: (optional) see using().
+        """
+        ability = UseAPI(pool.acquire(base_url=base_url), json_decoder=json_decoder)
+        ability.pool = pool
+        return ability
+
+    def release(self) -> None:
+        """Give the request context back to the pool it was acquired from."""
+        if self.pool is None:
+            raise RuntimeError('Error: the request context was not acquired from an APIRequestContextPool.')
+        pool, self.pool = self.pool, None
+        pool.release(self.request_context)
+
+    def with_http_cache(self, http_cache: HttpCache | None = None) -> 'UseAPI':
+        """Cache GET responses. Responses with an ETag or Last-Modified header are revalidated with conditional requests,
+        with HttpCache(ttl=...) responses are served without asking the server until they expire.
+
+        :param http_cache: (optional) the cache to use. Defaults to an HttpCache with validators only.
+        """
+        self.http_cache = http_cache if http_cache is not None else HttpCache()
+        return self
+
+    def get_http_cache_stats(self) -> Dict[str, int]:
+        """Get the hit and miss counters of the HTTP cache."""
+        if self.http_cache is None:
+            return {'hits': 0, 'misses': 0, 'not_modified': 0}
+        return {'hits': self.http_cache.hits, 'misses': self.http_cache.misses, 'not_modified': self.http_cache.not_modified}
+
+    def with_rate_limiter(self, rate_limiter: RateLimiter) -> 'UseAPI':
+        """Limit the rate of the requests sent with this ability. Share the rate limiter between the abilities of all actors to limit their total rate.
+        The time each request waited is reported in Response.timing.rate_limit_ns.
+
+        :param rate_limiter: the rate limiter, e.g. RateLimiter(requests_per_second=50, burst=10).
+        """
+        self.rate_limiter = rate_limiter
+        return self
+
+    def with_retry_policy(self, retry_policy: RetryPolicy | None = None) -> 'UseAPI':
+        """Send failed requests again. Requests can override the policy with their own with_retry_policy().
+        The number of attempts and the time waited between them are reported in Response.timing.
+
+        :param retry_policy: (optional) the retry policy. Defaults to 3 attempts of idempotent requests on transient errors.
+        """
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        return self
+
+    def with_token_provider(self, token_provider: TokenProvider) -> 'UseAPI':
+        """Send an access token with every request. Share the token provider between the abilities of all actors, so the token is fetched once.
+
+        :param token_provider: the token provider, e.g. TokenProvider(lambda: Token.from_oauth(...)).
+        """
+        self.token_provider = token_provider
+        return self
 
     @staticmethod
     def As(actor: Actor) -> 'UseAPI':
@@ -29,46 +105,127 @@ class UseAPI(Ability):
         """Get the request context object."""
         return self.request_context
 
-    def send_request(self, method: RequestMethod, url: str, headers: Dict[str, str] | None = None, data: object | None = None, response_format: ResponseBodyFormat | None = None) -> Response:
-        # track time before sending request
-        start_time = time()
-
-        res: APIResponse
-        match method:
-            case RequestMethod.GET:
-                res = self.request_context.get(url=url, headers=headers)
-            case RequestMethod.POST:
-                res = self.request_context.post(url=url, headers=headers, data=data)
-            case RequestMethod.PUT:
-                res = self.request_context.put(url=url, headers=headers, data=data)
-            case RequestMethod.PATCH:
-                res = self.request_context.patch(url=url, headers=headers, data=data)
-            case RequestMethod.HEAD:
-                res = self.request_context.head(url=url, headers=headers)
-            case RequestMethod.DELETE:
-                res = self.request_context.delete(url=url, headers=headers, data=data)
-            # default case
-            case _:
-                raise RuntimeError("Error: HTTP method not supported.")
+    def send_request(self, method: RequestMethod, url: str, headers: Dict[str, str] | None = None, data: object | None = None, response_format: ResponseBodyFormat | None = None, multipart: Dict[str, Any] | None = None,
+                     retry_policy: RetryPolicy | None = None) -> Response:
+        read_body = response_format != ResponseBodyFormat.NONE
+        retry_policy = retry_policy or self.retry_policy
+        if retry_policy is None or not retry_policy.retries(method):
+            raw = self._exchange(method, url, headers, data, read_body, multipart)
+        else:
+            raw = self._exchange_with_retries(retry_policy, method, url, headers, data, read_body, multipart)
+        return self._to_response(raw, response_format)
+
+    def _exchange_with_retries(self, retry_policy: RetryPolicy, method: RequestMethod, url: str, headers: Dict[str, str] | None, data: object | None, read_body: bool, multipart: Dict[str, Any] | None) -> RawResponse:
+        """Exchange a request until it succeeds or the retry policy gives up. The last response is returned, the last error raised."""
+        attempts = RetryAttempts(retry_policy)
+        while True:
+            try:
+                raw = self._exchange(method, url, headers, data, read_body, multipart)
+                backoff = attempts.next_backoff(response=raw)
+                if backoff is None:
+                    return attempts.result(raw)
+            except Exception as error:
+                backoff = attempts.next_backoff(error=error)
+                if backoff is None:
+                    raise
+            sleep(backoff)
+            attempts.backed_off(backoff)
+
+    def _exchange(self, method: RequestMethod, url: str, headers: Dict[str, str] | None, data: object | None, read_body: bool, multipart: Dict[str, Any] | None = None) -> RawResponse:
+        """Send a request, or answer it from the HTTP cache."""
+        cache_key = self._cache_key(method, url, headers, read_body)
+        if cache_key is None:
+            return self._send(method, url, headers, data, read_body, multipart)
+        cached = self.http_cache.fresh(cache_key)
+        if cached is not None:
+            return cached
+        raw = self._send(method, url, self.http_cache.conditional_headers(cache_key, headers), data, read_body)
+        return self.http_cache.update(cache_key, raw)
+
+    def _send(self, method: RequestMethod, url: str, headers: Dict[str, str] | None, data: object | None, read_body: bool, multipart: Dict[str, Any] | None = None) -> RawResponse:
+        token = self.token_provider.token() if self.token_provider is not None else None
+        headers, upload_bytes = self._prepare_request(headers, data, multipart, token)
+        if isinstance(data, RequestFile):
+            # the file is read as late as possible, so the action never holds its content
+            data = data.read()
+
+        rate_limit_ns = 0
+        if self.rate_limiter is not None:
+            wait_start = perf_counter_ns()
+            self.rate_limiter.acquire(url)
+            rate_limit_ns = perf_counter_ns() - wait_start
+
+        name, arguments = request_arguments(method, url, headers, data, multipart)
+        # track time before sending request, with a monotonic clock
+        start_time = perf_counter_ns()
+        res: APIResponse = getattr(self.request_context, name)(**arguments)
+        # Playwright returns the response once it was received
+        headers_time = perf_counter_ns()
+        self._check_token(token, res.status)
+
+        body = res.body() if read_body else None
+        body_time = perf_counter_ns()
+        # free the copy of the body kept by Playwright
+        res.dispose()
+
+        return RawResponse(res.status, res.headers, body, headers_ns=headers_time - start_time, body_ns=body_time - headers_time,
+                           upload_bytes=upload_bytes, rate_limit_ns=rate_limit_ns)
 
-        res_body: Any
+    def _prepare_request(self, headers: Dict[str, str] | None, data: object | None, multipart: Dict[str, Any] | None, token: str | None) -> Tuple[Dict[str, str] | None, int]:
+        """Get the headers to send and the size of the request body.
+
+        :param token: (optional) the access token of the token provider to send.
+        """
+        headers = self._upload_headers(headers, data)
+        if token is not None:
+            headers = self.token_provider.with_token(headers, token)
+        return headers, request_body_size(data, multipart)
+
+    def _check_token(self, token: str | None, status: int) -> None:
+        """Invalidate a token the server rejected."""
+        if token is not None and status == 401:
+            # the token was revoked or expired early, the next request fetches a new one
+            self.token_provider.invalidate(token)
+
+    @staticmethod
+    def _upload_headers(headers: Dict[str, str] | None, data: object | None) -> Dict[str, str] | None:
+        """Add the content type of an uploaded file to the headers, unless the headers already contain one."""
+        if not isinstance(data, RequestFile) or any(name.lower() == 'content-type' for name in headers or {}):
+            return headers
+        return {**(headers or {}), 'Content-Type': data.content_type}
+
+    def _cache_key(self, method: RequestMethod, url: str, headers: Dict[str, str] | None, read_body: bool) -> Hashable | None:
+        """Get the HTTP cache key of a request, or None if the request is not cached."""
+        if self.http_cache is None or method != RequestMethod.GET or not read_body:
+            return None
+        return self.http_cache.key(url, headers)
+
+    def _to_response(self, raw: RawResponse, response_format: ResponseBodyFormat | None) -> Response:
+        """Process the body of a received response according to the given format."""
+        start_time = perf_counter_ns()
+        res_body: Any = None
+        res_sha256: str | None = None
+        body_decoder: Callable[[], Any] | None = None
         match response_format:
             case ResponseBodyFormat.JSON:
-                res_body = res.json()
+                # decoded on first access of Response.body
+                body_decoder = partial(self.json_decoder, raw.body)
             case ResponseBodyFormat.TEXT:
-                res_body = res.text()
-            # case ResponseBodyFormat.BUFFER:
-            #     res_body = res.body()
+                body_decoder = partial(bytes.decode, raw.body, 'utf-8')
+            case ResponseBodyFormat.BUFFER:
+                res_body, res_sha256 = buffer_body(raw.body)
+            case ResponseBodyFormat.FILE:
+                res_body, res_sha256 = write_body_to_file(raw.body)
             case ResponseBodyFormat.NONE:
-                res_body = None
+                pass
             # default case
             case _:
                 raise RuntimeError("Error: ResponseBodyFormat not supported.")
 
-        # track time after receiving response
-        end_time = time()
-
-        return Response(res_body, res.status, res.headers, end_time - start_time)
+        timing = ResponseTiming(headers_ns=raw.headers_ns, body_ns=raw.body_ns, decode_ns=None if body_decoder is not None else perf_counter_ns() - start_time,
+                                upload_bytes=raw.upload_bytes, rate_limit_ns=raw.rate_limit_ns,
+                                attempts=raw.attempts, backoff_ns=raw.backoff_ns, cached=raw.cached)
+        return Response(res_body, raw.status, raw.headers, timing.duration_ms, sha256=res_sha256, body_decoder=body_decoder, timing=timing)
 
     def check_status(self, response: Response, status: int, mode: Literal['equal', 'unequal']) -> bool:
         """Verify if the given status is equal or unequal to the given response's status.
@@ -79,9 +236,9 @@ class UseAPI(Ability):
         :returns: true if the status is equal/unequal as expected.
         """
         assert (response.status == status) == (mode == 'equal')
-        return true
+        return True
 
-    def check_body(self, response: Response, body: Dict | str | None, mode: Literal['equal', 'unequal']) -> bool:
+    def check_body(self, response: Response, body: Dict | List | str | bytes | None, mode: Literal['equal', 'unequal']) -> bool:
         """Verify if the given body is equal or unequal to the given response's body.
         
         :param response: the response to check.
@@ -92,15 +249,51 @@ class UseAPI(Ability):
         if type(response.body) == str and type(body) == str:
             # response body is plain text -> can check for string equality
             assert (response.body == body) == (mode == 'equal')
-            return true
-        elif type(response.body) == Dict and type(body) == Dict:
+            return True
+        elif type(response.body) in (bytes, memoryview) and type(body) in (bytes, memoryview):
+            # response body is binary -> can check for byte equality
+            assert (response.body == body) == (mode == 'equal')
+            return True
+        elif isinstance(response.body, (dict, list)) and isinstance(body, (dict, list)):
             # response body is in json -> can check with Dict equality
             assert (response.body == body) == (mode == 'equal')
-            return true
+            return True
         else:
             # response.body and body do not have same type -> bodies are unequal
             assert (mode == 'unequal')
-            return true
+            return True
+
+    def check_body_matching(self, response: Response, expectations: Dict[str, Any], mode: Literal['matches', 'does_not_match']) -> bool:
+        """Verify if the values at the given JSONPath expressions of the given response's body are as expected or not.
+        Stops at the first mismatch and never copies the body.
+
+        :param response: the response to check.
+        :param expectations: the expected values by JSONPath expression, e.g. {'$.items[0].id': 42}. Strings can also be matched with a regular expression.
+        :param mode: the result to check for.
+        :returns: true if all values match/at least one value does not match as expected.
+        """
+        mismatch = first_mismatch(response.body, expectations)
+        if mismatch is None:
+            assert mode == 'matches', 'response body matches all expected values'
+        else:
+            path, value, expected = mismatch
+            assert mode == 'does_not_match', f"{path} is {'missing' if value is MISSING else repr(value)[:100]}, expected {expected!r}"
+        return True
+
+    def check_schema(self, response: Response, schema: Dict | CompiledSchema, mode: Literal['matches', 'does_not_match']) -> bool:
+        """Verify if the given response's body matches a JSON schema or not. The schema is compiled once and reused for all responses.
+        Needs the optional jsonschema package.
+
+        :param response: the response to check.
+        :param schema: the JSON schema or a CompiledSchema.
+        :param mode: the result to check for.
+        :returns: true if the body matches/does not match the schema as expected.
+        """
+        # one violation is enough to know that the body does not match
+        errors = SCHEMA_VALIDATORS.errors(schema, response.body, limit=10 if mode == 'matches' else 1)
+        assert (len(errors) == 0) == (mode == 'matches'), \
+            'response body matches the schema' if len(errors) == 0 else 'response body does not match the schema:\n' + '\n'.join(f"  {error.path}: {error.message}" for error in errors)
+        return True
 
     def check_headers(self, response: Response, headers: Dict[str, str], mode: Literal['included', 'excluded']) -> bool:
         """Verify if the given headers are included/excluded in the given response.
@@ -112,7 +305,7 @@ class UseAPI(Ability):
         """
         # dict1.items() <= dict2.items() checks if dict1 is a subset of dict2.
         assert (headers.items() <= response.headers.items()) == (mode == 'included')
-        return true
+        return True
 
     def check_duration(self, response: Response, duration: float, mode: Literal['less_or_equal', 'greater']) -> bool:
         """Verify if the response (including receiving body) was received within a given duration or not.
@@ -123,4 +316,32 @@ class UseAPI(Ability):
         :returns: true if response was received within given duration, false otherwise.
         """
         assert (response.duration <= duration) == (mode == 'less_or_equal')
-        return true
+        return True
+
+    def check_latency(self, samples: LatencySamples, statistic: Literal['percentile', 'mean', 'max'], duration: float,
+                      mode: Literal['less_or_equal', 'greater'], percentile: float | None = None) -> bool:
+        """Verify if a statistic of the durations of many responses is within a given duration or not.
+
+        :param samples: the durations of the responses in milliseconds.
+        :param statistic: the statistic to check.
+        :param duration: expected duration (in milliseconds) not to be exceeded.
+        :param mode: the result to check for.
+        :param percentile: (optional) the percentile between 0 and 100 for statistic 'percentile', e.g. 95.
+        :returns: true if the statistic is within the given duration or not as expected.
+        """
+        assert len(samples) > 0, 'Error: no responses to check the latency of.'
+        match statistic:
+            case 'percentile':
+                value = samples.percentile(percentile)
+                name = f"p{percentile:g}"
+            case 'mean':
+                value = samples.mean
+                name = 'mean'
+            case 'max':
+                value = samples.max
+                name = 'max'
+            # default case
+            case _:
+                raise RuntimeError('Error: latency statistic not supported.')
+        assert (value <= duration) == (mode == 'less_or_equal'), f"{name} latency of {len(samples)} responses is {value:.1f} ms, expected {'<=' if mode == 'less_or_equal' else '>'} {duration:g} ms"
+        return True
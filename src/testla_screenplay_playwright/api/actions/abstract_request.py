@@ -1,13 +1,20 @@
 from abc import abstractmethod
 from typing import Dict
 from testla_screenplay import Actor, Action
+from ..retry import RetryPolicy
 
 
 class ARequest(Action):
     """Abstract parent class for all HTTP request methods. This class extends the testla Action."""
     # HTTP headers to send with the request.
     headers: Dict[str, str] = {}
+    # retry policy of the request. Defaults to the one of the ability
+    retry_policy: RetryPolicy | None = None
 
     @abstractmethod
     def perform_as(self, actor: Actor) -> object:
         pass
+
+    async def perform_as_async(self, actor: Actor) -> object:
+        """Send the request with AsyncUseAPI. Requests that only implement perform_as() can not be sent asynchronously."""
+        raise RuntimeError(f"Error: {type(self).__name__} does not support AsyncUseAPI, it does not implement perform_as_async().")
@@ -1,7 +1,9 @@
 from testla_screenplay import Actor
 from typing import Dict
 from .abstract_request import ARequest
+from ..retry import RetryPolicy
 from ..types import RequestMethod, Response, ResponseBodyFormat
+from ..abilities.async_use_api import AsyncUseAPI
 from ..abilities.use_api import UseAPI
 
 
@@ -16,7 +18,11 @@ class Get(ARequest):
 
     def perform_as(self, actor: Actor) -> Response:
         """Send a HTTP GET request to the specified url."""
-        return UseAPI.As(actor).send_request(method=RequestMethod.GET, url=self.url, headers=self.headers, response_format=self.response_body_format)
+        return UseAPI.As(actor).send_request(method=RequestMethod.GET, url=self.url, headers=self.headers, response_format=self.response_body_format, retry_policy=self.retry_policy)
+
+    async def perform_as_async(self, actor: Actor) -> Response:
+        """Send a HTTP GET request to the specified url."""
+        return await AsyncUseAPI.As(actor).send_request(method=RequestMethod.GET, url=self.url, headers=self.headers, response_format=self.response_body_format, retry_policy=self.retry_policy)
 
     @staticmethod
     def From(url: str) -> 'Get':
@@ -34,6 +40,14 @@ class Get(ARequest):
         self.headers = headers
         return self
 
+    def with_retry_policy(self, retry_policy: RetryPolicy) -> 'Get':
+        """Set the retry policy of the HTTP GET request, instead of the one of the ability.
+
+        :param retry_policy: the retry policy.
+        """
+        self.retry_policy = retry_policy
+        return self
+
     def with_response_body_format(self, response_body_format: ResponseBodyFormat) -> 'Get':
         """Set the format the response body should be returned as.
         
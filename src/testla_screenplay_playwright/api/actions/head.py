@@ -1,7 +1,9 @@
 from testla_screenplay import Actor
 from typing import Dict
 from .abstract_request import ARequest
+from ..retry import RetryPolicy
 from ..types import RequestMethod, Response, ResponseBodyFormat
+from ..abilities.async_use_api import AsyncUseAPI
 from ..abilities.use_api import UseAPI
 
 class Head(ARequest):
@@ -13,7 +15,11 @@ class Head(ARequest):
 
     def perform_as(self, actor: Actor) -> Response:
         """Send a HTTP HEAD request to the specified url."""
-        return UseAPI.As(actor).send_request(method=RequestMethod.HEAD, url=self.url, headers=self.headers, response_format=ResponseBodyFormat.NONE)
+        return UseAPI.As(actor).send_request(method=RequestMethod.HEAD, url=self.url, headers=self.headers, response_format=ResponseBodyFormat.NONE, retry_policy=self.retry_policy)
+
+    async def perform_as_async(self, actor: Actor) -> Response:
+        """Send a HTTP HEAD request to the specified url."""
+        return await AsyncUseAPI.As(actor).send_request(method=RequestMethod.HEAD, url=self.url, headers=self.headers, response_format=ResponseBodyFormat.NONE, retry_policy=self.retry_policy)
 
     @staticmethod
     def From(url: str) -> 'Head':
@@ -30,3 +36,11 @@ class Head(ARequest):
         """
         self.headers = headers
         return self
+
+    def with_retry_policy(self, retry_policy: RetryPolicy) -> 'Head':
+        """Set the retry policy of the HTTP HEAD request, instead of the one of the ability.
+
+        :param retry_policy: the retry policy.
+        """
+        self.retry_policy = retry_policy
+        return self
@@ -1,14 +1,18 @@
 from testla_screenplay import Actor
+from pathlib import Path
 from typing import Dict
 from .abstract_request import ARequest
-from ..types import RequestMethod, Response, ResponseBodyFormat
+from ..retry import RetryPolicy
+from ..types import RequestFile, RequestMethod, Response, ResponseBodyFormat
+from ..abilities.async_use_api import AsyncUseAPI
 from ..abilities.use_api import UseAPI
 
 class Post(ARequest):
     """Action Class. Send a HTTP POST Request."""
     response_body_format = ResponseBodyFormat.JSON
 
-    data: object
+    data: object = None
+    multipart: Dict[str, str | int | float | bool | Path] | None = None
 
     def __init__(self, url: str) -> None:
         super().__init__()
@@ -16,7 +20,11 @@ class Post(ARequest):
 
     def perform_as(self, actor: Actor) -> Response:
         """Send a HTTP POST request to the specified url."""
-        return UseAPI.As(actor).send_request(method=RequestMethod.POST, url=self.url, headers=self.headers, data=self.data, response_format=self.response_body_format)
+        return UseAPI.As(actor).send_request(method=RequestMethod.POST, url=self.url, headers=self.headers, data=self.data, response_format=self.response_body_format, multipart=self.multipart, retry_policy=self.retry_policy)
+
+    async def perform_as_async(self, actor: Actor) -> Response:
+        """Send a HTTP POST request to the specified url."""
+        return await AsyncUseAPI.As(actor).send_request(method=RequestMethod.POST, url=self.url, headers=self.headers, data=self.data, response_format=self.response_body_format, multipart=self.multipart, retry_policy=self.retry_policy)
 
     @staticmethod
     def To(url: str) -> 'Post':
@@ -34,6 +42,26 @@ class Post(ARequest):
         self.data = data
         return self
 
+    def with_file(self, path: str | Path, content_type: str | None = None) -> 'Post':
+        """Send a file as body of the HTTP POST request. Only the size of the file is determined now, its content is read when the request is sent.
+
+        :param path: the path of the file.
+        :param content_type: (optional) the content type. Defaults to the type guessed from the file name.
+        """
+        self.data = RequestFile.at(path, content_type)
+        self.multipart = None
+        return self
+
+    def with_multipart(self, fields: Dict[str, str | int | float | bool] | None = None, files: Dict[str, str | Path] | None = None) -> 'Post':
+        """Send a multipart/form-data body with the HTTP POST request. The files are read by Playwright when the request is sent.
+
+        :param fields: (optional) the form fields.
+        :param files: (optional) the paths of the files by field name.
+        """
+        self.data = None
+        self.multipart = {**(fields or {}), **{name: Path(path) for name, path in (files or {}).items()}}
+        return self
+
     def with_headers(self, headers: Dict[str, str]) -> 'Post':
         """Add headers to the HTTP POST request to send.
         
@@ -42,6 +70,14 @@ class Post(ARequest):
         self.headers = headers
         return self
 
+    def with_retry_policy(self, retry_policy: RetryPolicy) -> 'Post':
+        """Set the retry policy of the HTTP POST request, instead of the one of the ability.
+
+        :param retry_policy: the retry policy, e.g. RetryPolicy(idempotent_only=False) to retry the request although it is not idempotent.
+        """
+        self.retry_policy = retry_policy
+        return self
+
     def with_response_body_format(self, response_body_format: ResponseBodyFormat) -> 'Post':
         """Set the format the response body should be returned as.
         
@@ -0,0 +1,39 @@
+import asyncio
+from typing import List
+from testla_screenplay import Action, Actor
+from .abstract_request import ARequest
+from ..abilities.async_use_api import AsyncUseAPI
+from ..types import Response
+
+
+class Send(Action):
+    """Action Class. Send several HTTP requests at once."""
+
+    def __init__(self, requests: List[ARequest], max_concurrency: int | None = None):
+        self.requests = requests
+        self.max_concurrency = max_concurrency
+
+    def perform_as(self, actor: Actor) -> List[Response]:
+        """Send the requests one after another with the UseAPI ability of the actor."""
+        return [request.perform_as(actor) for request in self.requests]
+
+    async def perform_as_async(self, actor: Actor) -> List[Response]:
+        """Send the requests concurrently with the AsyncUseAPI ability of the actor."""
+        max_concurrency = self.max_concurrency or AsyncUseAPI.As(actor).max_concurrency
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send(request: ARequest) -> Response:
+            async with semaphore:
+                return await request.perform_as_async(actor)
+
+        # gather keeps the order of the requests
+        return list(await asyncio.gather(*[send(request) for request in self.requests]))
+
+    @staticmethod
+    def all(requests: List[ARequest], max_concurrency: int | None = None) -> 'Send':
+        """Send all given requests. With perform_as_async they are sent concurrently, the responses are returned in the order of the requests.
+
+        :param requests: the requests to send, e.g. [Get.From(...), Post.To(...)].
+        :param max_concurrency: (optional) the maximum number of requests in flight at the same time. Defaults to the max_concurrency of AsyncUseAPI.
+        """
+        return Send(requests, max_concurrency=max_concurrency)
@@ -0,0 +1,158 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic, perf_counter_ns
+from typing import Dict, Hashable
+from .types import RawResponse
+
+
+def parse_cache_control(value: str | None) -> Dict[str, str | None]:
+    """Parse a Cache-Control header into its directives, e.g. 'max-age=60, no-cache' -> {'max-age': '60', 'no-cache': None}."""
+    directives: Dict[str, str | None] = {}
+    for directive in (value or '').split(','):
+        name, _, argument = directive.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def max_age(headers: Dict[str, str]) -> float | None:
+    """Get the remaining freshness lifetime in seconds from the max-age directive and the Age header, None if the response has no max-age."""
+    value = parse_cache_control(headers.get('cache-control')).get('max-age')
+    try:
+        return max(0.0, float(value) - float(headers.get('age') or 0)) if value is not None else None
+    except ValueError:
+        # an invalid max-age makes the response stale
+        return 0.0
+
+
+class CacheEntry:
+    """A cached response together with its validators and its freshness lifetime."""
+
+    def __init__(self, response: RawResponse, stored_at: float, ttl: float | None):
+        self.response = response
+        self.stored_at = stored_at
+        self.etag = response.header('etag')
+        self.last_modified = response.header('last-modified')
+        self.size = len(response.body or b'')
+        self.lifetime = 0.0
+        self.refresh(response.headers, stored_at, ttl)
+
+    def refresh(self, headers: Dict[str, str], stored_at: float, ttl: float | None) -> None:
+        """Restart the freshness lifetime with the headers of the response or of its revalidation."""
+        self.stored_at = stored_at
+        if 'cache-control' not in headers:
+            # a 304 without Cache-Control keeps the directives of the cached response
+            headers = self.response.headers
+        if ttl is None or 'no-cache' in parse_cache_control(headers.get('cache-control')):
+            self.lifetime = 0.0
+            return
+        lifetime = max_age(headers)
+        # the ttl is an upper bound, servers may ask for a shorter one
+        self.lifetime = ttl if lifetime is None else min(ttl, lifetime)
+
+    def is_fresh(self, now: float) -> bool:
+        return now - self.stored_at < self.lifetime
+
+
+class HttpCache:
+    """Bounded LRU cache for GET responses. Responses with an ETag or Last-Modified header are revalidated with a conditional request
+    (If-None-Match / If-Modified-Since) and served from the cache if the server answers 304 Not Modified.
+    With a ttl, cached responses are served without any request until they are older than ttl, also if they have no validators.
+    The Cache-Control header of the response is honoured: max-age shortens the ttl, no-cache always revalidates,
+    and no-store as well as private responses are not cached at all, since actors may share the cache."""
+
+    def __init__(self, max_bytes: int = 50 * 1024 * 1024, ttl: float | None = None):
+        """Create an HTTP cache.
+
+        :param max_bytes: (optional) maximum total size of the cached bodies. Least recently used responses are evicted first. Defaults to 50 MiB.
+        :param ttl: (optional) maximum time in seconds a cached response is served without asking the server. Without ttl responses are always revalidated.
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.size = 0
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(url: str, headers: Dict[str, str] | None = None) -> Hashable:
+        """Get the cache key of a request. Requests with other headers (e.g. Accept or Authorization) are cached separately."""
+        return url, tuple(sorted((name.lower(), value) for name, value in (headers or {}).items()))
+
+    def fresh(self, key: Hashable) -> RawResponse | None:
+        """Get the cached response if it is still fresh, counted as hit. Its timing is the time of the lookup."""
+        if self.ttl is None:
+            return None
+        start_time = perf_counter_ns()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.is_fresh(monotonic()):
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.response.served_from_cache(lookup_ns=perf_counter_ns() - start_time)
+
+    def conditional_headers(self, key: Hashable, headers: Dict[str, str] | None) -> Dict[str, str] | None:
+        """Add the validators of the cached response to the headers of a request."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or (entry.etag is None and entry.last_modified is None):
+            return headers
+        conditional = dict(headers or {})
+        if entry.etag is not None:
+            conditional['If-None-Match'] = entry.etag
+        if entry.last_modified is not None:
+            conditional['If-Modified-Since'] = entry.last_modified
+        return conditional
+
+    def update(self, key: Hashable, response: RawResponse) -> RawResponse:
+        """Process the response of a request: serve the cached response on 304 Not Modified, store cacheable responses otherwise.
+
+        :returns: the response to return to the caller.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if response.status == 304 and entry is not None:
+                self.hits += 1
+                self.not_modified += 1
+                entry.refresh(response.headers, monotonic(), self.ttl)
+                self._entries.move_to_end(key)
+                return entry.response.served_from_cache(response)
+            self.misses += 1
+            if entry is not None:
+                self._remove(key)
+            if self._cacheable(response):
+                self._store(key, CacheEntry(response, monotonic(), self.ttl))
+            return response
+
+    def _cacheable(self, response: RawResponse) -> bool:
+        if response.status != 200 or response.body is None or len(response.body) > self.max_bytes:
+            return False
+        directives = parse_cache_control(response.header('cache-control'))
+        if 'no-store' in directives or 'private' in directives:
+            return False
+        if response.header('etag') is not None or response.header('last-modified') is not None:
+            return True
+        # without validators the response can only be served while it is fresh
+        return self.ttl is not None and 'no-cache' not in directives and max_age(response.headers) != 0
+
+    def _store(self, key: Hashable, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self.size += entry.size
+        # evict least recently used responses until the bodies fit into the budget
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable) -> None:
+        self.size -= self._entries.pop(key).size
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
@@ -0,0 +1,82 @@
+import json
+import re
+from functools import lru_cache
+from re import Pattern
+from typing import Any, Dict, Tuple
+from .utils import json_equal
+
+# a single step of a path: the name of a property or the index of an array item
+Step = str | int
+
+# value of paths that do not exist in a body
+MISSING = object()
+
+STEP_PATTERN = re.compile(r"""\.([A-Za-z_$][\w$-]*)|\[(-?\d+)\]|\[\s*'((?:[^'\\]|\\.)*)'\s*\]|\[\s*"((?:[^"\\]|\\.)*)"\s*\]""")
+
+
+@lru_cache(maxsize=1024)
+def compile_json_path(expression: str) -> Tuple[Step, ...]:
+    """Compile a JSONPath expression that selects a single value, e.g. $.items[0].id or $['content-type'].
+    Compiled paths are cached, so every expression is parsed once.
+
+    :param expression: the JSONPath expression.
+    :returns: the steps of the path.
+    """
+    if not expression.startswith('$'):
+        raise ValueError(f"Error: JSONPath '{expression}' must start with $.")
+    steps = []
+    position = 1
+    while position < len(expression):
+        match = STEP_PATTERN.match(expression, position)
+        if match is None:
+            raise ValueError(f"Error: JSONPath '{expression}' is not supported at position {position}. Only single values can be selected.")
+        name, index, single_quoted, double_quoted = match.groups()
+        if index is not None:
+            steps.append(int(index))
+        elif name is not None:
+            steps.append(name)
+        elif single_quoted is not None:
+            # only quotes and backslashes are escaped in single quoted names, e.g. $['a"b'] or $['it\'s']
+            steps.append(re.sub(r"\\(.)", r"\1", single_quoted))
+        else:
+            # double quoted names are JSON strings
+            steps.append(json.loads('"' + double_quoted + '"'))
+        position = match.end()
+    return tuple(steps)
+
+
+def resolve_json_path(body: Any, steps: Tuple[Step, ...]) -> Any:
+    """Get the value a compiled path selects in a body, without copying anything.
+
+    :returns: the value or MISSING if the path does not exist.
+    """
+    value = body
+    for step in steps:
+        if isinstance(step, int):
+            if not isinstance(value, list) or not -len(value) <= step < len(value):
+                return MISSING
+        elif not isinstance(value, dict) or step not in value:
+            return MISSING
+        value = value[step]
+    return value
+
+
+def matches_expected(value: Any, expected: Any) -> bool:
+    """Compare a value of a body with the expected value. Strings can be matched with a regular expression, true is not equal to 1."""
+    if isinstance(expected, Pattern):
+        return isinstance(value, str) and expected.search(value) is not None
+    return json_equal(value, expected)
+
+
+def first_mismatch(body: Any, expectations: Dict[str, Any]) -> Tuple[str, Any, Any] | None:
+    """Check the expected values of a body and stop at the first mismatch.
+
+    :param body: the decoded JSON body.
+    :param expectations: the expected values by JSONPath expression, e.g. {'$.items[0].id': 42}.
+    :returns: the path, the actual value (MISSING if the path does not exist) and the expected value of the first mismatch, None if all match.
+    """
+    for expression, expected in expectations.items():
+        value = resolve_json_path(body, compile_json_path(expression))
+        if value is MISSING or not matches_expected(value, expected):
+            return expression, value, expected
+    return None
@@ -0,0 +1,89 @@
+from testla_screenplay import Actor, Question
+from typing import Iterable, List, Literal
+from ...shared.histogram import LatencySamples
+from ..abilities.async_use_api import AsyncUseAPI
+from ..abilities.use_api import UseAPI
+from ..actions.abstract_request import ARequest
+from ..types import Response as ResponseType
+
+
+def latency_samples(responses: Iterable[ResponseType]) -> LatencySamples:
+    """Collect the durations of the responses that were actually sent."""
+    return LatencySamples(response.duration for response in responses if response.timing is None or not response.timing.cached)
+
+
+class Latency(Question):
+    """Question Class. Verify the latency of many API Responses, e.g. their p95, instead of the duration of a single one.
+    The responses are either given or collected by sending a request a number of times, one after another.
+    Responses served from the HttpCache without a request are left out, they would only measure the cache lookup."""
+
+    def __init__(self, check_mode: Literal['has', 'has_not'], statistic: Literal['percentile', 'mean', 'max'], duration: float,
+                 responses: List[ResponseType] | ARequest, times: int = 1, percentile: float | None = None):
+        super().__init__()
+        self.check_mode = check_mode
+        self.statistic = statistic
+        self.duration = duration
+        self.responses = responses
+        self.times = times
+        self.percentile = percentile
+
+    def answered_by(self, actor: Actor) -> bool:
+        if isinstance(self.responses, ARequest):
+            samples = latency_samples(self.responses.perform_as(actor) for _ in range(self.times))
+        else:
+            samples = latency_samples(self.responses)
+        return self._answer(UseAPI.As(actor), samples)
+
+    async def answered_by_async(self, actor: Actor) -> bool:
+        if isinstance(self.responses, ARequest):
+            # sequentially, concurrent requests would measure the load instead of the latency
+            samples = latency_samples([await self.responses.perform_as_async(actor) for _ in range(self.times)])
+        else:
+            samples = latency_samples(self.responses)
+        return self._answer(AsyncUseAPI.As(actor), samples)
+
+    def _answer(self, ability: UseAPI, samples: LatencySamples) -> bool:
+        mode = 'less_or_equal' if self.check_mode == 'has' else 'greater'
+        return ability.check_latency(samples=samples, statistic=self.statistic, duration=self.duration, mode=mode, percentile=self.percentile)
+
+    @staticmethod
+    def has_percentile_within(responses: List[ResponseType] | ARequest, percentile: float, duration: float, times: int = 1) -> 'Latency':
+        """Verify if the given percentile of the response durations is within a given duration, e.g. p95 under 200 ms.
+
+        :param responses: the responses to check, or a request to send times times.
+        :param percentile: the percentile between 0 and 100, e.g. 95.
+        :param duration: expected duration (in milliseconds) not to be exceeded.
+        :param times: (optional) how often to send the request. Ignored for responses.
+        """
+        return Latency(check_mode='has', statistic='percentile', duration=duration, responses=responses, times=times, percentile=percentile)
+
+    @staticmethod
+    def has_not_percentile_within(responses: List[ResponseType] | ARequest, percentile: float, duration: float, times: int = 1) -> 'Latency':
+        """Verify if the given percentile of the response durations exceeds a given duration.
+
+        :param responses: the responses to check, or a request to send times times.
+        :param percentile: the percentile between 0 and 100, e.g. 95.
+        :param duration: expected duration (in milliseconds) to be exceeded.
+        :param times: (optional) how often to send the request. Ignored for responses.
+        """
+        return Latency(check_mode='has_not', statistic='percentile', duration=duration, responses=responses, times=times, percentile=percentile)
+
+    @staticmethod
+    def has_mean_within(responses: List[ResponseType] | ARequest, duration: float, times: int = 1) -> 'Latency':
+        """Verify if the mean of the response durations is within a given duration.
+
+        :param responses: the responses to check, or a request to send times times.
+        :param duration: expected duration (in milliseconds) not to be exceeded.
+        :param times: (optional) how often to send the request. Ignored for responses.
+        """
+        return Latency(check_mode='has', statistic='mean', duration=duration, responses=responses, times=times)
+
+    @staticmethod
+    def has_max_within(responses: List[ResponseType] | ARequest, duration: float, times: int = 1) -> 'Latency':
+        """Verify if all response durations are within a given duration.
+
+        :param responses: the responses to check, or a request to send times times.
+        :param duration: expected duration (in milliseconds) not to be exceeded.
+        :param times: (optional) how often to send the request. Ignored for responses.
+        """
+        return Latency(check_mode='has', statistic='max', duration=duration, responses=responses, times=times)
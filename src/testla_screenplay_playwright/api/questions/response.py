@@ -1,12 +1,14 @@
 from testla_screenplay import Actor, Question
-from typing import Dict, Literal
+from typing import Any, Dict, Literal
+from ..schema import CompiledSchema
 from ..types import Response as ResponseType
+from ..abilities.async_use_api import AsyncUseAPI
 from ..abilities.use_api import UseAPI
 
 class Response(Question):
     """Question Class. Verify certain aspects of an API Response."""
 
-    def __init__(self, check_mode: Literal['has', 'has_not'], mode:  Literal['status', 'body', 'header', 'duration'],
+    def __init__(self, check_mode: Literal['has', 'has_not'], mode:  Literal['status', 'body', 'body_matching', 'schema', 'header', 'duration'],
                  response: ResponseType, payload: int | Dict | str | None | Dict[str, str] | float):
         super().__init__()
         self.check_mode = check_mode
@@ -15,27 +17,44 @@ class Response(Question):
         self.payload = payload
 
     def answered_by(self, actor: Actor) -> bool:
+        return self._answer(UseAPI.As(actor))
+
+    async def answered_by_async(self, actor: Actor) -> bool:
+        # the checks do not send requests, so there is nothing to await
+        return self._answer(AsyncUseAPI.As(actor))
+
+    def _answer(self, ability: UseAPI) -> bool:
         match self.mode:
             case 'status':
                 if self.check_mode == 'has':
-                    return UseAPI.As(actor).check_status(response=self.response, status=self.payload, mode='equal')
+                    return ability.check_status(response=self.response, status=self.payload, mode='equal')
                 else:
-                    return UseAPI.As(actor).check_status(response=self.response, status=self.payload, mode='unequal')
+                    return ability.check_status(response=self.response, status=self.payload, mode='unequal')
             case 'body':
                 if self.check_mode == 'has':
-                    return UseAPI.As(actor).check_body(response=self.response, body=self.payload, mode='equal')
+                    return ability.check_body(response=self.response, body=self.payload, mode='equal')
+                else:
+                    return ability.check_body(response=self.response, body=self.payload, mode='unequal')
+            case 'body_matching':
+                if self.check_mode == 'has':
+                    return ability.check_body_matching(response=self.response, expectations=self.payload, mode='matches')
                 else:
-                    return UseAPI.As(actor).check_body(response=self.response, body=self.payload, mode='unequal')
+                    return ability.check_body_matching(response=self.response, expectations=self.payload, mode='does_not_match')
+            case 'schema':
+                if self.check_mode == 'has':
+                    return ability.check_schema(response=self.response, schema=self.payload, mode='matches')
+                else:
+                    return ability.check_schema(response=self.response, schema=self.payload, mode='does_not_match')
             case 'header':
                 if self.check_mode == 'has':
-                    return UseAPI.As(actor).check_headers(response=self.response, headers=self.payload, mode='included')
+                    return ability.check_headers(response=self.response, headers=self.payload, mode='included')
                 else:
-                    return UseAPI.As(actor).check_headers(response=self.response, headers=self.payload, mode='excluded')
+                    return ability.check_headers(response=self.response, headers=self.payload, mode='excluded')
             case 'duration':
                 if self.check_mode == 'has':
-                    return UseAPI.As(actor).check_duration(response=self.response, duration=self.payload, mode='less_or_equal')
+                    return ability.check_duration(response=self.response, duration=self.payload, mode='less_or_equal')
                 else:
-                    return UseAPI.As(actor).check_duration(response=self.response, duration=self.payload, mode='greater')
+                    return ability.check_duration(response=self.response, duration=self.payload, mode='greater')
             # default case
             case _:
                 raise RuntimeError('Unknown mode for Response.answeredBy')
@@ -76,6 +95,44 @@ class Response(Question):
         """
         return Response(check_mode='has_not', mode='body', response=response, payload=body)
 
+    @staticmethod
+    def has_body_matching(response: ResponseType, expectations: Dict[str, Any]) -> 'Response':
+        """Verify if the given response's body has the expected values at the given JSONPath expressions.
+        Only these values are compared instead of the whole body.
+
+        :param response: the response to check.
+        :param expectations: the expected values by JSONPath expression, e.g. {'$.items[0].id': 42, '$.name': re.compile('^A')}.
+        """
+        return Response(check_mode='has', mode='body_matching', response=response, payload=expectations)
+
+    @staticmethod
+    def has_not_body_matching(response: ResponseType, expectations: Dict[str, Any]) -> 'Response':
+        """Verify if at least one value at the given JSONPath expressions of the given response's body is not as expected.
+
+        :param response: the response to check.
+        :param expectations: the not expected values by JSONPath expression, e.g. {'$.items[0].id': 42}.
+        """
+        return Response(check_mode='has_not', mode='body_matching', response=response, payload=expectations)
+
+    @staticmethod
+    def matches_schema(response: ResponseType, schema: Dict | CompiledSchema) -> 'Response':
+        """Verify if the given response's body matches a JSON schema. The schema is compiled once and reused for all responses.
+        Needs the optional jsonschema package. A schema must not be changed after it was used, change a copy instead.
+
+        :param response: the response to check.
+        :param schema: the JSON schema, or a CompiledSchema to skip the cache lookup.
+        """
+        return Response(check_mode='has', mode='schema', response=response, payload=schema)
+
+    @staticmethod
+    def does_not_match_schema(response: ResponseType, schema: Dict | CompiledSchema) -> 'Response':
+        """Verify if the given response's body does not match a JSON schema.
+
+        :param response: the response to check.
+        :param schema: the JSON schema or a CompiledSchema.
+        """
+        return Response(check_mode='has_not', mode='schema', response=response, payload=schema)
+
     @staticmethod
     def has_headers(response: ResponseType, headers: Dict[str, str]) -> 'Response':
         """Verify if the given headers are included in the given response.
@@ -99,15 +156,15 @@ class Response(Question):
         """Verify if the response (including receiving body) was received within a given duration.
         
         :param response: the response to check.
-        :param duration: expected duration (in seconds) not to be exceeded
+        :param duration: expected duration (in milliseconds) not to be exceeded
         """
-        return Response(check_mode='has', mode='header', response=response, payload=duration)
+        return Response(check_mode='has', mode='duration', response=response, payload=duration)
 
     @staticmethod
     def has_not_been_received_within(response: ResponseType, duration: float) -> 'Response':
         """Verify if the response (including receiving body) was not received within a given duration.
         
         :param response: the response to check.
-        :param duration: expected duration (in seconds) to be exceeded
+        :param duration: expected duration (in milliseconds) to be exceeded
         """
-        return Response(check_mode='has_not', mode='header', response=response, payload=duration)
+        return Response(check_mode='has_not', mode='duration', response=response, payload=duration)
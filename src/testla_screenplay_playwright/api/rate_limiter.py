@@ -0,0 +1,94 @@
+import asyncio
+from threading import Lock
+from time import monotonic, sleep
+from typing import Dict
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Token bucket that refills at a constant rate up to its burst size. Tokens are reserved in advance, so the bucket can go into debt:
+    every caller knows right away how long to wait and callers are served in the order they asked."""
+
+    def __init__(self, rate: float, burst: int, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """Take a token.
+
+        :returns: the time in seconds until the token is available.
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+class RateLimiter:
+    """Client-side rate limit for requests, shared safely by all threads (and event loops) whose abilities use it.
+    Requests are spread evenly at the given rate instead of being sent in bursts that the server answers with 429 Too Many Requests."""
+
+    def __init__(self, requests_per_second: float, burst: int = 1, per_host: bool = True):
+        """Create a rate limiter.
+
+        :param requests_per_second: the sustained number of requests per second.
+        :param burst: (optional) the number of requests that may be sent at once after a pause. Defaults to 1.
+        :param per_host: (optional) limit every host separately. Defaults to True. Relative URLs count as one host.
+        """
+        if requests_per_second <= 0 or burst < 1:
+            raise ValueError('Error: requests_per_second must be positive and burst at least 1.')
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.per_host = per_host
+        self.requests = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = Lock()
+
+    def reserve(self, url: str) -> float:
+        """Reserve a slot for a request to the given URL without waiting for it.
+
+        :returns: the time in seconds to wait before the request may be sent.
+        """
+        host = urlsplit(url).netloc if self.per_host else ''
+        with self._lock:
+            now = monotonic()
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.requests_per_second, self.burst, now)
+            wait = bucket.reserve(now)
+            self.requests += 1
+            if wait > 0:
+                self.delayed += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+            return wait
+
+    def acquire(self, url: str) -> float:
+        """Wait for a slot for a request to the given URL.
+
+        :returns: the time in seconds the request waited.
+        """
+        wait = self.reserve(url)
+        if wait > 0:
+            sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str) -> float:
+        """Wait for a slot for a request to the given URL without blocking the event loop.
+
+        :returns: the time in seconds the request waited.
+        """
+        wait = self.reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    @property
+    def average_wait(self) -> float:
+        """Average time in seconds a request waited for a slot."""
+        return self.total_wait / self.requests if self.requests > 0 else 0.0
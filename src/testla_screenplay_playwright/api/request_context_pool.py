@@ -0,0 +1,175 @@
+import asyncio
+from collections import OrderedDict
+from threading import Lock
+from time import perf_counter
+from typing import Dict, List
+from playwright.sync_api import APIRequestContext, Playwright
+from playwright.async_api import APIRequestContext as AsyncAPIRequestContext, Playwright as AsyncPlaywright
+
+
+class RequestContextPoolStats:
+    """Statistics of an APIRequestContext pool."""
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.reuses = 0
+        self.created = 0
+        self.disposed = 0
+        self.total_acquire_time = 0.0
+        self.max_acquire_time = 0.0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of acquisitions that were served by an existing context and could reuse its keep-alive connections."""
+        return self.reuses / self.acquisitions if self.acquisitions > 0 else 0.0
+
+    @property
+    def average_acquire_time(self) -> float:
+        """Average time in seconds it took to acquire a context, including creating it."""
+        return self.total_acquire_time / self.acquisitions if self.acquisitions > 0 else 0.0
+
+    def record_acquisition(self, duration: float, reused: bool) -> None:
+        """Count an acquisition."""
+        self.acquisitions += 1
+        self.reuses += 1 if reused else 0
+        self.total_acquire_time += duration
+        self.max_acquire_time = max(self.max_acquire_time, duration)
+
+
+class PooledRequestContext:
+    """An APIRequestContext of the pool together with the number of its current users."""
+
+    def __init__(self, context: APIRequestContext | AsyncAPIRequestContext):
+        self.context = context
+        self.users = 0
+
+
+class APIRequestContextPool:
+    """Pool of APIRequestContexts shared by many actors. There is one context per base URL, so the actors reuse its keep-alive connections
+    instead of opening new TCP and TLS connections. Unused contexts are disposed least recently used first once the pool is full.
+    Sync Playwright objects are bound to the thread that created them, so nobody could release a context while acquire() waits:
+    acquire() fails right away if the pool is full and all contexts are in use."""
+
+    def __init__(self, playwright: Playwright, max_contexts: int = 8, context_options: Dict | None = None):
+        """Create a pool of APIRequestContexts.
+
+        :param playwright: the Playwright instance to create the contexts with.
+        :param max_contexts: (optional) maximum number of contexts. Defaults to 8.
+        :param context_options: (optional) options for playwright.request.new_context(), e.g. extra_http_headers.
+        """
+        self.playwright = playwright
+        self.max_contexts = max_contexts
+        self.context_options = context_options or {}
+        self.stats = RequestContextPoolStats()
+        self._contexts: OrderedDict[str | None, PooledRequestContext] = OrderedDict()
+        self._lock = Lock()
+
+    def _unused(self) -> List[str | None]:
+        """Get the base URLs of the contexts nobody uses, least recently used first."""
+        return [base_url for base_url, pooled in self._contexts.items() if pooled.users == 0]
+
+    def acquire(self, base_url: str | None = None) -> APIRequestContext:
+        """Get the shared context for the given base URL. Call release() once it is no longer used.
+
+        :param base_url: (optional) the base URL of the context.
+        :raises RuntimeError: if the pool is full and all contexts are in use.
+        """
+        start_time = perf_counter()
+        with self._lock:
+            if base_url not in self._contexts and len(self._contexts) >= self.max_contexts and len(self._unused()) == 0:
+                raise RuntimeError(f"Error: all {self.max_contexts} APIRequestContexts of the pool are in use. Release one or increase max_contexts.")
+            pooled = self._contexts.get(base_url)
+            reused = pooled is not None
+            if pooled is None:
+                if len(self._contexts) >= self.max_contexts:
+                    self._contexts.pop(self._unused()[0]).context.dispose()
+                    self.stats.disposed += 1
+                pooled = PooledRequestContext(self.playwright.request.new_context(base_url=base_url, **self.context_options))
+                self._contexts[base_url] = pooled
+                self.stats.created += 1
+            pooled.users += 1
+            self._contexts.move_to_end(base_url)
+            self.stats.record_acquisition(perf_counter() - start_time, reused)
+            return pooled.context
+
+    def release(self, context: APIRequestContext) -> None:
+        """Give back a context. It stays open for the next actor."""
+        with self._lock:
+            for pooled in self._contexts.values():
+                if pooled.context == context:
+                    pooled.users -= 1
+                    break
+
+    def dispose(self) -> None:
+        """Dispose all contexts of the pool."""
+        with self._lock:
+            contexts, self._contexts = self._contexts, OrderedDict()
+        for pooled in contexts.values():
+            pooled.context.dispose()
+            self.stats.disposed += 1
+
+
+class AsyncAPIRequestContextPool:
+    """Pool of APIRequestContexts for the asyncio based Playwright API. See APIRequestContextPool."""
+
+    def __init__(self, playwright: AsyncPlaywright, max_contexts: int = 8, context_options: Dict | None = None):
+        """Create a pool of APIRequestContexts.
+
+        :param playwright: the Playwright instance to create the contexts with.
+        :param max_contexts: (optional) maximum number of contexts. Defaults to 8.
+        :param context_options: (optional) options for playwright.request.new_context(), e.g. extra_http_headers.
+        """
+        self.playwright = playwright
+        self.max_contexts = max_contexts
+        self.context_options = context_options or {}
+        self.stats = RequestContextPoolStats()
+        self._contexts: OrderedDict[str | None, PooledRequestContext] = OrderedDict()
+        self._condition = asyncio.Condition()
+
+    def _unused(self) -> List[str | None]:
+        """Get the base URLs of the contexts nobody uses, least recently used first."""
+        return [base_url for base_url, pooled in self._contexts.items() if pooled.users == 0]
+
+    async def acquire(self, base_url: str | None = None, timeout: float | None = None) -> AsyncAPIRequestContext:
+        """Get the shared context for the given base URL. Call release() once it is no longer used.
+
+        :param base_url: (optional) the base URL of the context.
+        :param timeout: (optional) maximum time in seconds to wait until a context can be created if the pool is full and all contexts are in use.
+        """
+        start_time = perf_counter()
+        async with self._condition:
+            try:
+                await asyncio.wait_for(self._condition.wait_for(
+                    lambda: base_url in self._contexts or len(self._contexts) < self.max_contexts or len(self._unused()) > 0), timeout=timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Error: no APIRequestContext available within {timeout}s.")
+            pooled = self._contexts.get(base_url)
+            reused = pooled is not None
+            if pooled is None:
+                if len(self._contexts) >= self.max_contexts:
+                    await self._contexts.pop(self._unused()[0]).context.dispose()
+                    self.stats.disposed += 1
+                pooled = PooledRequestContext(await self.playwright.request.new_context(base_url=base_url, **self.context_options))
+                self._contexts[base_url] = pooled
+                self.stats.created += 1
+            pooled.users += 1
+            self._contexts.move_to_end(base_url)
+            self.stats.record_acquisition(perf_counter() - start_time, reused)
+            return pooled.context
+
+    async def release(self, context: AsyncAPIRequestContext) -> None:
+        """Give back a context. It stays open for the next actor."""
+        async with self._condition:
+            for pooled in self._contexts.values():
+                if pooled.context == context:
+                    pooled.users -= 1
+                    break
+            self._condition.notify_all()
+
+    async def dispose(self) -> None:
+        """Dispose all contexts of the pool."""
+        async with self._condition:
+            contexts, self._contexts = self._contexts, OrderedDict()
+        for pooled in contexts.values():
+            await pooled.context.dispose()
+            self.stats.disposed += 1
@@ -0,0 +1,99 @@
+import random
+from dataclasses import replace
+from time import monotonic
+from typing import Iterable, Tuple, Type
+from playwright.sync_api import Error as PlaywrightError
+from .types import RawResponse, RequestMethod
+
+# methods that can be sent again without changing the outcome (RFC 9110). POST and PATCH are only retried if the policy allows it
+IDEMPOTENT_METHODS = (RequestMethod.GET, RequestMethod.HEAD, RequestMethod.PUT, RequestMethod.DELETE)
+
+# statuses of responses that are likely to succeed when sent again
+TRANSIENT_STATUSES = (408, 429, 500, 502, 503, 504)
+
+
+class RetryPolicy:
+    """Decides if and when a failed request is sent again. The backoff grows exponentially with jitter, so many actors that failed at
+    the same time do not retry at the same time. A Retry-After header of the response is respected up to max_backoff."""
+
+    def __init__(self, max_attempts: int = 3, statuses: Iterable[int] = TRANSIENT_STATUSES, exceptions: Tuple[Type[BaseException], ...] = (PlaywrightError,),
+                 backoff: float = 0.1, max_backoff: float = 10.0, jitter: bool = True, budget: float | None = None, idempotent_only: bool = True):
+        """Create a retry policy.
+
+        :param max_attempts: (optional) the maximum number of attempts including the first one. Defaults to 3.
+        :param statuses: (optional) the response statuses to retry. Defaults to 408, 429, 500, 502, 503 and 504.
+        :param exceptions: (optional) the errors to retry. Defaults to errors of Playwright, e.g. connection errors and timeouts.
+        :param backoff: (optional) the backoff in seconds after the first attempt. It doubles with every attempt. Defaults to 0.1.
+        :param max_backoff: (optional) the maximum backoff in seconds. Defaults to 10.
+        :param jitter: (optional) wait a random time between half and the full backoff. Defaults to True.
+        :param budget: (optional) the maximum time in seconds of all attempts and backoffs. No retry is started that would exceed it.
+        :param idempotent_only: (optional) only retry idempotent methods (GET, HEAD, PUT and DELETE). Defaults to True.
+        """
+        self.max_attempts = max_attempts
+        self.statuses = frozenset(statuses)
+        self.exceptions = exceptions
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.budget = budget
+        self.idempotent_only = idempotent_only
+
+    def retries(self, method: RequestMethod) -> bool:
+        """Check if requests with the given method are retried at all."""
+        return self.max_attempts > 1 and (not self.idempotent_only or method in IDEMPOTENT_METHODS)
+
+    def next_backoff(self, attempt: int, elapsed: float, response: RawResponse | None = None, error: BaseException | None = None) -> float | None:
+        """Decide if a request is sent again after an attempt failed with the given response or error.
+
+        :param attempt: the number of the attempt that failed, starting at 1.
+        :param elapsed: the time in seconds since the first attempt was started.
+        :returns: the time in seconds to wait before the next attempt, None if the request is not retried.
+        """
+        if response is not None and response.status not in self.statuses:
+            return None
+        if error is not None and not isinstance(error, self.exceptions):
+            return None
+        if attempt >= self.max_attempts:
+            return None
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff))
+        if self.budget is not None and elapsed + delay > self.budget:
+            return None
+        return delay
+
+    @staticmethod
+    def _retry_after(response: RawResponse | None) -> float | None:
+        """Get the delay of a Retry-After header in seconds. HTTP dates are not supported and ignored."""
+        value = response.header('retry-after') if response is not None else None
+        try:
+            return max(0.0, float(value)) if value is not None else None
+        except ValueError:
+            return None
+
+
+class RetryAttempts:
+    """Bookkeeping of the attempts of a single request under a retry policy. UseAPI and AsyncUseAPI share it and only differ in how they wait."""
+
+    def __init__(self, retry_policy: RetryPolicy):
+        self.retry_policy = retry_policy
+        self.attempt = 1
+        self.backoff_ns = 0
+        self._start_time = monotonic()
+
+    def next_backoff(self, response: RawResponse | None = None, error: BaseException | None = None) -> float | None:
+        """Decide if the request is sent again after the current attempt failed, see RetryPolicy.next_backoff()."""
+        return self.retry_policy.next_backoff(self.attempt, monotonic() - self._start_time, response=response, error=error)
+
+    def backed_off(self, backoff: float) -> None:
+        """Count the time waited before the next attempt."""
+        self.backoff_ns += int(backoff * 1_000_000_000)
+        self.attempt += 1
+
+    def result(self, response: RawResponse) -> RawResponse:
+        """Get the final response with the number of attempts and the time waited between them."""
+        # the response may be shared with other callers, so it is not changed
+        return replace(response, attempts=self.attempt, backoff_ns=self.backoff_ns)
@@ -0,0 +1,121 @@
+import json
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, List, Tuple
+
+
+@dataclass
+class SchemaError:
+    """A violation of a JSON schema."""
+    # JSON path of the failing value, e.g. $.items[0].id
+    path: str
+    message: str
+
+
+def child_path(path: str, key: str | int) -> str:
+    """Get the JSON path of a property or an array item."""
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    return f"{path}.{key}" if re.fullmatch(r'[A-Za-z_][A-Za-z0-9_]*', key) else f"{path}[{json.dumps(key)}]"
+
+
+class CompiledSchema:
+    """A JSON schema compiled with the optional jsonschema package. Callers that validate many responses against the same schema
+    can keep it and pass it instead of the schema, which skips the cache lookup."""
+
+    def __init__(self, schema: Dict):
+        """Compile a schema.
+
+        :param schema: the JSON schema. Its draft is taken from $schema and defaults to the latest one.
+        :raises RuntimeError: if the jsonschema package is not installed.
+        """
+        try:
+            from jsonschema.validators import validator_for
+        except ImportError:
+            raise RuntimeError("Error: JSON schema validation needs the optional jsonschema package, install it with 'pip install jsonschema'.")
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        self.schema = schema
+        self._validator = validator_class(schema)
+
+    def errors(self, instance: Any, limit: int | None = None) -> List[SchemaError]:
+        """Validate an instance against the schema.
+
+        :param instance: the decoded JSON value to validate.
+        :param limit: (optional) stop after this number of errors.
+        :returns: the violations of the schema, empty if the instance is valid.
+        """
+        errors: List[SchemaError] = []
+        for error in self._validator.iter_errors(instance):
+            path = '$'
+            for part in error.absolute_path:
+                path = child_path(path, part)
+            errors.append(SchemaError(path, error.message))
+            if limit is not None and len(errors) >= limit:
+                break
+        return errors
+
+
+class SchemaValidatorCache:
+    """Cache of compiled JSON schemas. Every schema is compiled once and then reused for all responses.
+    Schemas are found by identity first, so a schema must not be changed after it was used: change a copy instead.
+    Equal schemas that are different objects share the compiled schema as well."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # the schema is kept next to its compiled schema, so its id is not reused while it is cached
+        self._by_id: OrderedDict[int, Tuple[Dict, CompiledSchema]] = OrderedDict()
+        # the canonical serialization is only built if the schema object is not known yet
+        self._by_content: OrderedDict[str, CompiledSchema] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._by_content)
+
+    def _put(self, entries: OrderedDict, key: Any, entry: Any) -> None:
+        entries[key] = entry
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+    def validator(self, schema: Dict | CompiledSchema) -> CompiledSchema:
+        """Get the compiled schema.
+
+        :param schema: the JSON schema or an already compiled one.
+        """
+        if isinstance(schema, CompiledSchema):
+            return schema
+        with self._lock:
+            cached = self._by_id.get(id(schema))
+            if cached is not None and cached[0] is schema:
+                self.hits += 1
+                self._by_id.move_to_end(id(schema))
+                return cached[1]
+            key = json.dumps(schema, sort_keys=True)
+            compiled = self._by_content.get(key)
+            if compiled is not None:
+                self.hits += 1
+                self._by_content.move_to_end(key)
+            else:
+                self.misses += 1
+                compiled = CompiledSchema(schema)
+                self._put(self._by_content, key, compiled)
+            self._put(self._by_id, id(schema), (schema, compiled))
+            return compiled
+
+    def errors(self, schema: Dict | CompiledSchema, instance: Any, limit: int | None = None) -> List[SchemaError]:
+        """Validate an instance against a schema.
+
+        :param schema: the JSON schema or an already compiled one.
+        :param instance: the decoded JSON value to validate.
+        :param limit: (optional) stop after this number of errors.
+        :returns: the violations of the schema, empty if the instance is valid.
+        """
+        return self.validator(schema).errors(instance, limit=limit)
+
+
+# shared by all actors, so every schema is compiled once per test run
+SCHEMA_VALIDATORS = SchemaValidatorCache()
@@ -0,0 +1,53 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable
+from .types import RawResponse, RequestMethod
+
+# methods whose identical requests can share one response
+COALESCED_METHODS = (RequestMethod.GET, RequestMethod.HEAD)
+
+
+def flight_key(method: RequestMethod, url: str, headers: Dict[str, str] | None, read_body: bool) -> Hashable:
+    """Get the key of a request. Header names are compared case-insensitively and in any order."""
+    return method, url, read_body, tuple(sorted((name.lower(), value) for name, value in (headers or {}).items()))
+
+
+class AsyncSingleFlight:
+    """Shares one in-flight request between identical requests sent at the same time from several coroutines of one event loop.
+    The first caller (the leader) sends the request, the others (followers) wait for its response and get their own copy of it."""
+
+    def __init__(self):
+        self.leaders = 0
+        self.followers = 0
+        # the future of a flight is resolved with None if its leader was cancelled
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, send: Callable[[], Awaitable[RawResponse]]) -> RawResponse:
+        """Send a request, unless an identical request is in flight already.
+
+        :param key: the key of the request, see flight_key().
+        :param send: sends the request.
+        :returns: the response. Followers get a copy; errors of the leader are raised to all callers.
+        """
+        while (flight := self._flights.get(key)) is not None:
+            # a cancelled follower must not cancel the request of the others
+            response: RawResponse | None = await asyncio.shield(flight)
+            if response is not None:
+                self.followers += 1
+                return response.copy()
+            # the leader was cancelled: the first follower to get here sends the request instead
+        flight = self._flights[key] = asyncio.get_running_loop().create_future()
+        self.leaders += 1
+        try:
+            response = await send()
+            flight.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            flight.set_result(None)
+            raise
+        except BaseException as error:
+            flight.set_exception(error)
+            # the leader raises the error itself, so it must not be logged as never retrieved
+            flight.exception()
+            raise
+        finally:
+            del self._flights[key]
@@ -0,0 +1,114 @@
+import asyncio
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict
+
+
+@dataclass
+class Token:
+    """An access token and its lifetime."""
+    value: str
+    # lifetime in seconds from the time the token was fetched. None if the token does not expire
+    expires_in: float | None = None
+
+    @staticmethod
+    def from_oauth(body: Dict[str, Any]) -> 'Token':
+        """Get the token of an OAuth 2.0 token response, e.g. {'access_token': '...', 'expires_in': 3600}."""
+        return Token(body['access_token'], body.get('expires_in'))
+
+
+class _CachedToken:
+    """Shared state of TokenProvider and AsyncTokenProvider."""
+
+    def __init__(self, refresh_margin: float, header: str, scheme: str | None):
+        self.refresh_margin = refresh_margin
+        self.header = header
+        self.scheme = scheme
+        self.fetches = 0
+        self._value: str | None = None
+        # the time at which the token is refreshed
+        self._refresh_at: float | None = None
+
+    def _current(self) -> str | None:
+        """Get the cached token, None if there is none or it expires within the refresh margin."""
+        value, refresh_at = self._value, self._refresh_at
+        if value is None or (refresh_at is not None and monotonic() >= refresh_at):
+            return None
+        return value
+
+    def _store(self, token: Token) -> str:
+        self.fetches += 1
+        # the refresh time is set first, so a thread without lock never sees the new token with the old refresh time.
+        # tokens that live shorter than twice the margin are used for at least half of their lifetime
+        self._refresh_at = None if token.expires_in is None else monotonic() + token.expires_in - min(self.refresh_margin, token.expires_in / 2)
+        self._value = token.value
+        return token.value
+
+    def invalidate(self, value: str | None = None) -> None:
+        """Fetch a new token for the next request, e.g. after a 401 Unauthorized.
+
+        :param value: (optional) only invalidate this token, so a token that was refreshed in the meantime is kept.
+        """
+        if value is None or value == self._value:
+            self._value = None
+
+    def with_token(self, headers: Dict[str, str] | None, value: str) -> Dict[str, str] | None:
+        """Add a token to the headers of a request, unless they contain the header already."""
+        if any(name.lower() == self.header.lower() for name in headers or {}):
+            # the request sets the header itself
+            return headers
+        return {**(headers or {}), self.header: f"{self.scheme} {value}" if self.scheme else value}
+
+
+class TokenProvider(_CachedToken):
+    """Fetches an access token once for all actors (and threads) whose abilities use it, caches it and refreshes it shortly before it expires.
+    Only one caller fetches a new token, the others wait for it."""
+
+    def __init__(self, fetch: Callable[[], Token], refresh_margin: float = 30.0, header: str = 'Authorization', scheme: str | None = 'Bearer'):
+        """Create a token provider.
+
+        :param fetch: fetches a new token, e.g. with a request to the token endpoint.
+        :param refresh_margin: (optional) time in seconds before the expiry at which the token is refreshed, at most half of its lifetime. Defaults to 30.
+        :param header: (optional) the header the token is sent in. Defaults to Authorization.
+        :param scheme: (optional) the scheme in front of the token, e.g. Bearer. None to send the token only.
+        """
+        super().__init__(refresh_margin, header, scheme)
+        self.fetch = fetch
+        self._lock = Lock()
+
+    def token(self) -> str:
+        """Get the cached token, or fetch a new one if it expires soon."""
+        value = self._current()
+        if value is not None:
+            return value
+        with self._lock:
+            # another thread may have fetched the token while this one waited
+            value = self._current()
+            return value if value is not None else self._store(self.fetch())
+
+
+class AsyncTokenProvider(_CachedToken):
+    """Token provider of AsyncUseAPI, for the coroutines of one event loop. See TokenProvider."""
+
+    def __init__(self, fetch: Callable[[], Awaitable[Token]], refresh_margin: float = 30.0, header: str = 'Authorization', scheme: str | None = 'Bearer'):
+        """Create a token provider.
+
+        :param fetch: coroutine function that fetches a new token.
+        :param refresh_margin: (optional) see TokenProvider.
+        :param header: (optional) see TokenProvider.
+        :param scheme: (optional) see TokenProvider.
+        """
+        super().__init__(refresh_margin, header, scheme)
+        self.fetch = fetch
+        self._lock = asyncio.Lock()
+
+    async def token(self) -> str:
+        """Get the cached token, or fetch a new one if it expires soon."""
+        value = self._current()
+        if value is not None:
+            return value
+        async with self._lock:
+            # another coroutine may have fetched the token while this one waited
+            value = self._current()
+            return value if value is not None else self._store(await self.fetch())
@@ -1,6 +1,10 @@
-from dataclasses import dataclass
+import mimetypes
+import os
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Callable, Dict
 
 
 class RequestMethod(Enum):
@@ -16,13 +20,135 @@ class ResponseBodyFormat(Enum):
     """Type of the body of the response."""
     JSON = 'json',
     TEXT = 'text',
-    # BUFFER = 'buffer',
+    BUFFER = 'buffer',
+    FILE = 'file',
     NONE = 'none'
 
+@dataclass
+class ResponseFile:
+    """Body of a response that was written to a file (ResponseBodyFormat.FILE)."""
+    path: Path
+    size: int
+
+@dataclass
+class RequestFile:
+    """A file sent as body of a request (with_file()). Its size is known up front, the content is only read when the request is sent."""
+    path: Path
+    size: int
+    content_type: str
+
+    @staticmethod
+    def at(path: str | Path, content_type: str | None = None) -> 'RequestFile':
+        """Describe a file to upload.
+
+        :param path: the path of the file.
+        :param content_type: (optional) the content type. Defaults to the type guessed from the file name, application/octet-stream otherwise.
+        """
+        path = Path(path)
+        return RequestFile(path, os.path.getsize(path), content_type or mimetypes.guess_type(path.name)[0] or 'application/octet-stream')
+
+    def read(self) -> bytes:
+        """Read the content of the file. Playwright needs the whole body as bytes."""
+        return self.path.read_bytes()
+
+@dataclass
+class RawResponse:
+    """A response as received, before its body is processed according to the ResponseBodyFormat."""
+    status: int
+    headers: Dict[str, str]
+    body: bytes | None
+    # see ResponseTiming
+    headers_ns: int = 0
+    body_ns: int = 0
+    # size of the request body that was sent
+    upload_bytes: int = 0
+    # time the request waited for the rate limiter
+    rate_limit_ns: int = 0
+    # see ResponseTiming
+    attempts: int = 1
+    backoff_ns: int = 0
+    # see ResponseTiming
+    cached: bool = False
+
+    def header(self, name: str) -> str | None:
+        """Get the value of a header. Playwright reports header names in lower case."""
+        return self.headers.get(name.lower())
+
+    def copy(self) -> 'RawResponse':
+        """Get a copy of this response for another caller. The body is immutable and therefore shared."""
+        return RawResponse(self.status, dict(self.headers), self.body, self.headers_ns, self.body_ns, self.upload_bytes, self.rate_limit_ns,
+                           self.attempts, self.backoff_ns, self.cached)
+
+    def served_from_cache(self, revalidation: 'RawResponse | None' = None, lookup_ns: int = 0) -> 'RawResponse':
+        """Get a copy of this cached response to return to a caller.
+
+        :param revalidation: (optional) the 304 Not Modified response of the conditional request. Its headers update the cached ones.
+        :param lookup_ns: (optional) the time the cache lookup took, used as timing of a response served without a request.
+        """
+        if revalidation is None:
+            return RawResponse(self.status, dict(self.headers), self.body, headers_ns=lookup_ns, cached=True)
+        return RawResponse(self.status, {**self.headers, **revalidation.headers}, self.body, revalidation.headers_ns, revalidation.body_ns)
+
+@dataclass
+class ResponseTiming:
+    """Timing breakdown of a request in nanoseconds, measured with the monotonic perf_counter_ns."""
+    # until Playwright received the response
+    headers_ns: int
+    # transfer of the body from Playwright
+    body_ns: int
+    # decoding of the body. None until a lazily decoded body was accessed
+    decode_ns: int | None = None
+    # size of the request body in bytes. 0 if nothing was uploaded or the size is unknown (e.g. JSON data)
+    upload_bytes: int = 0
+    # waiting for a slot of the rate limiter before the request was sent. Not part of the duration
+    rate_limit_ns: int = 0
+    # number of attempts of a request with retry policy and the time waited between them. The other timings are of the last attempt
+    attempts: int = 1
+    backoff_ns: int = 0
+    # served from the HttpCache without a request, the timings are those of the cache lookup. Excluded from latency statistics
+    cached: bool = False
+
+    @property
+    def duration_ms(self) -> float:
+        """Time in milliseconds until the response including its body was received."""
+        return (self.headers_ns + self.body_ns) / 1_000_000
+
+    @property
+    def upload_throughput(self) -> float:
+        """Uploaded bytes per second, measured until the response was received. A lower bound, since it includes the processing time of the server."""
+        return self.upload_bytes * 1_000_000_000 / self.headers_ns if self.headers_ns > 0 else 0.0
+
+class LazyBody:
+    """Descriptor of Response.body that decodes the body on first access with the body_decoder of the response, so checks of
+    the status or the headers never parse the body. Equality and repr of a response access the body like any other field."""
+
+    def __get__(self, response: 'Response | None', owner: type | None = None) -> Any:
+        if response is None:
+            # no default value of the dataclass field
+            raise AttributeError('body')
+        if response.body_decoder is not None:
+            start_time = perf_counter_ns()
+            # drop the decoder and with it the raw body once decoded
+            response.__dict__['body'], response.body_decoder = response.body_decoder(), None
+            if response.timing is not None:
+                response.timing.decode_ns = perf_counter_ns() - start_time
+        return response.__dict__['body']
+
+    def __set__(self, response: 'Response', body: Any) -> None:
+        response.__dict__['body'] = body
+        response.__dict__['body_decoder'] = None
+
 @dataclass
 class Response:
-    """Response type which is returned from any request."""
-    body:  Dict | str | None
+    """Response type which is returned from any request. The body can be decoded lazily on first access (see LazyBody)."""
+    body: Dict | str | memoryview | ResponseFile | None = LazyBody()
     status: int
     headers: Dict[str, str]
+    # time in milliseconds until the response including its body was received
     duration: float
+    # hex encoded SHA-256 of binary bodies (ResponseBodyFormat.BUFFER and FILE)
+    sha256: str | None = None
+    # decodes the body on first access of Response.body. The body passed to the constructor is ignored if given
+    body_decoder: Callable[[], Any] | None = field(default=None, repr=False, compare=False)
+    # the timing breakdown of the request
+    timing: ResponseTiming | None = None
@@ -0,0 +1,108 @@
+import json
+import os
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Callable, Dict, Tuple
+from .types import RequestFile, RequestMethod, ResponseFile
+
+# size of the chunks a binary body is hashed and written in
+CHUNK_SIZE = 1024 * 1024
+
+
+def buffer_body(body: bytes) -> Tuple[memoryview, str]:
+    """Get a binary body as memoryview (without copying it) together with its SHA-256.
+
+    :returns: the body and its hex encoded SHA-256.
+    """
+    view = memoryview(body)
+    digest = sha256()
+    for offset in range(0, len(view), CHUNK_SIZE):
+        digest.update(view[offset:offset + CHUNK_SIZE])
+    return view, digest.hexdigest()
+
+
+def write_body_to_file(body: bytes, directory: str | Path | None = None) -> Tuple[ResponseFile, str]:
+    """Write a binary body chunk by chunk to a temporary file and compute its SHA-256 on the way.
+    The file is not deleted automatically.
+
+    :param body: the body.
+    :param directory: (optional) the directory to create the file in. Defaults to the temp directory of the system.
+    :returns: the file and the hex encoded SHA-256 of the body.
+    """
+    view = memoryview(body)
+    digest = sha256()
+    with NamedTemporaryFile('wb', delete=False, dir=directory, prefix='testla-response-', suffix='.body') as file:
+        for offset in range(0, len(view), CHUNK_SIZE):
+            chunk = view[offset:offset + CHUNK_SIZE]
+            digest.update(chunk)
+            file.write(chunk)
+    return ResponseFile(Path(file.name), len(view)), digest.hexdigest()
+
+
+def default_json_decoder() -> Callable[[bytes], Any]:
+    """Get the fastest available JSON decoder: orjson if it is installed, json otherwise."""
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        return json.loads
+
+
+def json_equal(first: Any, second: Any) -> bool:
+    """Compare decoded JSON values, where true is not equal to 1 as it is in Python. Objects and arrays are compared item by item."""
+    if isinstance(first, bool) or isinstance(second, bool):
+        return type(first) == type(second) and first == second
+    if isinstance(first, dict) and isinstance(second, dict):
+        return first.keys() == second.keys() and all(json_equal(value, second[key]) for key, value in first.items())
+    if isinstance(first, list) and isinstance(second, list):
+        return len(first) == len(second) and all(json_equal(item, other) for item, other in zip(first, second))
+    return first == second
+
+
+def multipart_value_size(value: Any) -> int:
+    """Get the size in bytes of a multipart value as Playwright sends it: files with their content, file payloads with their buffer
+    and every other value (str, int, float, bool) as UTF-8 encoded str(value), e.g. True as 'True'."""
+    if isinstance(value, Path):
+        return os.path.getsize(value)
+    if isinstance(value, dict) and isinstance(value.get('buffer'), bytes):
+        return len(value['buffer'])
+    return len(str(value).encode('utf-8'))
+
+
+def request_body_size(data: object | None, multipart: Dict[str, Any] | None) -> int:
+    """Get the size in bytes of a request body without reading any file. Multipart bodies are counted without the boundaries Playwright adds.
+
+    :returns: the size, 0 if it is not known up front (e.g. JSON data).
+    """
+    if isinstance(data, RequestFile):
+        return data.size
+    if isinstance(data, bytes):
+        return len(data)
+    if multipart is not None:
+        return sum(multipart_value_size(value) for value in multipart.values())
+    return 0
+
+
+def request_arguments(method: RequestMethod, url: str, headers: Dict[str, str] | None, data: object | None,
+                      multipart: Dict[str, Any] | None) -> Tuple[str, Dict[str, Any]]:
+    """Map a request to the APIRequestContext method that sends it, which is the same for the sync and the async API.
+
+    :returns: the name of the method and its keyword arguments.
+    """
+    match method:
+        case RequestMethod.GET:
+            return 'get', {'url': url, 'headers': headers}
+        case RequestMethod.POST:
+            return 'post', {'url': url, 'headers': headers, 'data': data, 'multipart': multipart}
+        case RequestMethod.PUT:
+            return 'put', {'url': url, 'headers': headers, 'data': data, 'multipart': multipart}
+        case RequestMethod.PATCH:
+            return 'patch', {'url': url, 'headers': headers, 'data': data, 'multipart': multipart}
+        case RequestMethod.HEAD:
+            return 'head', {'url': url, 'headers': headers}
+        case RequestMethod.DELETE:
+            return 'delete', {'url': url, 'headers': headers, 'data': data}
+        # default case
+        case _:
+            raise RuntimeError("Error: HTTP method not supported.")
@@ -1 +1,3 @@
-# from .actions.sleep import Sleep
\ No newline at end of file
+# from .actions.sleep import Sleep
+# from .histogram import LatencyHistogram, LatencySamples
+# from .load_runner import LoadReport, LoadRunner
\ No newline at end of file
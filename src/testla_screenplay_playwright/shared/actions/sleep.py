@@ -1,3 +1,4 @@
+from asyncio import sleep as async_sleep
 from testla_screenplay import Action, Actor
 from time import sleep
 
@@ -11,6 +12,9 @@ class Sleep(Action):
     def perform_as(self, actor: Actor) -> None:
         return sleep(self.secs)
 
+    async def perform_as_async(self, actor: Actor) -> None:
+        return await async_sleep(self.secs)
+
     @staticmethod
     def For(secs: float) -> "Sleep":
         """Pause the execution of further test steps for a given interval in seconds.
@@ -18,4 +22,3 @@ class Sleep(Action):
         :param secs: interval in seconds.
         """
         return Sleep(secs)
-
@@ -0,0 +1,137 @@
+from array import array
+from math import ceil, fsum
+from typing import Dict, Iterable
+
+
+def check_percentile(percentile: float) -> None:
+    """Raise a ValueError if the percentile is not between 0 and 100."""
+    if not 0 <= percentile <= 100:
+        raise ValueError(f"Error: percentile must be between 0 and 100, got {percentile}.")
+
+
+class LatencyHistogram:
+    """HDR-style histogram of latencies in nanoseconds. Values are counted in logarithmic buckets, each split into linear sub-buckets,
+    so the memory does not grow with the number of samples and every percentile is accurate to about 1 / 2^(precision_bits - 1)."""
+
+    def __init__(self, precision_bits: int = 8):
+        """Create an empty histogram.
+
+        :param precision_bits: (optional) bits of every value that are kept exactly. Defaults to 8, which is a relative error below 1%.
+        """
+        self.precision_bits = precision_bits
+        self.count = 0
+        self.total = 0
+        self.min: int | None = None
+        self.max: int | None = None
+        self._counts: Dict[int, int] = {}
+
+    def _index(self, value: int) -> int:
+        shift = max(0, value.bit_length() - self.precision_bits)
+        # (shift, leading bits of the value) sorts like the values themselves
+        return (shift << self.precision_bits) | (value >> shift)
+
+    def _highest_value(self, index: int) -> int:
+        shift = index >> self.precision_bits
+        return (((index & ((1 << self.precision_bits) - 1)) + 1) << shift) - 1
+
+    def record(self, value: int, count: int = 1) -> None:
+        """Record a latency.
+
+        :param value: the latency in nanoseconds.
+        :param count: (optional) how often the latency was observed.
+        """
+        value = max(0, int(value))
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Add all values of another histogram with the same precision to this one."""
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.count > 0:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def percentile(self, percentile: float) -> int:
+        """Get the latency in nanoseconds that the given percentage of the values does not exceed.
+
+        :param percentile: the percentile between 0 and 100, e.g. 99 for p99.
+        :raises ValueError: if the percentile is not between 0 and 100.
+        """
+        check_percentile(percentile)
+        if self.count == 0:
+            return 0
+        rank = max(1, -(-percentile * self.count // 100))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                # the highest value of the bucket, but never beyond the observed range
+                return min(max(self._highest_value(index), self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """The exact mean of the values in nanoseconds."""
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """Get count, mean, p50, p90, p99 and max. Latencies are in milliseconds."""
+        return {
+            'count': self.count,
+            'mean': self.mean / 1_000_000,
+            'p50': self.percentile(50) / 1_000_000,
+            'p90': self.percentile(90) / 1_000_000,
+            'p99': self.percentile(99) / 1_000_000,
+            'max': (self.max or 0) / 1_000_000,
+        }
+
+
+class LatencySamples:
+    """Compact store of latencies in milliseconds (8 bytes per sample) with exact percentiles."""
+
+    def __init__(self, values: Iterable[float] = ()):
+        self._values = array('d', values)
+        self._sorted = len(self._values) < 2
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, value: float) -> None:
+        """Add a latency in milliseconds."""
+        self._values.append(value)
+        self._sorted = False
+
+    def _ordered(self) -> array:
+        if not self._sorted:
+            self._values = array('d', sorted(self._values))
+            self._sorted = True
+        return self._values
+
+    def percentile(self, percentile: float) -> float:
+        """Get the latency that the given percentage of the samples does not exceed (nearest rank).
+
+        :param percentile: the percentile between 0 and 100, e.g. 95 for p95.
+        :raises ValueError: if the percentile is not between 0 and 100.
+        """
+        check_percentile(percentile)
+        values = self._ordered()
+        if len(values) == 0:
+            return 0.0
+        return values[max(1, ceil(percentile * len(values) / 100)) - 1]
+
+    @property
+    def mean(self) -> float:
+        """The mean of the samples."""
+        return fsum(self._values) / len(self._values) if len(self._values) > 0 else 0.0
+
+    @property
+    def max(self) -> float:
+        """The highest sample."""
+        return max(self._values) if len(self._values) > 0 else 0.0
@@ -0,0 +1,193 @@
+import asyncio
+import inspect
+from math import sqrt
+from queue import Queue
+from threading import Lock, Thread
+from time import perf_counter, perf_counter_ns, sleep
+from typing import Awaitable, Callable, Dict, Iterator, List
+from testla_screenplay import Action, Actor, Task
+from .histogram import LatencyHistogram
+
+# name of the histogram of whole iterations, measured from their scheduled start
+ITERATION = 'iteration'
+
+
+def arrival_times(rate: float, duration: float, ramp_to: float | None = None) -> Iterator[float]:
+    """Get the times (in seconds after the start) at which iterations should start.
+
+    :param rate: the arrival rate in iterations per second at the start.
+    :param duration: the duration of the run in seconds.
+    :param ramp_to: (optional) the arrival rate at the end of the run. The rate changes linearly from rate to ramp_to.
+    """
+    slope = 0.0 if ramp_to is None else (ramp_to - rate) / duration
+    arrival = 0
+    while True:
+        # solve rate * t + slope / 2 * t^2 = arrival for t
+        if slope == 0.0:
+            time = arrival / rate if rate > 0 else duration
+        else:
+            discriminant = rate * rate + 2 * slope * arrival
+            time = (-rate + sqrt(discriminant)) / slope if discriminant >= 0 else duration
+        if time >= duration:
+            return
+        yield time
+        arrival += 1
+
+
+class LoadReport:
+    """Result of a load run: latency histograms per action and errors over time."""
+
+    def __init__(self, window: float = 1.0):
+        self.window = window
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.iterations = 0
+        self.errors = 0
+        self.errors_by_type: Dict[str, int] = {}
+        # number of completed iterations (by scheduled start) and errors per window since the start of the run
+        self.iterations_over_time: Dict[int, int] = {}
+        self.errors_over_time: Dict[int, int] = {}
+        self.duration = 0.0
+        self._lock = Lock()
+
+    def record_latency(self, name: str, latency_ns: int) -> None:
+        """Record the latency of an action."""
+        with self._lock:
+            if name not in self.histograms:
+                self.histograms[name] = LatencyHistogram()
+            self.histograms[name].record(latency_ns)
+
+    def record_iteration(self, elapsed: float) -> None:
+        """Count an iteration that started the given number of seconds after the start of the run."""
+        with self._lock:
+            self.iterations += 1
+            window = int(elapsed // self.window)
+            self.iterations_over_time[window] = self.iterations_over_time.get(window, 0) + 1
+
+    def record_error(self, elapsed: float, error: BaseException) -> None:
+        """Count an error that occurred the given number of seconds after the start of the run."""
+        with self._lock:
+            self.errors += 1
+            name = type(error).__name__
+            self.errors_by_type[name] = self.errors_by_type.get(name, 0) + 1
+            window = int(elapsed // self.window)
+            self.errors_over_time[window] = self.errors_over_time.get(window, 0) + 1
+
+    @property
+    def throughput(self) -> float:
+        """Completed iterations per second."""
+        return self.iterations / self.duration if self.duration > 0 else 0.0
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Get count, mean, p50, p90, p99 and max in milliseconds per action and for whole iterations."""
+        return {name: histogram.summary() for name, histogram in self.histograms.items()}
+
+
+class LoadRunner:
+    """Replays screenplay activities with virtual actors at a target arrival rate, either with threads or with asyncio.
+    Iterations start at the scheduled arrival times no matter how long earlier iterations take (open model). If all virtual actors are busy,
+    iterations wait for the next free actor; the iteration latency is measured from the scheduled start, so this waiting is not hidden."""
+
+    def __init__(self, actor_factory: Callable[[int], Actor | Awaitable[Actor]], activities: Callable[[], List[Action | Task]], virtual_actors: int = 10):
+        """Configure the load run.
+
+        :param actor_factory: creates the virtual actor with the given number and its abilities. Called in the thread (or event loop) the actor runs in,
+            since Playwright objects must not be shared across threads. May be a coroutine function for run_async().
+        :param activities: creates the activities of one iteration, e.g. lambda: [Get.From('/items'), Post.To('/items').with_data(...)].
+        :param virtual_actors: (optional) the number of virtual actors. Defaults to 10.
+        """
+        self.actor_factory = actor_factory
+        self.activities = activities
+        self.virtual_actors = virtual_actors
+
+    @staticmethod
+    def _name(activity: Action | Task) -> str:
+        return type(activity).__name__
+
+    def run(self, rate: float, duration: float, ramp_to: float | None = None, window: float = 1.0) -> LoadReport:
+        """Run the load with one thread per virtual actor, using perform_as of the activities.
+
+        :param rate: the arrival rate in iterations per second.
+        :param duration: the duration of the run in seconds.
+        :param ramp_to: (optional) ramp the arrival rate linearly from rate to ramp_to.
+        :param window: (optional) the length in seconds of the windows of LoadReport.iterations_over_time and errors_over_time.
+        """
+        report = LoadReport(window=window)
+        arrivals: Queue[float | None] = Queue()
+        start_time = perf_counter()
+
+        def work(number: int) -> None:
+            try:
+                actor = self.actor_factory(number)
+            except Exception as error:
+                # the other virtual actors take over the iterations
+                report.record_error(perf_counter() - start_time, error)
+                return
+            while (scheduled := arrivals.get()) is not None:
+                try:
+                    for activity in self.activities():
+                        activity_start = perf_counter_ns()
+                        activity.perform_as(actor)
+                        report.record_latency(self._name(activity), perf_counter_ns() - activity_start)
+                    report.record_latency(ITERATION, int((perf_counter() - start_time - scheduled) * 1_000_000_000))
+                    report.record_iteration(scheduled)
+                except Exception as error:
+                    report.record_error(perf_counter() - start_time, error)
+
+        workers = [Thread(target=work, args=(number,), daemon=True) for number in range(self.virtual_actors)]
+        for worker in workers:
+            worker.start()
+        for arrival in arrival_times(rate, duration, ramp_to):
+            delay = arrival - (perf_counter() - start_time)
+            if delay > 0:
+                sleep(delay)
+            arrivals.put(arrival)
+        for _ in workers:
+            arrivals.put(None)
+        for worker in workers:
+            worker.join()
+        report.duration = perf_counter() - start_time
+        return report
+
+    async def run_async(self, rate: float, duration: float, ramp_to: float | None = None, window: float = 1.0) -> LoadReport:
+        """Run the load with one coroutine per virtual actor on the running event loop, using perform_as_async of the activities.
+
+        :param rate: the arrival rate in iterations per second.
+        :param duration: the duration of the run in seconds.
+        :param ramp_to: (optional) ramp the arrival rate linearly from rate to ramp_to.
+        :param window: (optional) the length in seconds of the windows of LoadReport.iterations_over_time and errors_over_time.
+        """
+        report = LoadReport(window=window)
+        arrivals: asyncio.Queue[float | None] = asyncio.Queue()
+        start_time = perf_counter()
+
+        async def work(number: int) -> None:
+            try:
+                actor = self.actor_factory(number)
+                if inspect.isawaitable(actor):
+                    actor = await actor
+            except Exception as error:
+                # the other virtual actors take over the iterations
+                report.record_error(perf_counter() - start_time, error)
+                return
+            while (scheduled := await arrivals.get()) is not None:
+                try:
+                    for activity in self.activities():
+                        activity_start = perf_counter_ns()
+                        await activity.perform_as_async(actor)
+                        report.record_latency(self._name(activity), perf_counter_ns() - activity_start)
+                    report.record_latency(ITERATION, int((perf_counter() - start_time - scheduled) * 1_000_000_000))
+                    report.record_iteration(scheduled)
+                except Exception as error:
+                    report.record_error(perf_counter() - start_time, error)
+
+        workers = [asyncio.create_task(work(number)) for number in range(self.virtual_actors)]
+        for arrival in arrival_times(rate, duration, ramp_to):
+            delay = arrival - (perf_counter() - start_time)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            arrivals.put_nowait(arrival)
+        for _ in workers:
+            arrivals.put_nowait(None)
+        await asyncio.gather(*workers)
+        report.duration = perf_counter() - start_time
+        return report
@@ -1,3 +1,4 @@
+from .abilities.async_browse_the_web import AsyncBrowseTheWeb
 from .abilities.browse_the_web import BrowseTheWeb
 
 from .actions.add import Add
@@ -18,4 +19,7 @@ from .actions.wait import Wait
 
 from .questions.element import Element
 
+from .context_pool import AsyncBrowserContextPool, BrowserContextPool, ContextPoolMetrics
+from .request_blocking import RequestBlocking, RequestBlockingStats
+from .storage_state_cache import StorageStateCache
 from .types import Selector, SelectorOptions, SelectorOptionsState, SubSelector, SubSelectorOptions
\ No newline at end of file
@@ -0,0 +1,480 @@
+from pathlib import Path
+from re import Pattern
+from typing import Dict, List, Literal, Tuple
+from playwright.async_api import Cookie, Error, Locator, Page, Request, Response, Route, StorageState, expect
+from testla_screenplay import Actor, Ability
+from ..context_pool import AsyncBrowserContextPool
+from ..request_blocking import RequestBlocking, RequestBlockingStats
+from ..storage_state_cache import StorageStateCache
+from ..types import ElementCheck, Selector, SelectorOptions
+from ..utils import ELEMENT_CHECKS_SCRIPT, GET_STORAGE_ITEMS_SCRIPT, REMOVE_STORAGE_ITEMS_SCRIPT, SET_STORAGE_ITEMS_SCRIPT, ElementChecksBatch, LocatorCache, async_recursive_locator_lookup, har_routing, locate, trusts_auto_wait
+
+
+class AsyncBrowseTheWeb(Ability):
+    """This class represents the actor's ability to use a Browser via the asyncio based Playwright API.
+    All methods are coroutines, which allows a single event loop to drive many pages concurrently."""
+
+    def __init__(self, page: Page, trust_auto_wait: bool = False, locator_cache_size: int = 128, storage_state_cache: StorageStateCache | None = None):
+        self.page = page
+        self.trust_auto_wait = trust_auto_wait
+        self.storage_state_cache = storage_state_cache
+        self.request_blocking_stats: RequestBlockingStats | None = None
+        self.locator_cache = LocatorCache(maxsize=locator_cache_size)
+        self.pool: AsyncBrowserContextPool | None = None
+
+    @staticmethod
+    def using(page: Page, trust_auto_wait: bool = False, locator_cache_size: int = 128, storage_state_cache: StorageStateCache | None = None) -> 'AsyncBrowseTheWeb':
+        """Initialize this Ability by passing an already existing asynchronous Playwright Page object.
+
+        :param page: the Playwright Page that will be used to browse.
+        :param trust_auto_wait: (optional) skip the explicit wait before actions like click or fill, which wait for the element to be actionable anyway.
+            The timeout of the SelectorOptions is passed on to the action, the states 'hidden' and 'detached' are still waited for explicitly. Can be overridden per SelectorOptions.
+        :param locator_cache_size: (optional) the maximum number of compiled selectors to keep. 0 disables the cache.
+        :param storage_state_cache: (optional) the cache to save storage states (cookies and web storage) to and restore them from, e.g. to skip logging in via the UI.
+        """
+        return AsyncBrowseTheWeb(page, trust_auto_wait=trust_auto_wait, locator_cache_size=locator_cache_size, storage_state_cache=storage_state_cache)
+
+    @staticmethod
+    async def from_pool(pool: AsyncBrowserContextPool, timeout: float | None = None, trust_auto_wait: bool = False, locator_cache_size: int = 128,
+                        storage_state_cache: StorageStateCache | None = None) -> 'AsyncBrowseTheWeb':
+        """Initialize this Ability with the page of a warm browser context leased from a pool. Call release() at the end of the test to return it.
+
+        :param pool: the pool to lease the browser context from.
+        :param timeout: (optional) maximum time in seconds to wait for a free browser context.
+        :param trust_auto_wait: (optional) see using().
+        :param locator_cache_size: (optional) see using().
+        :param storage_state_cache: (optional) see using().
+        """
+        ability = AsyncBrowseTheWeb(await pool.lease(timeout=timeout), trust_auto_wait=trust_auto_wait, locator_cache_size=locator_cache_size, storage_state_cache=storage_state_cache)
+        ability.pool = pool
+        return ability
+
+    @staticmethod
+    def As(actor: Actor) -> 'AsyncBrowseTheWeb':
+        """Use this Ability as an Actor."""
+        return actor.with_ability_to(AsyncBrowseTheWeb)
+
+    async def _actionable_locator_lookup(self, selector: Selector, options: SelectorOptions | None = None) -> Tuple[Locator, float | None]:
+        """Resolve the locator for an action that waits for the element to be actionable on its own.
+
+        :returns: the locator and the timeout of the SelectorOptions, which has to be passed on to the action.
+        """
+        locator, timeout, state = locate(self.page, selector, options, self.locator_cache)
+        if not trusts_auto_wait(self.trust_auto_wait, options, state):
+            await locator.wait_for(timeout=timeout, state=state)
+        return locator, timeout
+
+    async def release(self) -> None:
+        """Return the page to the pool it was leased from. The browser context is reset for the next test."""
+        if self.pool is None:
+            raise RuntimeError('Error: the page was not leased from an AsyncBrowserContextPool.')
+        self.request_blocking_stats = None
+        pool, self.pool = self.pool, None
+        await pool.release(self.page)
+
+    def get_page(self) -> Page:
+        """Get the page object.
+
+        :returns: the page object.
+        """
+        return self.page
+
+    async def goto(self, url: str) -> (Response | None):
+        """Use the page to navigate to the specified URL.
+
+        :param url: the url to access."""
+        return await self.page.goto(url)
+
+    async def block_requests(self, request_blocking: RequestBlocking) -> RequestBlockingStats:
+        """Block requests of the page that the tests do not need, e.g. images, fonts, media or third party trackers, to speed up page loads.
+
+        :param request_blocking: the configuration which requests to block.
+        :returns: the counters of blocked and allowed requests of this page.
+        """
+        stats = RequestBlockingStats()
+
+        async def handle(route: Route, request: Request) -> None:
+            if request_blocking.handle(stats, request):
+                await route.abort('blockedbyclient')
+            else:
+                # let other route handlers (or the network) handle the request
+                await route.fallback()
+
+        await self.page.route('**/*', handle)
+        self.request_blocking_stats = stats
+        return stats
+
+    async def use_har(self, har: str | Path, mode: Literal['record', 'replay', 'auto'] = 'auto', not_found: Literal['abort', 'fallback'] = 'abort', url: str | Pattern | None = None) -> Literal['record', 'replay']:
+        """Record the network traffic of the page into a HAR file or serve it from there, which gives deterministic runs without hitting the real backend.
+
+        :param har: the path of the HAR file, e.g. one per test or scenario.
+        :param mode: (optional) 'record' (re)records the traffic, 'replay' serves the requests from the HAR file and 'auto' replays if the HAR file exists and records otherwise.
+            Recorded traffic is written to the HAR file when the browser context is closed. Defaults to 'auto'.
+        :param not_found: (optional) replay mode only: either 'abort' requests which are not in the HAR file or let them 'fallback' to the network. Defaults to 'abort'.
+        :param url: (optional) only record/replay requests whose URL matches this glob pattern or regular expression.
+        :returns: the mode that is used, either 'record' or 'replay'.
+        """
+        mode, route_options = har_routing(har, mode, not_found, url)
+        await self.page.route_from_har(**route_options)
+        return mode
+
+    def get_request_blocking_stats(self) -> RequestBlockingStats | None:
+        """Get the counters of blocked and allowed requests of this page.
+
+        :returns: the counters or None if request blocking is not enabled.
+        """
+        return self.request_blocking_stats
+
+    async def wait_for_load_state(self, state: Literal['domcontentloaded', 'load', 'networkidle']) -> None:
+        """Wait for the specified loading state.
+
+        :param state: the state to wait for. Supported: 'load', 'domcontentloaded', 'networkidle'
+        """
+        return await self.page.wait_for_load_state(state)
+
+    async def hover(self, selector: Selector, options: SelectorOptions | None = None, modifiers: List[Literal['Alt', 'Control', 'Meta', 'Shift']] | None = None) -> None:
+        """Use the page mouse to hover over the specified element.
+
+        :param selector: the selector of the element to hover over.
+        :param modifiers: (optional) the keys that should be pressed while hovering. Supported: 'Alt', 'Control', 'Meta', 'Shift'.
+        """
+        locator, timeout = await self._actionable_locator_lookup(selector, options)
+        return await locator.hover(modifiers=modifiers, timeout=timeout)
+
+    async def press(self, keys: str) -> None:
+        """Press the specified key(s) on the keyboard.
+
+        :param keys: the key(s). multiple keys can be pressed by concatenating with '+'.
+        """
+        return await self.page.keyboard.press(keys)
+
+    async def check_box(self, selector: Selector, options: SelectorOptions | None = None) -> None:
+        """Check the specified checkbox.
+
+        :param selector: the selector of the checkbox.
+        """
+        locator, timeout = await self._actionable_locator_lookup(selector, options)
+        return await locator.check(timeout=timeout)
+
+    async def wait_for_selector(self, selector: Selector, options: SelectorOptions | None = None):
+        """Wait until the element of the specified selector exists.
+
+        :param selector: the selector of the element.
+        """
+        return await async_recursive_locator_lookup(self.page, selector, options, cache=self.locator_cache)
+
+    async def drag_and_drop(self, source_selector: Selector, target_selector: Selector, source_options: SelectorOptions | None = None, target_options: SelectorOptions | None = None) -> None:
+        """Drag the specified source element to the specified target element and drop it.
+
+        :param source_selector: the selector of the source element.
+        :param target_selector: the selector of the target element.
+        """
+        target, _ = await self._actionable_locator_lookup(target_selector, target_options)
+        locator, timeout = await self._actionable_locator_lookup(source_selector, source_options)
+        return await locator.drag_to(target=target, target_position={"x": 0, "y": 0}, timeout=timeout)
+
+    async def fill(self, selector: Selector, inp: str, options: SelectorOptions | None = None) -> None:
+        """Fill the element specified by the selector with the given input.
+
+        :param selector: the selector of the element.
+        :param inp: the input to fill the element with.
+        """
+        locator, timeout = await self._actionable_locator_lookup(selector, options)
+        return await locator.fill(inp, timeout=timeout)
+
+    async def type(self, selector: Selector, inp: str, options: SelectorOptions | None = None) -> None:
+        """Type the given input into the element specified by the selector.
+
+        :param selector: the selector of the element.
+        :param inp: the input to fill the element with.
+        """
+        locator, timeout = await self._actionable_locator_lookup(selector, options)
+        return await locator.type(inp, timeout=timeout)
+
+    async def click(self, selector: Selector, options: SelectorOptions | None = None) -> None:
+        """Click the element specified by the selector.
+
+        :param selector: the selector of the element to click.
+        """
+        locator, timeout = await self._actionable_locator_lookup(selector, options)
+        return await locator.click(timeout=timeout)
+
+    async def dblclick(self, selector: Selector, options: SelectorOptions | None = None) -> None:
+        """Double click the element specified by the selector.
+
+        :param selector: the selector of the element to double click.
+        """
+        locator, timeout = await self._actionable_locator_lookup(selector, options)
+        return await locator.dblclick(timeout=timeout)
+
+    async def select_option(self, selector: Selector, value: str | None = None, *, label: str | None = None, index: int | None = None, options: SelectorOptions | None = None) -> List[str]:
+        """Set the value of a Selector of type select to the given option.
+
+        :param selector: selector the string representing the (select) selector.
+        :param value: the value of the option. Default if none of the other parameters is specified.
+        :param label: the label of the option. Has to be specified explicitly.
+        :param index: the index of the option. Has to be specified explicitly.
+        """
+        locator, timeout = await self._actionable_locator_lookup(selector, options)
+        return await locator.select_option(value=value, label=label, index=index, timeout=timeout)
+
+    async def check_visibility_state(self, selector: Selector, mode: Literal['visible', 'hidden'], options: SelectorOptions | None = None) -> bool:
+        """Validate if a locator on the page is visible or hidden.
+
+        :param mode: the expected property of the selector that needs to be checked. either 'visible' or 'hidden'.
+        :param selector: the locator to check for.
+        :param timeout: (optional) maximum timeout to wait for.
+        :returns: true if the element is visible/hidden as expected. Throws an error if the timeout was reached.
+        """
+        # create dummy options if options is None
+        options = SelectorOptions() if options is None else options
+
+        if mode == 'visible':
+            await expect(await async_recursive_locator_lookup(self.page, selector, cache=self.locator_cache, options=SelectorOptions(
+                options.has_text, options.sub_selector, options.timeout, 'visible')
+            )).to_be_visible(timeout=options.timeout)
+        else:
+            await expect(await async_recursive_locator_lookup(self.page, selector, cache=self.locator_cache, options=SelectorOptions(
+                options.has_text, options.sub_selector, options.timeout, 'hidden')
+            )).to_be_hidden(timeout=options.timeout)
+        return True
+
+    async def check_enabled_state(self, selector: Selector, mode: Literal['enabled', 'disabled'], options: SelectorOptions | None = None) -> bool:
+        """Validate if a locator on the page is enabled or disabled.
+
+        :param mode: the expected property of the selector that needs to be checked. Either 'enabled' or 'disabled'.
+        :param selector: the locator to check for.
+        :param timeout: (optional) maximum timeout to wait for.
+        :returns: true if the element is enabled/disabled as expected. Throws an error if the timeout was reached.
+        """
+        # create dummy timeout if options is None
+        timeout = None if options is None else options.timeout
+
+        if mode == 'enabled':
+            await expect(await async_recursive_locator_lookup(self.page, selector, options, cache=self.locator_cache)).to_be_enabled(timeout=timeout)
+        else:
+            await expect(await async_recursive_locator_lookup(self.page, selector, options, cache=self.locator_cache)).to_be_disabled(timeout=timeout)
+        return True
+
+    async def check_selector_text(self, selector: Selector, text: str | Pattern, mode: Literal['has', 'has_not'], options: SelectorOptions | None = None) -> bool:
+        """Validate if the given element has the given text or not.
+
+        :param mode: the expected property of the selector that needs to be checked. Either 'has' or 'has_not'.
+        :param selector: the locator to check for.
+        :param timeout: (optional) maximum timeout to wait for.
+        :returns: true if the element has/has not as expected. Throws an error if the timeout was reached.
+        """
+        # create dummy timeout if options is None
+        timeout = None if options is None else options.timeout
+
+        if mode == 'has':
+            await expect(await async_recursive_locator_lookup(self.page, selector, options, cache=self.locator_cache)).to_have_text(text, timeout=timeout)
+        else:
+            await expect(await async_recursive_locator_lookup(self.page, selector, options, cache=self.locator_cache)).not_to_have_text(text, timeout=timeout)
+        return True
+
+    async def check_selector_value(self, selector: Selector, value: str | Pattern, mode: Literal['has', 'has_not'], options: SelectorOptions | None = None) -> bool:
+        """Validate if the given element has the given value or not.
+
+        :param mode: the expected property of the selector that needs to be checked. Either 'has' or 'has_not'.
+        :param selector: the locator to check for.
+        :param timeout: (optional) maximum timeout to wait for.
+        :returns: true if the element has/has not as expected. Throws an error if the timeout was reached.
+        """
+        # create dummy timeout if options is None
+        timeout = None if options is None else options.timeout
+
+        if mode == 'has':
+            await expect(await async_recursive_locator_lookup(self.page, selector, options, cache=self.locator_cache)).to_have_value(value, timeout=timeout)
+        else:
+            await expect(await async_recursive_locator_lookup(self.page, selector, options, cache=self.locator_cache)).not_to_have_value(value, timeout=timeout)
+        return True
+
+    async def check_elements(self, checks: List[ElementCheck], timeout: float | None = None) -> bool:
+        """Validate a batch of element checks within a single page.evaluate() that polls until all checks passed or the timeout was reached.
+        Checks the page can not resolve on its own (Playwright Locators, Playwright specific selector syntax, SelectorOptions with a state,
+        or elements that may be in a shadow root) are validated one by one with Playwright afterwards.
+
+        :param checks: the checks to validate.
+        :param timeout: (optional) maximum timeout in milliseconds for all checks, including those validated with Playwright. Defaults to the longest timeout of the checks.
+        :returns: true if all checks passed. Throws an AssertionError which lists every failed check otherwise.
+        """
+        batch = ElementChecksBatch(checks, timeout)
+        if len(batch.batched) > 0:
+            batch.add_results(await self.page.evaluate(ELEMENT_CHECKS_SCRIPT, batch.script_argument()))
+
+        for index in batch.single:
+            name, arguments = batch.method(index)
+            try:
+                await getattr(self, name)(**arguments)
+            except (AssertionError, Error) as error:
+                batch.add_failure(index, error)
+        return batch.verify()
+
+    async def get_cookies(self, urls: str | List[str] = None) -> List[Cookie]:
+        """Get the cookies of the current browser context. If no URLs are specified, this method returns all cookies.
+        If URLs are specified, only cookies that affect those URLs are returned."""
+        return await self.page.context.cookies(urls)
+
+    async def add_cookies(self, cookies) -> None:
+        """Adds cookies into this browser context. All pages within this context will have these cookies installed. Cookies can be obtained via AsyncBrowseTheWeb.get_cookies([urls])."""
+        return await self.page.context.add_cookies(cookies)
+
+    async def clear_cookies(self) -> None:
+        """Clear the browser context cookies."""
+        return await self.page.context.clear_cookies()
+
+    def _get_storage_state_cache(self) -> StorageStateCache:
+        if self.storage_state_cache is None:
+            raise RuntimeError('Error: no StorageStateCache configured. Use AsyncBrowseTheWeb.using(page, storage_state_cache=...).')
+        return self.storage_state_cache
+
+    async def save_storage_state(self, identity: str) -> StorageState:
+        """Snapshot the cookies and web storage of the current browser context into the storage state cache.
+
+        :param identity: the identity to store the storage state for, e.g. the name of the logged in user.
+        :returns: the storage state.
+        """
+        storage_state = await self.page.context.storage_state()
+        self._get_storage_state_cache().save(identity, storage_state)
+        return storage_state
+
+    async def restore_storage_state(self, identity: str) -> bool:
+        """Restore the cached cookies and web storage of the given identity into the current browser context.
+
+        :param identity: the identity the storage state was stored for.
+        :returns: true if a valid storage state was restored, false if there is none cached (yet) or it has expired.
+        """
+        storage_state = self._get_storage_state_cache().load(identity)
+        if storage_state is None:
+            return False
+        if not hasattr(self.page.context, 'set_storage_state'):
+            raise RuntimeError('Error: this Playwright version can not restore a storage state into an existing context. Use StorageStateCache.new_context() instead.')
+        await self.page.context.set_storage_state(storage_state)
+        return True
+
+    async def get_local_storage_item(self, key: str) -> object:
+        """Get a local storage item.
+
+        :param key: the key that specifies the item.
+        """
+        return await self.page.evaluate("""(key) => {
+            const value = localStorage.getItem(key);
+            if (value) {
+                return Promise.resolve(JSON.parse(value));
+            }
+            return Promise.resolve(undefined);
+        }""", key)
+
+    async def set_local_storage_item(self, key: str, value: object) -> object:
+        """Set a local storage item identified by the given key + value, creating a new key/value pair if none existed for key previously.
+
+        :param key: the key that specifies the item.
+        :param value: the value to set.
+        """
+        return await self.page.evaluate("""({ key, value }) => {
+            localStorage.setItem(key, JSON.stringify(value));
+            return Promise.resolve();
+        }""", {'key': key, 'value': value})
+
+    async def remove_local_storage_item(self, key: str) -> None:
+        """Delete a local storage item, if a key/value pair with the given key exists.
+
+        :param key: the key that specifies the item.
+        """
+        return await self.page.evaluate("""(key) => {
+            localStorage.removeItem(key);
+            return Promise.resolve();
+        }""", key)
+
+    async def get_local_storage_items(self, keys: List[str]) -> Dict[str, object]:
+        """Get multiple local storage items within a single round trip.
+
+        :param keys: the keys that specify the items.
+        :returns: the items by key. Keys without an item are mapped to None.
+        """
+        return await self.page.evaluate(GET_STORAGE_ITEMS_SCRIPT, {'storage': 'localStorage', 'keys': keys})
+
+    async def get_all_local_storage(self) -> Dict[str, object]:
+        """Get all local storage items within a single round trip.
+
+        :returns: the items by key.
+        """
+        return await self.page.evaluate(GET_STORAGE_ITEMS_SCRIPT, {'storage': 'localStorage', 'keys': None})
+
+    async def set_local_storage_items(self, items: Dict[str, object]) -> None:
+        """Set multiple local storage items within a single round trip, creating new key/value pairs if none existed for a key previously.
+
+        :param items: the values by key.
+        """
+        return await self.page.evaluate(SET_STORAGE_ITEMS_SCRIPT, {'storage': 'localStorage', 'items': items})
+
+    async def remove_local_storage_items(self, keys: List[str]) -> None:
+        """Delete multiple local storage items within a single round trip, if key/value pairs with the given keys exist.
+
+        :param keys: the keys that specify the items.
+        """
+        return await self.page.evaluate(REMOVE_STORAGE_ITEMS_SCRIPT, {'storage': 'localStorage', 'keys': keys})
+
+    async def get_session_storage_item(self, key: str) -> object:
+        """Get a session storage item.
+
+        :param key: the key that specifies the item.
+        """
+        return await self.page.evaluate("""(key) => {
+            const value = sessionStorage.getItem(key);
+            if (value) {
+                return Promise.resolve(JSON.parse(value));
+            }
+            return Promise.resolve(undefined);
+        }""", key)
+
+    async def set_session_storage_item(self, key: str, value: object) -> object:
+        """Set a session storage item identified by the given key + value, creating a new key/value pair if none existed for key previously.
+
+        :param key: the key that specifies the item.
+        :param value: the value to set.
+        """
+        return await self.page.evaluate("""({ key, value }) => {
+            sessionStorage.setItem(key, JSON.stringify(value));
+            return Promise.resolve();
+        }""", {'key': key, 'value': value})
+
+    async def remove_session_storage_item(self, key: str) -> None:
+        """Delete a session storage item, if a key/value pair with the given key exists.
+
+        :param key: the key that specifies the item.
+        """
+        return await self.page.evaluate("""(key) => {
+            sessionStorage.removeItem(key);
+            return Promise.resolve();
+        }""", key)
+
+    async def get_session_storage_items(self, keys: List[str]) -> Dict[str, object]:
+        """Get multiple session storage items within a single round trip.
+
+        :param keys: the keys that specify the items.
+        :returns: the items by key. Keys without an item are mapped to None.
+        """
+        return await self.page.evaluate(GET_STORAGE_ITEMS_SCRIPT, {'storage': 'sessionStorage', 'keys': keys})
+
+    async def get_all_session_storage(self) -> Dict[str, object]:
+        """Get all session storage items within a single round trip.
+
+        :returns: the items by key.
+        """
+        return await self.page.evaluate(GET_STORAGE_ITEMS_SCRIPT, {'storage': 'sessionStorage', 'keys': None})
+
+    async def set_session_storage_items(self, items: Dict[str, object]) -> None:
+        """Set multiple session storage items within a single round trip, creating new key/value pairs if none existed for a key previously.
+
+        :param items: the values by key.
+        """
+        return await self.page.evaluate(SET_STORAGE_ITEMS_SCRIPT, {'storage': 'sessionStorage', 'items': items})
+
+    async def remove_session_storage_items(self, keys: List[str]) -> None:
+        """Delete multiple session storage items within a single round trip, if key/value pairs with the given keys exist.
+
+        :param keys: the keys that specify the items.
+        """
+        return await self.page.evaluate(REMOVE_STORAGE_ITEMS_SCRIPT, {'storage': 'sessionStorage', 'keys': keys})
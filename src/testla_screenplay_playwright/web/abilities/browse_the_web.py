@@ -1,30 +1,75 @@
+from pathlib import Path
 from re import Pattern
-from typing import List, Literal
-from playwright.sync_api import Cookie, Page, Response, expect
+from typing import Dict, List, Literal, Tuple
+from playwright.sync_api import Cookie, Error, Locator, Page, Request, Response, Route, StorageState, expect
 from testla_screenplay import Actor, Ability
-from ..types import Selector, SelectorOptions
-from ..utils import recursive_locator_lookup
+from ..context_pool import BrowserContextPool
+from ..request_blocking import RequestBlocking, RequestBlockingStats
+from ..storage_state_cache import StorageStateCache
+from ..types import ElementCheck, Selector, SelectorOptions
+from ..utils import ELEMENT_CHECKS_SCRIPT, GET_STORAGE_ITEMS_SCRIPT, REMOVE_STORAGE_ITEMS_SCRIPT, SET_STORAGE_ITEMS_SCRIPT, ElementChecksBatch, LocatorCache, har_routing, locate, recursive_locator_lookup, trusts_auto_wait
 
 
 class BrowseTheWeb(Ability):
     """This class represents the actor's ability to use a Browser."""
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, trust_auto_wait: bool = False, locator_cache_size: int = 128, storage_state_cache: StorageStateCache | None = None):
         self.page = page
+        self.trust_auto_wait = trust_auto_wait
+        self.storage_state_cache = storage_state_cache
+        self.request_blocking_stats: RequestBlockingStats | None = None
+        self.locator_cache = LocatorCache(maxsize=locator_cache_size)
+        self.pool: BrowserContextPool | None = None
 
     @staticmethod
-    def using(page: Page) -> 'BrowseTheWeb':
+    def using(page: Page, trust_auto_wait: bool = False, locator_cache_size: int = 128, storage_state_cache: StorageStateCache | None = None) -> 'BrowseTheWeb':
         """Initialize this Ability by passing an already existing Playwright Page object.
         
         :param page: the Playwright Page that will be used to browse.
+        :param trust_auto_wait: (optional) skip the explicit wait before actions like click or fill, which wait for the element to be actionable anyway.
+            The timeout of the SelectorOptions is passed on to the action, the states 'hidden' and 'detached' are still waited for explicitly. Can be overridden per SelectorOptions.
+        :param locator_cache_size: (optional) the maximum number of compiled selectors to keep. 0 disables the cache.
+        :param storage_state_cache: (optional) the cache to save storage states (cookies and web storage) to and restore them from, e.g. to skip logging in via the UI.
         """
-        return BrowseTheWeb(page)
+        return BrowseTheWeb(page, trust_auto_wait=trust_auto_wait, locator_cache_size=locator_cache_size, storage_state_cache=storage_state_cache)
+
+    @staticmethod
+    def from_pool(pool: BrowserContextPool, trust_auto_wait: bool = False, locator_cache_size: int = 128,
+                  storage_state_cache: StorageStateCache | None = None) -> 'BrowseTheWeb':
+        """Initialize this Ability with the page of a warm browser context leased from a pool. Call release() at the end of the test to return it.
+
+        :param pool: the pool to lease the browser context from.
+        :param trust_auto_wait: (optional) see using().
+        :param locator_cache_size: (optional) see using().
+        :param storage_state_cache: (optional) see using().
+        """
+        ability = BrowseTheWeb(pool.lease(), trust_auto_wait=trust_auto_wait, locator_cache_size=locator_cache_size, storage_state_cache=storage_state_cache)
+        ability.pool = pool
+        return ability
 
     @staticmethod
     def As(actor: Actor) -> 'BrowseTheWeb':
         """Use this Ability as an Actor."""
         return actor.with_ability_to(BrowseTheWeb)
 
+    def _actionable_locator_lookup(self, selector: Selector, options: SelectorOptions | None = None) -> Tuple[Locator, float | None]:
+        """Resolve the locator for an action that waits for the element to be actionable on its own.
+
+        :returns: the locator and the timeout of the SelectorOptions, which has to be passed on to the action.
+        """
+        locator, timeout, state = locate(self.page, selector, options, self.locator_cache)
+        if not trusts_auto_wait(self.trust_auto_wait, options, state):
+            locator.wait_for(timeout=timeout, state=state)
+        return locator, timeout
+
+    def release(self) -> None:
+        """Return the page to the pool it was leased from. The browser context is reset for the next test."""
+        if self.pool is None:
+            raise RuntimeError('Error: the page was not leased from a BrowserContextPool.')
+        self.request_blocking_stats = None
+        pool, self.pool = self.pool, None
+        pool.release(self.page)
+
     def get_page(self) -> Page:
         """Get the page object.
         
@@ -38,6 +83,46 @@ class BrowseTheWeb(Ability):
         :param url: the url to access."""
         return self.page.goto(url)
 
+    def block_requests(self, request_blocking: RequestBlocking) -> RequestBlockingStats:
+        """Block requests of the page that the tests do not need, e.g. images, fonts, media or third party trackers, to speed up page loads.
+
+        :param request_blocking: the configuration which requests to block.
+        :returns: the counters of blocked and allowed requests of this page.
+        """
+        stats = RequestBlockingStats()
+
+        def handle(route: Route, request: Request) -> None:
+            if request_blocking.handle(stats, request):
+                route.abort('blockedbyclient')
+            else:
+                # let other route handlers (or the network) handle the request
+                route.fallback()
+
+        self.page.route('**/*', handle)
+        self.request_blocking_stats = stats
+        return stats
+
+    def use_har(self, har: str | Path, mode: Literal['record', 'replay', 'auto'] = 'auto', not_found: Literal['abort', 'fallback'] = 'abort', url: str | Pattern | None = None) -> Literal['record', 'replay']:
+        """Record the network traffic of the page into a HAR file or serve it from there, which gives deterministic runs without hitting the real backend.
+
+        :param har: the path of the HAR file, e.g. one per test or scenario.
+        :param mode: (optional) 'record' (re)records the traffic, 'replay' serves the requests from the HAR file and 'auto' replays if the HAR file exists and records otherwise.
+            Recorded traffic is written to the HAR file when the browser context is closed. Defaults to 'auto'.
+        :param not_found: (optional) replay mode only: either 'abort' requests which are not in the HAR file or let them 'fallback' to the network. Defaults to 'abort'.
+        :param url: (optional) only record/replay requests whose URL matches this glob pattern or regular expression.
+        :returns: the mode that is used, either 'record' or 'replay'.
+        """
+        mode, route_options = har_routing(har, mode, not_found, url)
+        self.page.route_from_har(**route_options)
+        return mode
+
+    def get_request_blocking_stats(self) -> RequestBlockingStats | None:
+        """Get the counters of blocked and allowed requests of this page.
+
+        :returns: the counters or None if request blocking is not enabled.
+        """
+        return self.request_blocking_stats
+
     def wait_for_load_state(self, state: Literal['domcontentloaded', 'load', 'networkidle']) -> None:
         """Wait for the specified loading state.
         
@@ -51,7 +136,8 @@ class BrowseTheWeb(Ability):
         :param selector: the selector of the element to hover over.
         :param modifiers: (optional) the keys that should be pressed while hovering. Supported: 'Alt', 'Control', 'Meta', 'Shift'.
         """
-        return recursive_locator_lookup(page=self.page, selector=selector, options=options).hover(modifiers=modifiers)
+        locator, timeout = self._actionable_locator_lookup(selector, options)
+        return locator.hover(modifiers=modifiers, timeout=timeout)
 
     def press(self, keys: str) -> None:
         """Press the specified key(s) on the keyboard.
@@ -65,14 +151,15 @@ class BrowseTheWeb(Ability):
 
         :param selector: the selector of the checkbox.
         """
-        return recursive_locator_lookup(page=self.page, selector=selector, options=options).check()
+        locator, timeout = self._actionable_locator_lookup(selector, options)
+        return locator.check(timeout=timeout)
 
     def wait_for_selector(self, selector: Selector, options: SelectorOptions | None = None):
         """Wait until the element of the specified selector exists.
         
         :param selector: the selector of the element.
         """
-        return recursive_locator_lookup(self.page, selector, options)
+        return recursive_locator_lookup(self.page, selector, options, cache=self.locator_cache)
 
     def drag_and_drop(self, source_selector: Selector, target_selector: Selector, source_options: SelectorOptions | None = None, target_options: SelectorOptions | None = None) -> None:
         """Drag the specified source element to the specified target element and drop it.
@@ -80,8 +167,9 @@ class BrowseTheWeb(Ability):
         :param source_selector: the selector of the source element.
         :param target_selector: the selector of the target element.
         """
-        target = recursive_locator_lookup(self.page, target_selector, target_options)
-        return recursive_locator_lookup(self.page, source_selector, source_options).drag_to(target=target, target_position={"x": 0, "y": 0})
+        target, _ = self._actionable_locator_lookup(target_selector, target_options)
+        locator, timeout = self._actionable_locator_lookup(source_selector, source_options)
+        return locator.drag_to(target=target, target_position={"x": 0, "y": 0}, timeout=timeout)
 
     def fill(self, selector: Selector, inp: str, options: SelectorOptions | None = None) -> None:
         """Fill the element specified by the selector with the given input.
@@ -89,7 +177,8 @@ class BrowseTheWeb(Ability):
         :param selector: the selector of the element.
         :param inp: the input to fill the element with.
         """
-        return recursive_locator_lookup(self.page, selector, options).fill(inp)
+        locator, timeout = self._actionable_locator_lookup(selector, options)
+        return locator.fill(inp, timeout=timeout)
 
     def type(self, selector: Selector, inp: str, options: SelectorOptions | None = None) -> None:
         """Type the given input into the element specified by the selector.
@@ -97,21 +186,24 @@ class BrowseTheWeb(Ability):
         :param selector: the selector of the element.
         :param inp: the input to fill the element with.
         """
-        return recursive_locator_lookup(self.page, selector, options).type(inp)
+        locator, timeout = self._actionable_locator_lookup(selector, options)
+        return locator.type(inp, timeout=timeout)
 
     def click(self, selector: Selector, options: SelectorOptions | None = None) -> None:
         """Click the element specified by the selector.
 
         :param selector: the selector of the element to click.
         """
-        return recursive_locator_lookup(self.page, selector, options).click()
+        locator, timeout = self._actionable_locator_lookup(selector, options)
+        return locator.click(timeout=timeout)
 
     def dblclick(self, selector: Selector, options: SelectorOptions | None = None) -> None:
         """Double click the element specified by the selector.
 
         :param selector: the selector of the element to double click.
         """
-        return recursive_locator_lookup(self.page, selector, options).dblclick()
+        locator, timeout = self._actionable_locator_lookup(selector, options)
+        return locator.dblclick(timeout=timeout)
     
     def select_option(self, selector: Selector, value: str | None = None, *, label: str | None = None, index: int | None = None, options: SelectorOptions | None = None) -> List[str]:
         """Set the value of a Selector of type select to the given option.
@@ -121,7 +213,8 @@ class BrowseTheWeb(Ability):
         :param label: the label of the option. Has to be specified explicitly.
         :param index: the index of the option. Has to be specified explicitly.
         """
-        return recursive_locator_lookup(self.page, selector, options).select_option(value=value, label=label, index=index)
+        locator, timeout = self._actionable_locator_lookup(selector, options)
+        return locator.select_option(value=value, label=label, index=index, timeout=timeout)
 
     def check_visibility_state(self, selector: Selector, mode: Literal['visible', 'hidden'], options: SelectorOptions | None = None) -> bool:
         """Validate if a locator on the page is visible or hidden.
@@ -135,11 +228,11 @@ class BrowseTheWeb(Ability):
         options = SelectorOptions() if options is None else options
 
         if mode == 'visible':
-            expect(recursive_locator_lookup(self.page, selector, options=SelectorOptions(
+            expect(recursive_locator_lookup(self.page, selector, cache=self.locator_cache, options=SelectorOptions(
                 options.has_text, options.sub_selector, options.timeout, 'visible')
             )).to_be_visible(timeout=options.timeout)
         else:
-            expect(recursive_locator_lookup(self.page, selector, options=SelectorOptions(
+            expect(recursive_locator_lookup(self.page, selector, cache=self.locator_cache, options=SelectorOptions(
                 options.has_text, options.sub_selector, options.timeout, 'hidden')
             )).to_be_hidden(timeout=options.timeout)
         return True
@@ -156,9 +249,9 @@ class BrowseTheWeb(Ability):
         timeout = None if options is None else options.timeout
 
         if mode == 'enabled':
-            expect(recursive_locator_lookup(self.page, selector, options)).to_be_enabled(timeout=timeout)
+            expect(recursive_locator_lookup(self.page, selector, options, cache=self.locator_cache)).to_be_enabled(timeout=timeout)
         else:
-            expect(recursive_locator_lookup(self.page, selector, options)).to_be_disabled(timeout=timeout)
+            expect(recursive_locator_lookup(self.page, selector, options, cache=self.locator_cache)).to_be_disabled(timeout=timeout)
         return True
     
     def check_selector_text(self, selector: Selector, text: str | Pattern, mode: Literal['has', 'has_not'], options: SelectorOptions | None = None) -> bool:
@@ -173,9 +266,9 @@ class BrowseTheWeb(Ability):
         timeout = None if options is None else options.timeout
 
         if mode == 'has':
-            expect(recursive_locator_lookup(self.page, selector, options)).to_have_text(text, timeout=timeout)
+            expect(recursive_locator_lookup(self.page, selector, options, cache=self.locator_cache)).to_have_text(text, timeout=timeout)
         else:
-            expect(recursive_locator_lookup(self.page, selector, options)).not_to_have_text(text, timeout=timeout)
+            expect(recursive_locator_lookup(self.page, selector, options, cache=self.locator_cache)).not_to_have_text(text, timeout=timeout)
         return True
     
     def check_selector_value(self, selector: Selector, value: str | Pattern, mode: Literal['has', 'has_not'], options: SelectorOptions | None = None) -> bool:
@@ -190,11 +283,32 @@ class BrowseTheWeb(Ability):
         timeout = None if options is None else options.timeout
 
         if mode == 'has':
-            expect(recursive_locator_lookup(self.page, selector, options)).to_have_value(value, timeout=timeout)
+            expect(recursive_locator_lookup(self.page, selector, options, cache=self.locator_cache)).to_have_value(value, timeout=timeout)
         else:
-            expect(recursive_locator_lookup(self.page, selector, options)).not_to_have_value(value, timeout=timeout)
+            expect(recursive_locator_lookup(self.page, selector, options, cache=self.locator_cache)).not_to_have_value(value, timeout=timeout)
         return True
 
+    def check_elements(self, checks: List[ElementCheck], timeout: float | None = None) -> bool:
+        """Validate a batch of element checks within a single page.evaluate() that polls until all checks passed or the timeout was reached.
+        Checks the page can not resolve on its own (Playwright Locators, Playwright specific selector syntax, SelectorOptions with a state,
+        or elements that may be in a shadow root) are validated one by one with Playwright afterwards.
+
+        :param checks: the checks to validate.
+        :param timeout: (optional) maximum timeout in milliseconds for all checks, including those validated with Playwright. Defaults to the longest timeout of the checks.
+        :returns: true if all checks passed. Throws an AssertionError which lists every failed check otherwise.
+        """
+        batch = ElementChecksBatch(checks, timeout)
+        if len(batch.batched) > 0:
+            batch.add_results(self.page.evaluate(ELEMENT_CHECKS_SCRIPT, batch.script_argument()))
+
+        for index in batch.single:
+            name, arguments = batch.method(index)
+            try:
+                getattr(self, name)(**arguments)
+            except (AssertionError, Error) as error:
+                batch.add_failure(index, error)
+        return batch.verify()
+
     def get_cookies(self, urls: str | List[str] = None) -> List[Cookie]:
         """Get the cookies of the current browser context. If no URLs are specified, this method returns all cookies.
         If URLs are specified, only cookies that affect those URLs are returned."""
@@ -208,6 +322,35 @@ class BrowseTheWeb(Ability):
         """Clear the browser context cookies."""
         return self.page.context.clear_cookies()
 
+    def _get_storage_state_cache(self) -> StorageStateCache:
+        if self.storage_state_cache is None:
+            raise RuntimeError('Error: no StorageStateCache configured. Use BrowseTheWeb.using(page, storage_state_cache=...).')
+        return self.storage_state_cache
+
+    def save_storage_state(self, identity: str) -> StorageState:
+        """Snapshot the cookies and web storage of the current browser context into the storage state cache.
+
+        :param identity: the identity to store the storage state for, e.g. the name of the logged in user.
+        :returns: the storage state.
+        """
+        storage_state = self.page.context.storage_state()
+        self._get_storage_state_cache().save(identity, storage_state)
+        return storage_state
+
+    def restore_storage_state(self, identity: str) -> bool:
+        """Restore the cached cookies and web storage of the given identity into the current browser context.
+
+        :param identity: the identity the storage state was stored for.
+        :returns: true if a valid storage state was restored, false if there is none cached (yet) or it has expired.
+        """
+        storage_state = self._get_storage_state_cache().load(identity)
+        if storage_state is None:
+            return False
+        if not hasattr(self.page.context, 'set_storage_state'):
+            raise RuntimeError('Error: this Playwright version can not restore a storage state into an existing context. Use StorageStateCache.new_context() instead.')
+        self.page.context.set_storage_state(storage_state)
+        return True
+
     def get_local_storage_item(self, key: str) -> object:
         """Get a local storage item.
         
@@ -242,6 +385,35 @@ class BrowseTheWeb(Ability):
             return Promise.resolve();
         }""", key)
 
+    def get_local_storage_items(self, keys: List[str]) -> Dict[str, object]:
+        """Get multiple local storage items within a single round trip.
+
+        :param keys: the keys that specify the items.
+        :returns: the items by key. Keys without an item are mapped to None.
+        """
+        return self.page.evaluate(GET_STORAGE_ITEMS_SCRIPT, {'storage': 'localStorage', 'keys': keys})
+
+    def get_all_local_storage(self) -> Dict[str, object]:
+        """Get all local storage items within a single round trip.
+
+        :returns: the items by key.
+        """
+        return self.page.evaluate(GET_STORAGE_ITEMS_SCRIPT, {'storage': 'localStorage', 'keys': None})
+
+    def set_local_storage_items(self, items: Dict[str, object]) -> None:
+        """Set multiple local storage items within a single round trip, creating new key/value pairs if none existed for a key previously.
+
+        :param items: the values by key.
+        """
+        return self.page.evaluate(SET_STORAGE_ITEMS_SCRIPT, {'storage': 'localStorage', 'items': items})
+
+    def remove_local_storage_items(self, keys: List[str]) -> None:
+        """Delete multiple local storage items within a single round trip, if key/value pairs with the given keys exist.
+
+        :param keys: the keys that specify the items.
+        """
+        return self.page.evaluate(REMOVE_STORAGE_ITEMS_SCRIPT, {'storage': 'localStorage', 'keys': keys})
+
     def get_session_storage_item(self, key: str) -> object:
         """Get a session storage item.
         
@@ -276,3 +448,32 @@ class BrowseTheWeb(Ability):
             sessionStorage.removeItem(key);
             return Promise.resolve();
         }""", key)
+
+    def get_session_storage_items(self, keys: List[str]) -> Dict[str, object]:
+        """Get multiple session storage items within a single round trip.
+
+        :param keys: the keys that specify the items.
+        :returns: the items by key. Keys without an item are mapped to None.
+        """
+        return self.page.evaluate(GET_STORAGE_ITEMS_SCRIPT, {'storage': 'sessionStorage', 'keys': keys})
+
+    def get_all_session_storage(self) -> Dict[str, object]:
+        """Get all session storage items within a single round trip.
+
+        :returns: the items by key.
+        """
+        return self.page.evaluate(GET_STORAGE_ITEMS_SCRIPT, {'storage': 'sessionStorage', 'keys': None})
+
+    def set_session_storage_items(self, items: Dict[str, object]) -> None:
+        """Set multiple session storage items within a single round trip, creating new key/value pairs if none existed for a key previously.
+
+        :param items: the values by key.
+        """
+        return self.page.evaluate(SET_STORAGE_ITEMS_SCRIPT, {'storage': 'sessionStorage', 'items': items})
+
+    def remove_session_storage_items(self, keys: List[str]) -> None:
+        """Delete multiple session storage items within a single round trip, if key/value pairs with the given keys exist.
+
+        :param keys: the keys that specify the items.
+        """
+        return self.page.evaluate(REMOVE_STORAGE_ITEMS_SCRIPT, {'storage': 'sessionStorage', 'keys': keys})
@@ -1,5 +1,6 @@
 from typing import List
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
 from playwright.sync_api import Cookie
 
@@ -13,6 +14,9 @@ class Add(Action):
     def perform_as(self, actor: Actor) -> None:
         return BrowseTheWeb.As(actor).add_cookies(cookies=self.cookies)
 
+    async def perform_as_async(self, actor: Actor) -> None:
+        return await AsyncBrowseTheWeb.As(actor).add_cookies(cookies=self.cookies)
+
     @staticmethod
     def cookies(cookies: List[Cookie]) -> "Add":
         """Add the specified cookies.
@@ -1,4 +1,5 @@
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
 from ..types import Selector, SelectorOptions
 
@@ -13,6 +14,9 @@ class Check(Action):
     def perform_as(self, actor: Actor) -> None:
         return BrowseTheWeb.As(actor).check_box(self.selector, options=self.options)
 
+    async def perform_as_async(self, actor: Actor) -> None:
+        return await AsyncBrowseTheWeb.As(actor).check_box(self.selector, options=self.options)
+
     @staticmethod
     def element(selector: Selector, options: SelectorOptions | None = None) -> "Check":
         """Specify which element should be checked.
@@ -1,4 +1,5 @@
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
 
 class Clear(Action):
@@ -7,6 +8,9 @@ class Clear(Action):
     def perform_as(self, actor: Actor) -> object:
         return BrowseTheWeb.As(actor).clear_cookies()
 
+    async def perform_as_async(self, actor: Actor) -> object:
+        return await AsyncBrowseTheWeb.As(actor).clear_cookies()
+
     @staticmethod
     def cookies() -> "Clear":
         """Clear all browser cookies."""
@@ -1,4 +1,5 @@
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
 from ..types import Selector, SelectorOptions
 
@@ -13,6 +14,9 @@ class Click(Action):
     def perform_as(self, actor: Actor) -> None:
         return BrowseTheWeb.As(actor).click(self.selector, options=self.options)
 
+    async def perform_as_async(self, actor: Actor) -> None:
+        return await AsyncBrowseTheWeb.As(actor).click(self.selector, options=self.options)
+
     @staticmethod
     def on(selector: Selector, options: SelectorOptions | None = None) -> "Click":
         """Specify which element should be clicked.
@@ -1,4 +1,5 @@
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
 from ..types import Selector, SelectorOptions
 
@@ -13,6 +14,9 @@ class DoubleClick(Action):
     def perform_as(self, actor: Actor) -> None:
         return BrowseTheWeb.As(actor).dblclick(self.selector, options=self.options)
 
+    async def perform_as_async(self, actor: Actor) -> None:
+        return await AsyncBrowseTheWeb.As(actor).dblclick(self.selector, options=self.options)
+
     @staticmethod
     def on(selector: Selector, options: SelectorOptions | None = None) -> "DoubleClick":
         """Specify which element should be clicked.
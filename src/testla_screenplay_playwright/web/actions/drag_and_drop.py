@@ -1,4 +1,5 @@
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
 from ..types import Selector, SelectorOptions
 
@@ -15,6 +16,9 @@ class DragAndDrop(Action):
     def perform_as(self, actor: Actor) -> None:
         return BrowseTheWeb.As(actor).drag_and_drop(self.source_selector, self.target_selector, source_options=self.source_options, target_options=self.target_options)
 
+    async def perform_as_async(self, actor: Actor) -> None:
+        return await AsyncBrowseTheWeb.As(actor).drag_and_drop(self.source_selector, self.target_selector, source_options=self.source_options, target_options=self.target_options)
+
     @staticmethod
     def execute(source_selector: Selector, target_selector: Selector, source_options: SelectorOptions | None = None, target_options: SelectorOptions | None = None ) -> "DragAndDrop":
         """Drag the specified source element to the specified target element and drop it.
@@ -1,4 +1,5 @@
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
 from ..types import Selector, SelectorOptions
 
@@ -14,6 +15,9 @@ class Fill(Action):
     def perform_as(self, actor: Actor) -> None:
         return BrowseTheWeb.As(actor).fill(self.selector, self.inp, options=self.options)
 
+    async def perform_as_async(self, actor: Actor) -> None:
+        return await AsyncBrowseTheWeb.As(actor).fill(self.selector, self.inp, options=self.options)
+
     @staticmethod
     def In(selector: Selector, inp: str, options: SelectorOptions | None = None) -> "Fill":
         """Finds the specified selector and will it with the specified input string.
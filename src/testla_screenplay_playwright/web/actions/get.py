@@ -1,4 +1,5 @@
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
 from typing import List, Literal
 
@@ -6,7 +7,7 @@ from typing import List, Literal
 class Get(Action):
     """Action Class. Get either Cookies, Session Storage Items or Local Storage Items from the Browser."""
 
-    def __init__(self, mode: Literal['cookies', 'session_storage', 'local_storage'], payload: str | list[str] | None):
+    def __init__(self, mode: Literal['cookies', 'session_storage', 'local_storage', 'session_storage_items', 'local_storage_items'], payload: str | list[str] | None):
         self.mode = mode
         self.payload = payload
 
@@ -17,9 +18,35 @@ class Get(Action):
             return BrowseTheWeb.As(actor).get_session_storage_item(self.payload)
         if self.mode == 'local_storage':
             return BrowseTheWeb.As(actor).get_local_storage_item(self.payload)
+        if self.mode == 'session_storage_items':
+            if self.payload is None:
+                return BrowseTheWeb.As(actor).get_all_session_storage()
+            return BrowseTheWeb.As(actor).get_session_storage_items(self.payload)
+        if self.mode == 'local_storage_items':
+            if self.payload is None:
+                return BrowseTheWeb.As(actor).get_all_local_storage()
+            return BrowseTheWeb.As(actor).get_local_storage_items(self.payload)
         else:
             raise RuntimeError('Error: no match for Get.perform_as()!')
 
+    async def perform_as_async(self, actor: Actor) -> object:
+        if self.mode == 'cookies':
+            return await AsyncBrowseTheWeb.As(actor).get_cookies(self.payload)
+        if self.mode == 'session_storage':
+            return await AsyncBrowseTheWeb.As(actor).get_session_storage_item(self.payload)
+        if self.mode == 'local_storage':
+            return await AsyncBrowseTheWeb.As(actor).get_local_storage_item(self.payload)
+        if self.mode == 'session_storage_items':
+            if self.payload is None:
+                return await AsyncBrowseTheWeb.As(actor).get_all_session_storage()
+            return await AsyncBrowseTheWeb.As(actor).get_session_storage_items(self.payload)
+        if self.mode == 'local_storage_items':
+            if self.payload is None:
+                return await AsyncBrowseTheWeb.As(actor).get_all_local_storage()
+            return await AsyncBrowseTheWeb.As(actor).get_local_storage_items(self.payload)
+        else:
+            raise RuntimeError('Error: no match for Get.perform_as_async()!')
+
     @staticmethod
     def cookies(urls: str | List[str] = None) -> "Get":
         """Get the specified cookies.
@@ -43,3 +70,29 @@ class Get(Action):
         :param key: the key that specifies the item.
         """
         return Get('local_storage', key)
+
+    @staticmethod
+    def session_storage_items(keys: List[str]) -> "Get":
+        """Get multiple session storage items at once.
+
+        :param keys: the keys that specify the items.
+        """
+        return Get('session_storage_items', keys)
+
+    @staticmethod
+    def all_session_storage() -> "Get":
+        """Get all session storage items at once."""
+        return Get('session_storage_items', None)
+
+    @staticmethod
+    def local_storage_items(keys: List[str]) -> "Get":
+        """Get multiple local storage items at once.
+
+        :param keys: the keys that specify the items.
+        """
+        return Get('local_storage_items', keys)
+
+    @staticmethod
+    def all_local_storage() -> "Get":
+        """Get all local storage items at once."""
+        return Get('local_storage_items', None)
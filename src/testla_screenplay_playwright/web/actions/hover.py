@@ -1,4 +1,5 @@
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
 from ..types import Selector, SelectorOptions
 from typing import List, Literal
@@ -15,6 +16,9 @@ class Hover(Action):
     def perform_as(self, actor: Actor) -> None:
         return BrowseTheWeb.As(actor).hover(self.selector, options=self.options, modifiers=self.modifiers)
 
+    async def perform_as_async(self, actor: Actor) -> None:
+        return await AsyncBrowseTheWeb.As(actor).hover(self.selector, options=self.options, modifiers=self.modifiers)
+
     @staticmethod
     def over(selector: Selector, options: SelectorOptions | None = None, modifiers: List[Literal['Alt', 'Control', 'Meta', 'Shift']] | None = None) -> "Hover":
         """Hover over an element specified by a selector string.
@@ -1,4 +1,5 @@
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
 
 class Navigate(Action):
@@ -10,6 +11,9 @@ class Navigate(Action):
     def perform_as(self, actor: Actor) -> object:
         return BrowseTheWeb.As(actor).goto(self.url)
 
+    async def perform_as_async(self, actor: Actor) -> object:
+        return await AsyncBrowseTheWeb.As(actor).goto(self.url)
+
     @staticmethod
     def to(url: str) -> "Navigate":
         """Use the page to navigate to the specified URL.
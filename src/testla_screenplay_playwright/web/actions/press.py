@@ -1,4 +1,5 @@
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
 
 class Press(Action):
@@ -10,6 +11,9 @@ class Press(Action):
     def perform_as(self, actor: Actor) -> None:
         return BrowseTheWeb.As(actor).press(self.inp)
 
+    async def perform_as_async(self, actor: Actor) -> None:
+        return await AsyncBrowseTheWeb.As(actor).press(self.inp)
+
     @staticmethod
     def key(inp: str) -> "Press":
         """Press a key on the keyboard. (or multiple keys with +, e.g. Shift+A)
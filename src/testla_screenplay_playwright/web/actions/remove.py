@@ -1,12 +1,13 @@
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
-from typing import Literal
+from typing import List, Literal
 
 
 class Remove(Action):
     """Action Class.  Remove either Session Storage Items or Local Storage Items from the Browser."""
 
-    def __init__(self, mode: Literal['session_storage', 'local_storage'], payload: str):
+    def __init__(self, mode: Literal['session_storage', 'local_storage', 'session_storage_items', 'local_storage_items'], payload: str | List[str]):
         self.mode = mode
         self.payload = payload
 
@@ -15,8 +16,23 @@ class Remove(Action):
             return BrowseTheWeb.As(actor).remove_session_storage_item(self.payload)
         if self.mode == 'local_storage':
             return BrowseTheWeb.As(actor).remove_local_storage_item(self.payload)
+        if self.mode == 'session_storage_items':
+            return BrowseTheWeb.As(actor).remove_session_storage_items(self.payload)
+        if self.mode == 'local_storage_items':
+            return BrowseTheWeb.As(actor).remove_local_storage_items(self.payload)
         raise RuntimeError('Error: no match for Remove.perform_as()!')
 
+    async def perform_as_async(self, actor: Actor) -> None:
+        if self.mode == 'session_storage':
+            return await AsyncBrowseTheWeb.As(actor).remove_session_storage_item(self.payload)
+        if self.mode == 'local_storage':
+            return await AsyncBrowseTheWeb.As(actor).remove_local_storage_item(self.payload)
+        if self.mode == 'session_storage_items':
+            return await AsyncBrowseTheWeb.As(actor).remove_session_storage_items(self.payload)
+        if self.mode == 'local_storage_items':
+            return await AsyncBrowseTheWeb.As(actor).remove_local_storage_items(self.payload)
+        raise RuntimeError('Error: no match for Remove.perform_as_async()!')
+
     @staticmethod
     def session_storage_item(key: str) -> "Remove":
         """Remove a session storage item.
@@ -32,3 +48,19 @@ class Remove(Action):
         :param key: the key that specifies the item.
         """
         return Remove('local_storage', key)
+
+    @staticmethod
+    def session_storage_items(keys: List[str]) -> "Remove":
+        """Remove multiple session storage items at once.
+
+        :param keys: the keys that specify the items.
+        """
+        return Remove('session_storage_items', keys)
+
+    @staticmethod
+    def local_storage_items(keys: List[str]) -> "Remove":
+        """Remove multiple local storage items at once.
+
+        :param keys: the keys that specify the items.
+        """
+        return Remove('local_storage_items', keys)
@@ -1,4 +1,5 @@
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
 from ..types import Selector, SelectorOptions
 
@@ -14,7 +15,10 @@ class Select(Action):
         self.selector_options = selector_options
         
     def perform_as(self, actor: Actor) -> None:
-        return BrowseTheWeb.As(actor).select_option(self.selector, self.value, label=self.label, index=self.index, selector_options=self.selector_options)
+        return BrowseTheWeb.As(actor).select_option(self.selector, self.value, label=self.label, index=self.index, options=self.selector_options)
+
+    async def perform_as_async(self, actor: Actor) -> None:
+        return await AsyncBrowseTheWeb.As(actor).select_option(self.selector, self.value, label=self.label, index=self.index, options=self.selector_options)
     
     @staticmethod
     def option(selector: Selector, value: str | None = None, *, label: str | None = None, index: int | None = None, selector_options: SelectorOptions | None = None):
@@ -1,16 +1,21 @@
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
-from typing import Literal
+from typing import Dict, Literal
 
 
 class Set(Action):
     """Action Class. Set either Session Storage Items or Local Storage Items on the Browser."""
 
-    def __init__(self, mode: Literal['session_storage', 'local_storage'], payload: object):
+    def __init__(self, mode: Literal['session_storage', 'local_storage', 'session_storage_items', 'local_storage_items'], payload: object):
         self.mode = mode
         self.payload = payload
 
     def perform_as(self, actor: Actor) -> object:
+        if self.mode == 'session_storage_items':
+            return BrowseTheWeb.As(actor).set_session_storage_items(self.payload)
+        if self.mode == 'local_storage_items':
+            return BrowseTheWeb.As(actor).set_local_storage_items(self.payload)
         # payload should consist of only one entry: { key: value } 
         key = [*self.payload][0]
         value = self.payload[key]
@@ -20,6 +25,20 @@ class Set(Action):
             return BrowseTheWeb.As(actor).set_local_storage_item(key, value)
         raise RuntimeError('Error: no match for Remove.perform_as()!')
 
+    async def perform_as_async(self, actor: Actor) -> object:
+        if self.mode == 'session_storage_items':
+            return await AsyncBrowseTheWeb.As(actor).set_session_storage_items(self.payload)
+        if self.mode == 'local_storage_items':
+            return await AsyncBrowseTheWeb.As(actor).set_local_storage_items(self.payload)
+        # payload should consist of only one entry: { key: value } 
+        key = [*self.payload][0]
+        value = self.payload[key]
+        if self.mode == 'session_storage':
+            return await AsyncBrowseTheWeb.As(actor).set_session_storage_item(key, value)
+        if self.mode == 'local_storage':
+            return await AsyncBrowseTheWeb.As(actor).set_local_storage_item(key, value)
+        raise RuntimeError('Error: no match for Set.perform_as_async()!')
+
     @staticmethod
     def session_storage_item(key: str, value: object) -> "Set":
         """Set a session storage item identified by the given key + value, creating a new key/value pair if none existed for key previously.
@@ -37,3 +56,19 @@ class Set(Action):
         :param value: the value of the item.
         """
         return Set('local_storage', { key: value })
+
+    @staticmethod
+    def session_storage_items(items: Dict[str, object]) -> "Set":
+        """Set multiple session storage items at once, creating new key/value pairs if none existed for a key previously.
+
+        :param items: the values of the items by key.
+        """
+        return Set('session_storage_items', items)
+
+    @staticmethod
+    def local_storage_items(items: Dict[str, object]) -> "Set":
+        """Set multiple local storage items at once, creating new key/value pairs if none existed for a key previously.
+
+        :param items: the values of the items by key.
+        """
+        return Set('local_storage_items', items)
@@ -1,4 +1,5 @@
 from testla_screenplay import Action, Actor
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
 from ..types import SelectorOptions
 from typing import Literal
@@ -19,6 +20,13 @@ class Wait(Action):
             return BrowseTheWeb.As(actor).wait_for_load_state(self.payload)
         raise RuntimeError('Error: no match for Wait.perform_as()!')
 
+    async def perform_as_async(self, actor: Actor) -> object:
+        if self.mode == 'selector':
+            return await AsyncBrowseTheWeb.As(actor).wait_for_selector(self.payload, options=self.options)
+        if self.mode == 'load_state':
+            return await AsyncBrowseTheWeb.As(actor).wait_for_load_state(self.payload)
+        raise RuntimeError('Error: no match for Wait.perform_as_async()!')
+
     @staticmethod
     def for_selector(selector: str, options: SelectorOptions | None = None) -> "Wait":
         """Wait for a specific selector to exist.
@@ -0,0 +1,289 @@
+import asyncio
+from threading import Lock
+from time import perf_counter
+from typing import Dict, List
+from playwright.sync_api import Browser, BrowserContext, Error, Page
+from playwright.async_api import Browser as AsyncBrowser, BrowserContext as AsyncBrowserContext, Page as AsyncPage
+
+# clears the web storage of the origin the page is currently on
+CLEAR_WEB_STORAGE_SCRIPT = """() => {
+    localStorage.clear();
+    sessionStorage.clear();
+}"""
+
+
+class ContextPoolMetrics:
+    """Metrics of a browser context pool."""
+
+    def __init__(self):
+        self.leases = 0
+        self.reuses = 0
+        self.created = 0
+        self.recycled = 0
+        self.total_lease_wait = 0.0
+        self.max_lease_wait = 0.0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of leases that were served by an already existing context."""
+        return self.reuses / self.leases if self.leases > 0 else 0.0
+
+    @property
+    def average_lease_wait(self) -> float:
+        """Average time in seconds a lease waited for a free context."""
+        return self.total_lease_wait / self.leases if self.leases > 0 else 0.0
+
+    def record_lease(self, wait: float, reused: bool) -> None:
+        """Count a lease."""
+        self.leases += 1
+        self.reuses += 1 if reused else 0
+        self.total_lease_wait += wait
+        self.max_lease_wait = max(self.max_lease_wait, wait)
+
+
+class PooledContext:
+    """A browser context of the pool together with its primary page."""
+
+    def __init__(self, context: BrowserContext | AsyncBrowserContext, page: Page | AsyncPage):
+        self.context = context
+        self.page = page
+        self.uses = 0
+
+
+class BrowserContextPool:
+    """Pool of warm browser contexts. Leased pages are reset on release instead of creating a new context for every test:
+    cookies and storage are cleared, extra pages are closed and the page navigates to about:blank.
+    Sync Playwright objects are bound to the thread that created them, so nobody could release a page while lease() waits:
+    lease() fails right away if all contexts are leased."""
+
+    def __init__(self, browser: Browser, size: int = 4, max_uses: int = 50, context_options: Dict | None = None):
+        """Create a pool of browser contexts.
+
+        :param browser: the browser to create the contexts with.
+        :param size: (optional) maximum number of contexts. Defaults to 4.
+        :param max_uses: (optional) number of leases after which a context is closed and replaced by a new one. Defaults to 50.
+        :param context_options: (optional) options for browser.new_context().
+        """
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self.context_options = context_options or {}
+        self.metrics = ContextPoolMetrics()
+        self._idle: List[PooledContext] = []
+        self._leased: Dict[Page, PooledContext] = {}
+        self._count = 0
+        self._lock = Lock()
+
+    def _create(self) -> PooledContext:
+        """Create a context for a slot that was already counted. The slot is given back if the creation fails."""
+        try:
+            context = self.browser.new_context(**self.context_options)
+            try:
+                page = context.new_page()
+            except Exception:
+                context.close()
+                raise
+        except Exception:
+            with self._lock:
+                self._count -= 1
+            raise
+        self.metrics.created += 1
+        return PooledContext(context, page)
+
+    def warm_up(self) -> None:
+        """Create all contexts of the pool up front."""
+        while self._count < self.size:
+            self._count += 1
+            self._idle.append(self._create())
+
+    def lease(self) -> Page:
+        """Lease the page of a free context.
+
+        :returns: the page of the leased context.
+        :raises RuntimeError: if all contexts are leased.
+        """
+        start_time = perf_counter()
+        pooled: PooledContext | None = None
+        with self._lock:
+            if len(self._idle) == 0 and self._count >= self.size:
+                raise RuntimeError(f"Error: all {self.size} browser contexts of the pool are leased. Release one or increase the size of the pool.")
+            if len(self._idle) > 0:
+                pooled = self._idle.pop()
+            else:
+                self._count += 1
+        reused = pooled is not None
+        if pooled is None:
+            pooled = self._create()
+        pooled.uses += 1
+        self._leased[pooled.page] = pooled
+        self.metrics.record_lease(perf_counter() - start_time, reused)
+        return pooled.page
+
+    def _reset(self, pooled: PooledContext) -> None:
+        for page in pooled.context.pages:
+            if page != pooled.page:
+                page.close()
+        pooled.page.unroute_all()
+        try:
+            pooled.page.evaluate(CLEAR_WEB_STORAGE_SCRIPT)
+        except Error:
+            # pages without an origin (e.g. about:blank) have no web storage
+            pass
+        pooled.context.clear_cookies()
+        pooled.context.clear_permissions()
+        if hasattr(pooled.context, 'set_storage_state'):
+            # clears the local storage and IndexedDB of all origins
+            pooled.context.set_storage_state({'cookies': [], 'origins': []})
+        pooled.page.goto('about:blank')
+
+    def release(self, page: Page) -> None:
+        """Return a leased page to the pool. The context is reset, or replaced once it reached max_uses.
+
+        :param page: the page that was returned by lease().
+        """
+        pooled = self._leased.pop(page)
+        keep = pooled.uses < self.max_uses
+        if keep:
+            try:
+                self._reset(pooled)
+            except Error:
+                # e.g. the page crashed -> replace the context
+                keep = False
+        if not keep:
+            pooled.context.close()
+            self.metrics.recycled += 1
+        with self._lock:
+            if keep:
+                self._idle.append(pooled)
+            else:
+                self._count -= 1
+
+    def close(self) -> None:
+        """Close all contexts that are not leased."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._count -= len(idle)
+        for pooled in idle:
+            pooled.context.close()
+
+
+class AsyncBrowserContextPool:
+    """Pool of warm browser contexts for the asyncio based Playwright API. See BrowserContextPool."""
+
+    def __init__(self, browser: AsyncBrowser, size: int = 4, max_uses: int = 50, context_options: Dict | None = None):
+        """Create a pool of browser contexts.
+
+        :param browser: the browser to create the contexts with.
+        :param size: (optional) maximum number of contexts. Defaults to 4.
+        :param max_uses: (optional) number of leases after which a context is closed and replaced by a new one. Defaults to 50.
+        :param context_options: (optional) options for browser.new_context().
+        """
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self.context_options = context_options or {}
+        self.metrics = ContextPoolMetrics()
+        self._idle: List[PooledContext] = []
+        self._leased: Dict[AsyncPage, PooledContext] = {}
+        self._count = 0
+        self._condition = asyncio.Condition()
+
+    async def _create(self) -> PooledContext:
+        """Create a context for a slot that was already counted. The slot is given back if the creation fails."""
+        try:
+            context = await self.browser.new_context(**self.context_options)
+            try:
+                page = await context.new_page()
+            except Exception:
+                await context.close()
+                raise
+        except Exception:
+            async with self._condition:
+                self._count -= 1
+                # a waiting lease can create a context in the freed slot
+                self._condition.notify()
+            raise
+        self.metrics.created += 1
+        return PooledContext(context, page)
+
+    async def warm_up(self) -> None:
+        """Create all contexts of the pool up front."""
+        missing = self.size - self._count
+        self._count = self.size
+        created = await asyncio.gather(*[self._create() for _ in range(missing)], return_exceptions=True)
+        self._idle.extend(pooled for pooled in created if isinstance(pooled, PooledContext))
+        for error in created:
+            if isinstance(error, BaseException):
+                raise error
+
+    async def lease(self, timeout: float | None = None) -> AsyncPage:
+        """Lease the page of a free context. Waits if all contexts are leased.
+
+        :param timeout: (optional) maximum time in seconds to wait for a free context.
+        :returns: the page of the leased context.
+        """
+        start_time = perf_counter()
+        pooled: PooledContext | None = None
+        async with self._condition:
+            try:
+                await asyncio.wait_for(self._condition.wait_for(lambda: len(self._idle) > 0 or self._count < self.size), timeout=timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Error: no browser context available within {timeout}s.")
+            if len(self._idle) > 0:
+                pooled = self._idle.pop()
+            else:
+                self._count += 1
+        reused = pooled is not None
+        if pooled is None:
+            pooled = await self._create()
+        pooled.uses += 1
+        self._leased[pooled.page] = pooled
+        self.metrics.record_lease(perf_counter() - start_time, reused)
+        return pooled.page
+
+    async def _reset(self, pooled: PooledContext) -> None:
+        for page in pooled.context.pages:
+            if page != pooled.page:
+                await page.close()
+        await pooled.page.unroute_all()
+        try:
+            await pooled.page.evaluate(CLEAR_WEB_STORAGE_SCRIPT)
+        except Error:
+            # pages without an origin (e.g. about:blank) have no web storage
+            pass
+        await pooled.context.clear_cookies()
+        await pooled.context.clear_permissions()
+        if hasattr(pooled.context, 'set_storage_state'):
+            # clears the local storage and IndexedDB of all origins
+            await pooled.context.set_storage_state({'cookies': [], 'origins': []})
+        await pooled.page.goto('about:blank')
+
+    async def release(self, page: AsyncPage) -> None:
+        """Return a leased page to the pool. The context is reset, or replaced once it reached max_uses.
+
+        :param page: the page that was returned by lease().
+        """
+        pooled = self._leased.pop(page)
+        keep = pooled.uses < self.max_uses
+        if keep:
+            try:
+                await self._reset(pooled)
+            except Error:
+                # e.g. the page crashed -> replace the context
+                keep = False
+        if not keep:
+            await pooled.context.close()
+            self.metrics.recycled += 1
+        async with self._condition:
+            if keep:
+                self._idle.append(pooled)
+            else:
+                self._count -= 1
+            self._condition.notify()
+
+    async def close(self) -> None:
+        """Close all contexts that are not leased."""
+        async with self._condition:
+            idle, self._idle = self._idle, []
+            self._count -= len(idle)
+        await asyncio.gather(*[pooled.context.close() for pooled in idle])
@@ -1,14 +1,15 @@
 from re import Pattern
 from testla_screenplay import Actor, Question
+from ..abilities.async_browse_the_web import AsyncBrowseTheWeb
 from ..abilities.browse_the_web import BrowseTheWeb
-from ..types import Selector, SelectorOptions
-from typing import Literal
+from ..types import ElementCheck, Selector, SelectorOptions
+from typing import List, Literal
 
 
 class Element(Question):
     """Question Class. Get a specified state for a selector like visible or enabled."""
 
-    def __init__(self, selector: Selector, check_mode: Literal['to_be', 'not_to_be'], mode: Literal['visible', 'enabled', 'text', 'value'], *, payload: str | Pattern | None = None, options: SelectorOptions | None = None):
+    def __init__(self, selector: Selector | None, check_mode: Literal['to_be', 'not_to_be'], mode: Literal['visible', 'enabled', 'text', 'value', 'all'], *, payload: str | Pattern | List[ElementCheck] | None = None, options: SelectorOptions | None = None):
         self.check_mode = check_mode
         self.mode = mode
         self.selector = selector
@@ -38,8 +39,57 @@ class Element(Question):
                 return BrowseTheWeb.As(actor).check_selector_value(selector=self.selector, value=self.payload, mode='has', options=self.options)
             else:
                 return BrowseTheWeb.As(actor).check_selector_value(selector=self.selector, value=self.payload, mode='has_not', options=self.options)
+        if self.mode == 'all':
+            return BrowseTheWeb.As(actor).check_elements(checks=self.payload, timeout=self.options.timeout)
         raise RuntimeError('Unknown mode: Element.answered_by')
 
+    async def answered_by_async(self, actor: Actor) -> bool:
+        if self.mode == 'visible':
+            # if the ability method is not the expected result there will be an exception
+            if self.check_mode == 'to_be':
+                return await AsyncBrowseTheWeb.As(actor).check_visibility_state(selector=self.selector, mode='visible', options=self.options)
+            else:
+                return await AsyncBrowseTheWeb.As(actor).check_visibility_state(selector=self.selector, mode='hidden', options=self.options)
+        if self.mode == 'enabled':
+            # if the ability method is not the expected result there will be an exception
+            if self.check_mode == 'to_be':
+                return await AsyncBrowseTheWeb.As(actor).check_enabled_state(selector=self.selector, mode='enabled', options=self.options)
+            else:
+                return await AsyncBrowseTheWeb.As(actor).check_enabled_state(selector=self.selector, mode='disabled', options=self.options)
+        if self.mode == 'text':
+            if self.check_mode == 'to_be':
+                return await AsyncBrowseTheWeb.As(actor).check_selector_text(selector=self.selector, text=self.payload, mode='has', options=self.options)
+            else:
+                return await AsyncBrowseTheWeb.As(actor).check_selector_text(selector=self.selector, text=self.payload, mode='has_not', options=self.options)
+        if self.mode == 'value':
+            if self.check_mode == 'to_be':
+                return await AsyncBrowseTheWeb.As(actor).check_selector_value(selector=self.selector, value=self.payload, mode='has', options=self.options)
+            else:
+                return await AsyncBrowseTheWeb.As(actor).check_selector_value(selector=self.selector, value=self.payload, mode='has_not', options=self.options)
+        if self.mode == 'all':
+            return await AsyncBrowseTheWeb.As(actor).check_elements(checks=self.payload, timeout=self.options.timeout)
+        raise RuntimeError('Unknown mode: Element.answered_by_async')
+
+    def _element_check(self) -> ElementCheck:
+        """Convert this question into a check that can be validated within a batch."""
+        return ElementCheck(self.selector, self.mode, negate=self.check_mode == 'not_to_be', expected=self.payload, options=self.options)
+
+    @staticmethod
+    def all_of(questions: List['Element'], timeout: float | None = None) -> "Element":
+        """Verifies all given Element questions at once. The checks are sent to the page together and are polled until all of them pass
+        or the timeout is reached, every failed check is reported.
+
+        :param questions: the Element questions to verify, e.g. Element.to_be_visible(...) or Element.to_have_value(...).
+        :param timeout: (optional) maximum timeout in milliseconds for all checks. Defaults to the longest timeout of the questions.
+        """
+        checks: List[ElementCheck] = []
+        for question in questions:
+            if question.mode == 'all':
+                checks.extend(question.payload)
+            else:
+                checks.append(question._element_check())
+        return Element(None, 'to_be', 'all', payload=checks, options=SelectorOptions(timeout=timeout))
+
     @staticmethod
     def to_be_visible(selector: Selector, options: SelectorOptions | None = None) -> "Element":
         """Verifies if an element is visible.
@@ -0,0 +1,97 @@
+from fnmatch import fnmatchcase
+from re import Pattern
+from typing import Dict, List, Literal
+from urllib.parse import urlsplit
+from playwright.sync_api import Error, Request
+from playwright.async_api import Request as AsyncRequest
+
+ResourceType = Literal['document', 'stylesheet', 'image', 'media', 'font', 'script', 'texttrack', 'xhr', 'fetch', 'eventsource', 'websocket', 'manifest', 'other']
+
+
+class RequestBlockingStats:
+    """Counters of a page with request blocking enabled."""
+
+    def __init__(self):
+        self.blocked = 0
+        self.allowed = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self.bytes_saved = 0
+
+    def reset(self) -> None:
+        """Reset all counters to 0."""
+        self.blocked = 0
+        self.allowed = 0
+        self.blocked_by_type = {}
+        self.bytes_saved = 0
+
+
+class RequestBlocking:
+    """Configuration which requests of a page should not be loaded, e.g. images, fonts or third party trackers the tests never look at.
+    Navigations of the main frame are never blocked."""
+
+    def __init__(self, resource_types: List[ResourceType] | None = None, url_patterns: List[str | Pattern] | None = None,
+                 allowed_domains: List[str] | None = None, blocked_domains: List[str] | None = None, estimated_bytes: Dict[str, int] | None = None):
+        """Configure the requests to block.
+
+        :param resource_types: (optional) block requests of these resource types, e.g. ['image', 'font', 'media'].
+        :param url_patterns: (optional) block requests whose URL matches one of these shell-style globs or regular expressions.
+        :param allowed_domains: (optional) only allow requests to these domains (and their subdomains), block all others.
+        :param blocked_domains: (optional) block requests to these domains (and their subdomains).
+        :param estimated_bytes: (optional) estimated size in bytes of a blocked request by resource type, used for RequestBlockingStats.bytes_saved.
+            Blocked requests are never downloaded, so their real size is unknown.
+        """
+        self.resource_types = set(resource_types or [])
+        self.url_patterns = url_patterns or []
+        self.allowed_domains = allowed_domains
+        self.blocked_domains = blocked_domains or []
+        self.estimated_bytes = estimated_bytes or {}
+
+    @staticmethod
+    def _matches_domain(host: str, domains: List[str]) -> bool:
+        return any(host == domain or host.endswith('.' + domain) for domain in domains)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """Check if a request should be blocked.
+
+        :param url: the URL of the request.
+        :param resource_type: the resource type of the request as reported by Playwright.
+        """
+        if resource_type in self.resource_types:
+            return True
+        host = urlsplit(url).hostname or ''
+        if self.allowed_domains is not None and not self._matches_domain(host, self.allowed_domains):
+            return True
+        if self._matches_domain(host, self.blocked_domains):
+            return True
+        for pattern in self.url_patterns:
+            if fnmatchcase(url, pattern) if type(pattern) is str else pattern.search(url):
+                return True
+        return False
+
+    def should_block_request(self, request: Request | AsyncRequest) -> bool:
+        """Check if a Playwright request should be blocked. Navigations of the main frame are never blocked."""
+        try:
+            if request.is_navigation_request() and request.frame.parent_frame is None:
+                return False
+        except Error:
+            # requests of service workers do not belong to a frame
+            pass
+        return self.should_block(request.url, request.resource_type)
+
+    def handle(self, stats: RequestBlockingStats, request: Request | AsyncRequest) -> bool:
+        """Decide if a Playwright request is blocked and count it in the given stats.
+
+        :returns: true if the request has to be aborted, false if it is passed on.
+        """
+        blocked = self.should_block_request(request)
+        self.record(stats, request.resource_type, blocked)
+        return blocked
+
+    def record(self, stats: RequestBlockingStats, resource_type: str, blocked: bool) -> None:
+        """Count a request in the given stats."""
+        if not blocked:
+            stats.allowed += 1
+            return
+        stats.blocked += 1
+        stats.blocked_by_type[resource_type] = stats.blocked_by_type.get(resource_type, 0) + 1
+        stats.bytes_saved += self.estimated_bytes.get(resource_type, 0)
@@ -0,0 +1,148 @@
+import json
+import os
+import re
+from contextlib import contextmanager
+from hashlib import sha256
+from pathlib import Path
+from time import sleep, time
+from typing import Callable, Iterator, Tuple
+from uuid import uuid4
+from playwright.sync_api import Browser, BrowserContext, StorageState
+
+
+def lock_identity(stat: os.stat_result) -> Tuple[int, int]:
+    """Identify a lock file. Inodes are reused right away by some file systems, the modification time tells a new lock file apart."""
+    return stat.st_ino, stat.st_mtime_ns
+
+
+class StorageStateCache:
+    """File based cache of browser storage states (cookies and web storage) keyed by a user defined identity, e.g. the user a test logs in with.
+    The files are locked while they are written, so parallel test workers can share one cache directory and only one of them has to log in."""
+
+    def __init__(self, directory: str | Path, ttl: float = 3600.0, lock_timeout: float = 60.0):
+        """Create a storage state cache.
+
+        :param directory: the directory to store the storage states in. Created if it does not exist.
+        :param ttl: (optional) time in seconds a storage state stays valid. Defaults to one hour.
+        :param lock_timeout: (optional) time in seconds to wait for another worker to release the lock of an identity. Older locks are considered stale.
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, identity: str) -> Path:
+        """Get the file the storage state of the given identity is stored in."""
+        readable = re.sub(r'[^A-Za-z0-9_.-]', '_', identity)[:64]
+        return self.directory / f"{readable}-{sha256(identity.encode('utf-8')).hexdigest()[:16]}.json"
+
+    @contextmanager
+    def lock(self, identity: str) -> Iterator[None]:
+        """Hold the lock of the given identity. Works across processes by creating a lock file exclusively."""
+        lock_path = self.path_for(identity).with_suffix('.lock')
+        start_time = time()
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                identity_of_lock = lock_identity(os.fstat(fd))
+                os.close(fd)
+                break
+            except FileExistsError:
+                try:
+                    stat = lock_path.stat()
+                except FileNotFoundError:
+                    continue
+                # break locks of crashed workers
+                if time() - stat.st_mtime > self.lock_timeout:
+                    self._break_stale_lock(lock_path, stat)
+                    continue
+                if time() - start_time > self.lock_timeout:
+                    raise TimeoutError(f"Error: could not acquire storage state lock for '{identity}' within {self.lock_timeout}s.")
+                sleep(0.05)
+        try:
+            yield
+        finally:
+            try:
+                # the lock may have been broken as stale and taken by another worker in the meantime
+                if lock_identity(lock_path.stat()) == identity_of_lock:
+                    lock_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _break_stale_lock(lock_path: Path, stale: os.stat_result) -> None:
+        """Remove a stale lock file without removing a fresh lock of another worker.
+
+        The lock is renamed to a unique name first, which only one of the workers breaking it at the same time can do. If the renamed file
+        is not the stale one, another worker broke the lock and created a fresh one in the meantime, which is put back.
+        """
+        broken_path = lock_path.with_name(f"{lock_path.name}.{os.getpid()}.{uuid4().hex}.stale")
+        try:
+            os.replace(lock_path, broken_path)
+        except FileNotFoundError:
+            # another worker broke or released it
+            return
+        if lock_identity(broken_path.stat()) != lock_identity(stale):
+            try:
+                # link fails instead of replacing a lock that was created after the rename
+                os.link(broken_path, lock_path)
+            except FileExistsError:
+                pass
+        broken_path.unlink(missing_ok=True)
+
+    def load(self, identity: str) -> StorageState | None:
+        """Get the cached storage state of the given identity.
+
+        :returns: the storage state or None if there is no storage state or it has expired.
+        """
+        path = self.path_for(identity)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                entry = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if time() - entry['saved_at'] > self.ttl:
+            return None
+        return entry['storage_state']
+
+    def save(self, identity: str, storage_state: StorageState) -> None:
+        """Store the storage state of the given identity. The file is replaced atomically, so readers never see a partial file."""
+        path = self.path_for(identity)
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump({'identity': identity, 'saved_at': time(), 'storage_state': storage_state}, file)
+        os.replace(temp_path, path)
+
+    def invalidate(self, identity: str) -> None:
+        """Remove the cached storage state of the given identity, e.g. after the session was revoked."""
+        self.path_for(identity).unlink(missing_ok=True)
+
+    def get_or_create(self, identity: str, create: Callable[[], StorageState]) -> StorageState:
+        """Get the cached storage state of the given identity or create it, e.g. by logging in via the UI.
+        Other workers asking for the same identity wait until the storage state was created instead of creating it as well.
+
+        :param identity: the identity of the storage state.
+        :param create: creates the storage state if there is no valid one cached.
+        """
+        storage_state = self.load(identity)
+        if storage_state is not None:
+            return storage_state
+        with self.lock(identity):
+            # another worker might have created it while we were waiting for the lock
+            storage_state = self.load(identity)
+            if storage_state is None:
+                storage_state = create()
+                self.save(identity, storage_state)
+        return storage_state
+
+    def new_context(self, browser: Browser, identity: str, **kwargs) -> BrowserContext:
+        """Create a new browser context that starts with the cached storage state of the given identity, if there is a valid one.
+
+        :param browser: the browser to create the context with.
+        :param identity: the identity of the storage state.
+        :param kwargs: further options for browser.new_context().
+        """
+        storage_state = self.load(identity)
+        if storage_state is not None:
+            kwargs['storage_state'] = storage_state
+        return browser.new_context(**kwargs)
@@ -30,8 +30,21 @@ class SubSelector:
 class SelectorOptions:
     """Useful options to specify further characteristics of the selector."""
 
-    def __init__(self, has_text: str | Pattern | None = None, sub_selector: SubSelector | None = None, timeout: float | None = None, state: SelectorOptionsState | None = None):
+    def __init__(self, has_text: str | Pattern | None = None, sub_selector: SubSelector | None = None, timeout: float | None = None, state: SelectorOptionsState | None = None, trust_auto_wait: bool | None = None):
         self.has_text = has_text
         self.sub_selector = sub_selector
         self.timeout = timeout
         self.state = state
+        # skip the explicit wait before actions that auto-wait anyway. None -> use the setting of the ability.
+        # the timeout is passed on to the action. the explicit wait is kept for the states 'hidden' and 'detached', which actions do not wait for.
+        self.trust_auto_wait = trust_auto_wait
+
+class ElementCheck:
+    """A single check of a batch of Element questions, see Element.all_of()."""
+
+    def __init__(self, selector: Selector, prop: Literal['visible', 'enabled', 'text', 'value'], negate: bool = False, expected: str | Pattern | None = None, options: SelectorOptions | None = None):
+        self.selector = selector
+        self.prop = prop
+        self.negate = negate
+        self.expected = expected
+        self.options = options
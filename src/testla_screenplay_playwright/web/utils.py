@@ -1,50 +1,495 @@
-from typing import Pattern
+from collections import OrderedDict
+from pathlib import Path
+from re import IGNORECASE, MULTILINE, DOTALL
+from time import monotonic
+from typing import Any, Dict, Hashable, List, Literal, Pattern, Tuple
 from playwright.sync_api import Locator, Page
-from .types import Selector, SelectorOptionsState, SubSelector, SelectorOptions, SubSelectorOptions
+from playwright.async_api import Locator as AsyncLocator, Page as AsyncPage
+from .types import ElementCheck, Selector, SelectorOptionsState, SubSelector, SelectorOptions, SubSelectorOptions
 
-def get_sublocator(locator: Locator, sub_locator: Locator, text: str | Pattern | None = None) -> Locator:
+# a compiled selector: the chain of (selector, has_text) steps to locate, the timeout and the state to wait for.
+# it does not depend on a page, so it stays valid across navigations and can be shared by pages.
+SelectorStep = Tuple[Selector, str | Pattern | None]
+CompiledSelector = Tuple[Tuple[SelectorStep, ...], float | None, SelectorOptionsState | None]
+
+def get_sublocator(locator: Locator | AsyncLocator, sub_locator: Locator | AsyncLocator | None, text: str | Pattern | None = None) -> Locator | AsyncLocator:
     """Dealing with selector == Playwright Locator and options.hasText"""
     return locator.filter(has=sub_locator, has_text=text)
 
-def sub_locator_lookup(page: Page, locator: Locator, timeout: float | None = None, sub_selector: SubSelector | None = None, state: SelectorOptionsState | None = 'visible') -> Locator:
-    resolved_locator = locator
-    # wait for selector to become visible based on timeout options
-    resolved_locator.wait_for(timeout=timeout, state=state)
-    # subSelector: if selector is a string, need to find it using page.locator(), if it is already a Playwright Locator use it directly.
-    # PROBLEM: if we use the Playwright locator directly, it does not consider the parent selector anymore -> can lead to problems regarding resolving to multiple elements   
-    if sub_selector is not None:
-        # instantiate a Dummy options object to pass recursively instead of None
-        if sub_selector.options is None:
-            sub_selector.options = SubSelectorOptions()
-
-        if type(sub_selector.selector) is str:
-            resolved_locator = resolved_locator.locator(selector_or_locator=sub_selector.selector, has_text=sub_selector.options.has_text) 
-        else:
-            resolved_locator = get_sublocator(resolved_locator, sub_locator=sub_selector.selector, text=sub_selector.options.has_text)
-        # wait for sub selector to become visible based on timeout options
-        resolved_locator.wait_for(timeout=timeout)
-
-        if sub_selector.options.sub_selector is None:
-            resolved_locator = sub_locator_lookup(
-                page=page, 
-                locator=resolved_locator, 
-                timeout=sub_selector.options.timeout, 
-                sub_selector=sub_selector.options.sub_selector,
-                state=sub_selector.options.state
-            )
-    return resolved_locator
-
-
-def recursive_locator_lookup(page: Page, selector: Selector, options: SelectorOptions | None = None) -> Locator:
-    """Find the given locator with the given SelectorOptions."""
+def chain_sub_selector(locator: Locator | AsyncLocator, sub_selector: Selector, has_text: str | Pattern | None = None) -> Locator | AsyncLocator:
+    """Chain a single sub selector level onto the given locator."""
+    # subSelector: if selector is a string, need to find it using locator.locator(), if it is already a Playwright Locator use it as filter.
+    # PROBLEM: if we use the Playwright locator directly, it does not consider the parent selector anymore -> can lead to problems regarding resolving to multiple elements
+    if type(sub_selector) is str:
+        return locator.locator(selector_or_locator=sub_selector, has_text=has_text)
+    return get_sublocator(locator, sub_locator=sub_selector, text=has_text)
+
+
+def compile_selector(selector: Selector, options: SelectorOptions | None = None) -> CompiledSelector:
+    """Compile the selector and its (nested) SelectorOptions into a flat chain of steps without talking to the browser.
+
+    Instead of waiting at every level of the sub selector chain, only the final locator is waited for.
+    The innermost level that specifies a timeout/state wins, outer levels act as fallback.
+
+    :returns: the steps of the chained locator together with the timeout and the state of the single wait.
+    """
     # check if this method was called with options == None.
-    # if this is really the case, just resolve the locator, wait for it to be visible and return it.
+    # if this is really the case, just resolve the locator and wait for it to be visible.
     if options is None:
-        locator = page.locator(selector, has_text=None) if type(selector) is str else get_sublocator(selector, sub_locator=None, text=None)
-        locator.wait_for()
-        return locator
+        return ((selector, None),), None, None
+
+    steps: List[SelectorStep] = [(selector, options.has_text)]
+    timeout = options.timeout
+    state = options.state
+
+    sub_selector = options.sub_selector
+    while sub_selector is not None:
+        steps.append((sub_selector.selector, None if sub_selector.options is None else sub_selector.options.has_text))
+        if sub_selector.options is None:
+            break
+        if sub_selector.options.timeout is not None:
+            timeout = sub_selector.options.timeout
+        if sub_selector.options.state is not None:
+            state = sub_selector.options.state
+        sub_selector = sub_selector.options.sub_selector
+
+    return tuple(steps), timeout, state
 
+
+def build_locator(page: Page | AsyncPage, steps: Tuple[SelectorStep, ...]) -> Locator | AsyncLocator:
+    """Build the chained locator of compiled steps on the given page. Locators are lazy, so this does not talk to the browser either."""
+    (selector, has_text), *sub_steps = steps
     # find first level locator: if selector is a string, need to find it using page.locator(), if it is already a Playwright Locator use it directly.
-    locator = page.locator(selector, has_text=options.has_text) if type(selector) is str else get_sublocator(selector, sub_locator=None, text=options.has_text)
-    # pass the first level locator into sub locator lookup
-    return sub_locator_lookup(page=page, locator=locator, timeout=options.timeout, sub_selector=options.sub_selector, state=options.state) 
+    locator = page.locator(selector, has_text=has_text) if type(selector) is str else get_sublocator(selector, sub_locator=None, text=has_text)
+    for sub_selector, sub_has_text in sub_steps:
+        locator = chain_sub_selector(locator, sub_selector, sub_has_text)
+    return locator
+
+
+def selector_key(selector: Selector, options: SelectorOptions | SubSelectorOptions | None = None) -> Hashable:
+    """Build a hashable representation of the selector and the options that determine the compiled selector."""
+    if options is None:
+        return (selector,)
+    sub_selector = options.sub_selector
+    sub_key = None if sub_selector is None else selector_key(sub_selector.selector, sub_selector.options)
+    return (selector, options.has_text, options.timeout, options.state, sub_key)
+
+
+class LocatorCache:
+    """Bounded LRU cache of compiled selectors. It saves walking the SelectorOptions again when the same selector is used by multiple actions.
+    Only the page independent steps are cached, the locator itself is built for every lookup, so the cache never has to be invalidated."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, CompiledSelector] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def compile(self, selector: Selector, options: SelectorOptions | None = None) -> CompiledSelector:
+        """Get the compiled selector from the cache or compile it and store it."""
+        try:
+            key = selector_key(selector, options)
+            compiled = self._entries.get(key)
+        except TypeError:
+            # unhashable selector or option values can not be cached
+            self.misses += 1
+            return compile_selector(selector, options)
+
+        if compiled is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return compiled
+
+        self.misses += 1
+        compiled = compile_selector(selector, options)
+        if self.maxsize > 0:
+            self._entries[key] = compiled
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        """Remove all compiled selectors. The hit and miss counters are kept."""
+        self._entries.clear()
+
+
+def locate(page: Page | AsyncPage, selector: Selector, options: SelectorOptions | None = None,
+           cache: LocatorCache | None = None) -> Tuple[Locator | AsyncLocator, float | None, SelectorOptionsState | None]:
+    """Build the locator of the given selector and SelectorOptions on the page without waiting for it.
+
+    :param cache: (optional) the cache to get the compiled selector from.
+    :returns: the locator together with the timeout and the state to wait for.
+    """
+    steps, timeout, state = compile_selector(selector, options) if cache is None else cache.compile(selector, options)
+    return build_locator(page, steps), timeout, state
+
+
+def trusts_auto_wait(trust_auto_wait: bool, options: SelectorOptions | None = None, state: SelectorOptionsState | None = None) -> bool:
+    """Check if the explicit wait before an auto-waiting Playwright action can be skipped.
+
+    :param trust_auto_wait: the setting of the ability.
+    :param options: the SelectorOptions which can override the setting of the ability.
+    :param state: (optional) the state of the compiled selector. Actions only wait for the element to be attached and visible,
+        so the explicit wait is kept for 'hidden' and 'detached'.
+    """
+    if state in ('hidden', 'detached'):
+        return False
+    if options is not None and options.trust_auto_wait is not None:
+        return options.trust_auto_wait
+    return trust_auto_wait
+
+
+def recursive_locator_lookup(page: Page, selector: Selector, options: SelectorOptions | None = None, wait: bool = True, cache: LocatorCache | None = None) -> Locator:
+    """Find the given locator with the given SelectorOptions.
+
+    :param wait: (optional) wait for the locator to reach the expected state. Defaults to True.
+    :param cache: (optional) the cache to get the compiled selector from.
+    """
+    locator, timeout, state = locate(page, selector, options, cache)
+    if wait:
+        locator.wait_for(timeout=timeout, state=state)
+    return locator
+
+
+async def async_recursive_locator_lookup(page: AsyncPage, selector: Selector, options: SelectorOptions | None = None, wait: bool = True, cache: LocatorCache | None = None) -> AsyncLocator:
+    """Find the given locator with the given SelectorOptions. Asynchronous variant of recursive_locator_lookup.
+
+    :param wait: (optional) wait for the locator to reach the expected state. Defaults to True.
+    :param cache: (optional) the cache to get the compiled selector from.
+    """
+    locator, timeout, state = locate(page, selector, options, cache)
+    if wait:
+        await locator.wait_for(timeout=timeout, state=state)
+    return locator
+
+
+# bulk storage access: the storage ('localStorage' or 'sessionStorage') is passed by name, values are stored as JSON like the single item methods do.
+# all keys are handled within one page.evaluate() round trip.
+GET_STORAGE_ITEMS_SCRIPT = """({ storage, keys }) => {
+    const target = window[storage];
+    const items = {};
+    for (const key of keys === null ? Object.keys(target) : keys) {
+        const value = target.getItem(key);
+        if (value === null) {
+            items[key] = undefined;
+            continue;
+        }
+        try {
+            items[key] = JSON.parse(value);
+        } catch (e) {
+            // value was not written by us and is not JSON
+            items[key] = value;
+        }
+    }
+    return Promise.resolve(items);
+}"""
+
+SET_STORAGE_ITEMS_SCRIPT = """({ storage, items }) => {
+    const target = window[storage];
+    for (const [key, value] of Object.entries(items)) {
+        target.setItem(key, JSON.stringify(value));
+    }
+    return Promise.resolve();
+}"""
+
+REMOVE_STORAGE_ITEMS_SCRIPT = """({ storage, keys }) => {
+    const target = window[storage];
+    for (const key of keys) {
+        target.removeItem(key);
+    }
+    return Promise.resolve();
+}"""
+
+# default timeout of Playwright's expect() in milliseconds
+DEFAULT_EXPECT_TIMEOUT = 5000.0
+
+# evaluates a batch of element checks inside the page and polls until all of them pass or the deadline is reached.
+# selectors are resolved with document queries (CSS and XPath), checks with selectors the page can not resolve are reported as unsupported.
+# document queries do not look into shadow roots like Playwright's CSS selectors do: if the page has shadow roots, checks whose element
+# is not found are reported as unsupported as well, so Playwright validates them.
+ELEMENT_CHECKS_SCRIPT = """async ({ checks, timeout }) => {
+    const deadline = Date.now() + timeout;
+    const normalize = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+    const matchesText = (text, expected, fullMatch) => {
+        if (expected === null) {
+            return true;
+        }
+        if (typeof expected === 'object') {
+            return new RegExp(expected.source, expected.flags).test(text || '');
+        }
+        if (fullMatch) {
+            return normalize(text) === normalize(expected);
+        }
+        return normalize(text).toLowerCase().includes(normalize(expected).toLowerCase());
+    };
+    const query = (roots, selector, hasText) => {
+        const found = [];
+        for (const root of roots) {
+            if (selector.startsWith('xpath=') || selector.startsWith('/') || selector.startsWith('..')) {
+                let expression = selector.startsWith('xpath=') ? selector.substring(6) : selector;
+                // like Playwright, absolute xpath expressions are relative to the parent element
+                if (expression.startsWith('/') && root !== document) {
+                    expression = '.' + expression;
+                }
+                const result = document.evaluate(expression, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                for (let i = 0; i < result.snapshotLength; i++) {
+                    found.push(result.snapshotItem(i));
+                }
+            } else {
+                found.push(...root.querySelectorAll(selector.startsWith('css=') ? selector.substring(4) : selector));
+            }
+        }
+        return [...new Set(found)].filter((element) => matchesText(element.textContent, hasText, false));
+    };
+    const isVisible = (element) => {
+        if (getComputedStyle(element).visibility !== 'visible') {
+            return false;
+        }
+        const rect = element.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    };
+    const isDisabled = (element) => {
+        const formControl = ['BUTTON', 'INPUT', 'SELECT', 'TEXTAREA', 'OPTION', 'OPTGROUP'].includes(element.tagName);
+        if (formControl && element.hasAttribute('disabled')) {
+            return true;
+        }
+        const fieldset = formControl ? element.closest('fieldset[disabled]') : null;
+        if (fieldset && !fieldset.querySelector(':scope > legend')?.contains(element)) {
+            return true;
+        }
+        return element.closest('[aria-disabled="true"]') !== null;
+    };
+    const hasShadowRoots = () => [...document.querySelectorAll('*')].some((element) => element.shadowRoot !== null);
+    const describe = (value) => typeof value === 'object' && value !== null ? `/${value.source}/${value.flags}` : JSON.stringify(value);
+    const evaluate = (check) => {
+        let elements = query([document], check.selector, check.hasText);
+        for (const subSelector of check.subSelectors) {
+            elements = query(elements, subSelector.selector, subSelector.hasText);
+        }
+        if (elements.length > 1) {
+            return `resolved to ${elements.length} elements`;
+        }
+        const element = elements[0];
+        if (element === undefined && hasShadowRoots()) {
+            throw new Error('element not found outside of shadow roots');
+        }
+        if (check.prop === 'visible') {
+            const visible = element !== undefined && isVisible(element);
+            if (visible !== check.negate) {
+                return null;
+            }
+            return check.negate ? 'is visible' : (element === undefined ? 'element not found' : 'is not visible');
+        }
+        if (element === undefined) {
+            return 'element not found';
+        }
+        let actual;
+        let passed;
+        if (check.prop === 'enabled') {
+            actual = isDisabled(element) ? 'disabled' : 'enabled';
+            passed = actual === 'enabled';
+        } else if (check.prop === 'text') {
+            actual = element.textContent;
+            passed = matchesText(actual, check.expected, true);
+        } else {
+            actual = element.value;
+            passed = typeof check.expected === 'object' ? matchesText(actual, check.expected, true) : actual === check.expected;
+        }
+        if (passed !== check.negate) {
+            return null;
+        }
+        if (check.prop === 'enabled') {
+            return `is ${actual}`;
+        }
+        return `${check.negate ? 'unexpectedly has' : 'expected'} ${check.prop} ${describe(check.expected)}, received ${describe(actual)}`;
+    };
+
+    const pending = new Map(checks.map((check, index) => [index, check]));
+    const failures = new Map();
+    while (true) {
+        for (const [index, check] of pending) {
+            try {
+                const error = evaluate(check);
+                if (error === null) {
+                    pending.delete(index);
+                    failures.delete(index);
+                } else {
+                    failures.set(index, { index, error, unsupported: false });
+                }
+            } catch (e) {
+                // the selector uses a Playwright specific syntax the page can not resolve, or the element may be in a shadow root
+                pending.delete(index);
+                failures.set(index, { index, error: String(e), unsupported: true });
+            }
+        }
+        if ([...failures.values()].every((failure) => failure.unsupported) || Date.now() >= deadline) {
+            return [...failures.values()];
+        }
+        await new Promise((resolve) => setTimeout(resolve, 100));
+    }
+}"""
+
+
+def serialize_text(text: str | Pattern | None) -> str | Dict[str, str] | None:
+    """Convert a text or a regular expression into a value that can be passed to the page."""
+    if text is None or type(text) is str:
+        return text
+    flags = ''
+    if text.flags & IGNORECASE:
+        flags += 'i'
+    if text.flags & MULTILINE:
+        flags += 'm'
+    if text.flags & DOTALL:
+        flags += 's'
+    return {'source': text.pattern, 'flags': flags}
+
+
+def serialize_element_check(check: ElementCheck) -> Dict | None:
+    """Convert an element check into a value that can be passed to the page.
+
+    :returns: the serialized check or None if the check uses Playwright Locators which only Playwright can resolve,
+        or a state, which only Playwright waits for.
+    """
+    if type(check.selector) is not str or (check.options is not None and check.options.state is not None):
+        return None
+    sub_selectors: List[Dict] = []
+    sub_selector = None if check.options is None else check.options.sub_selector
+    while sub_selector is not None:
+        if type(sub_selector.selector) is not str or (sub_selector.options is not None and sub_selector.options.state is not None):
+            return None
+        sub_selectors.append({
+            'selector': sub_selector.selector,
+            'hasText': None if sub_selector.options is None else serialize_text(sub_selector.options.has_text),
+        })
+        sub_selector = None if sub_selector.options is None else sub_selector.options.sub_selector
+    return {
+        'selector': check.selector,
+        'hasText': None if check.options is None else serialize_text(check.options.has_text),
+        'subSelectors': sub_selectors,
+        'prop': check.prop,
+        'negate': check.negate,
+        'expected': serialize_text(check.expected),
+    }
+
+
+def element_checks_timeout(checks: List[ElementCheck], timeout: float | None = None) -> float:
+    """Get the deadline for a batch of element checks: the given timeout, otherwise the longest timeout of the checks."""
+    if timeout is not None:
+        return timeout
+    timeouts = [check.options.timeout for check in checks if check.options is not None and check.options.timeout is not None]
+    return max(timeouts, default=DEFAULT_EXPECT_TIMEOUT)
+
+
+def limit_timeouts(options: SelectorOptions | None, timeout: float) -> SelectorOptions:
+    """Copy the SelectorOptions with every timeout of the sub selector chain limited to the given timeout, e.g. to the time left of a batch.
+
+    :param timeout: the maximum timeout in milliseconds. Must be positive, since a timeout of 0 disables the timeout in Playwright.
+    """
+    options = SelectorOptions() if options is None else options
+    return SelectorOptions(options.has_text, limit_sub_selector_timeouts(options.sub_selector, timeout),
+                           timeout if options.timeout is None else min(options.timeout, timeout), options.state, options.trust_auto_wait)
+
+
+def limit_sub_selector_timeouts(sub_selector: SubSelector | None, timeout: float) -> SubSelector | None:
+    """Copy the sub selector chain with every timeout limited to the given timeout."""
+    if sub_selector is None or sub_selector.options is None:
+        return sub_selector
+    options = sub_selector.options
+    return SubSelector(sub_selector.selector, SubSelectorOptions(options.has_text, None if options.timeout is None else min(options.timeout, timeout),
+                                                                 limit_sub_selector_timeouts(options.sub_selector, timeout), options.state))
+
+
+def describe_element_check(check: ElementCheck) -> str:
+    """Describe the check like the Element question that created it."""
+    question = f"Element.{'not_to' if check.negate else 'to'}_{'be' if check.prop in ('visible', 'enabled') else 'have'}_{check.prop}"
+    selector = check.selector if type(check.selector) is str else str(check.selector)
+    has_text = None if check.options is None else check.options.has_text
+    return f"{question}({selector!r}{'' if has_text is None else f', has_text={has_text!r}'})"
+
+
+def element_checks_failure_message(checks: List[ElementCheck], failures: Dict[int, str]) -> str:
+    """Build one message that reports every failed check of a batch."""
+    lines = [f"{len(failures)} of {len(checks)} element checks failed:"]
+    for index in sorted(failures):
+        lines.append(f"  - {describe_element_check(checks[index])}: {failures[index]}")
+    return '\n'.join(lines)
+
+
+def element_check_method(check: ElementCheck, options: SelectorOptions) -> Tuple[str, Dict[str, Any]]:
+    """Map an element check to the check method of BrowseTheWeb/AsyncBrowseTheWeb that validates it with Playwright.
+
+    :returns: the name of the method and its keyword arguments.
+    """
+    if check.prop == 'visible':
+        return 'check_visibility_state', {'selector': check.selector, 'mode': 'hidden' if check.negate else 'visible', 'options': options}
+    if check.prop == 'enabled':
+        return 'check_enabled_state', {'selector': check.selector, 'mode': 'disabled' if check.negate else 'enabled', 'options': options}
+    if check.prop == 'text':
+        return 'check_selector_text', {'selector': check.selector, 'text': check.expected, 'mode': 'has_not' if check.negate else 'has', 'options': options}
+    return 'check_selector_value', {'selector': check.selector, 'value': check.expected, 'mode': 'has_not' if check.negate else 'has', 'options': options}
+
+
+class ElementChecksBatch:
+    """Bookkeeping of check_elements(): which checks the page validates in one page.evaluate(), which are left to Playwright,
+    their shared deadline and the failures. BrowseTheWeb and AsyncBrowseTheWeb only do the round trips."""
+
+    def __init__(self, checks: List[ElementCheck], timeout: float | None = None):
+        self.checks = checks
+        self.serialized = [serialize_element_check(check) for check in checks]
+        self.batched = [index for index, check in enumerate(self.serialized) if check is not None]
+        self.single = [index for index, check in enumerate(self.serialized) if check is None]
+        self.failures: Dict[int, str] = {}
+        # the batch and the checks validated with Playwright afterwards share one deadline
+        self.timeout = element_checks_timeout(checks, timeout)
+        self._deadline = monotonic() + self.timeout / 1000
+
+    def script_argument(self) -> Dict[str, Any]:
+        """Get the argument of ELEMENT_CHECKS_SCRIPT."""
+        return {'checks': [self.serialized[index] for index in self.batched], 'timeout': self.timeout}
+
+    def add_results(self, results: List[Dict[str, Any]]) -> None:
+        """Record the results of ELEMENT_CHECKS_SCRIPT. Checks the page could not resolve are left to Playwright."""
+        for result in results:
+            if result['unsupported']:
+                self.single.append(self.batched[result['index']])
+            else:
+                self.failures[self.batched[result['index']]] = result['error']
+
+    def method(self, index: int) -> Tuple[str, Dict[str, Any]]:
+        """Get the check method and its arguments that validate a single check within the time left."""
+        # at least 1 ms, a timeout of 0 would disable the timeout
+        remaining = max(1.0, (self._deadline - monotonic()) * 1000)
+        check = self.checks[index]
+        return element_check_method(check, limit_timeouts(check.options, remaining))
+
+    def add_failure(self, index: int, error: BaseException) -> None:
+        self.failures[index] = str(error).strip().splitlines()[0]
+
+    def verify(self) -> bool:
+        """Raise an AssertionError which lists every failed check.
+
+        :returns: true if all checks passed.
+        """
+        if len(self.failures) > 0:
+            raise AssertionError(element_checks_failure_message(self.checks, self.failures))
+        return True
+
+
+def har_routing(har: str | Path, mode: Literal['record', 'replay', 'auto'], not_found: Literal['abort', 'fallback'],
+                url: str | Pattern | None) -> Tuple[Literal['record', 'replay'], Dict[str, Any]]:
+    """Resolve the HAR mode of use_har() and create the directory of a HAR file to record.
+
+    :returns: the mode that is used and the keyword arguments of page.route_from_har().
+    """
+    if mode == 'auto':
+        mode = 'replay' if Path(har).exists() else 'record'
+    if mode == 'record':
+        Path(har).parent.mkdir(parents=True, exist_ok=True)
+        return mode, {'har': har, 'url': url, 'update': True, 'update_content': 'embed', 'update_mode': 'minimal'}
+    if mode == 'replay':
+        return mode, {'har': har, 'url': url, 'not_found': not_found}
+    raise RuntimeError('Error: HAR mode not supported.')
+
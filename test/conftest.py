@@ -0,0 +1,45 @@
+import asyncio
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import Any, Callable, Coroutine, Iterator, TypeVar
+
+T = TypeVar('T')
+
+
+@pytest.fixture
+def run_async() -> Callable[[Coroutine[Any, Any, T]], T]:
+    """Run a coroutine on a new event loop in a worker thread. The sync playwright fixtures keep an event loop running
+    in the main thread once they were used, where asyncio.run() is not allowed."""
+    def run(coroutine: Coroutine[Any, Any, T]) -> T:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+    return run
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers /items with a small JSON body and everything else with 500."""
+
+    def do_GET(self):
+        status = 200 if self.path == '/items' else 500
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(b'{"items": [1, 2, 3]}')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_server(request: pytest.FixtureRequest) -> Iterator[str]:
+    """Serve requests on a free local port, so tests do not depend on the internet. Answers with StubHandler unless another
+    handler is passed by indirect parametrization: @pytest.mark.parametrize('stub_server', [MyHandler], indirect=True)
+
+    :returns: the base URL of the server.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), getattr(request, 'param', StubHandler))
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
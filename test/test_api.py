@@ -1,4 +1,10 @@
+import dataclasses
+import hashlib
+import json
 import pytest
+import re
+import sys
+from typing import Hashable, List
 from playwright.sync_api import Playwright
 from testla_screenplay import Actor
 
@@ -9,7 +15,14 @@ from src.testla_screenplay_playwright.api.actions.head import Head
 from src.testla_screenplay_playwright.api.actions.patch import Patch
 from src.testla_screenplay_playwright.api.actions.post import Post
 from src.testla_screenplay_playwright.api.actions.put import Put
-from src.testla_screenplay_playwright.api.types import Response, ResponseBodyFormat
+from src.testla_screenplay_playwright.api.http_cache import HttpCache
+from src.testla_screenplay_playwright.api.json_path import compile_json_path, first_mismatch
+from src.testla_screenplay_playwright.api.questions.latency import Latency, latency_samples
+from src.testla_screenplay_playwright.api.questions.response import Response as ResponseQuestion
+from src.testla_screenplay_playwright.api.schema import SCHEMA_VALIDATORS, SchemaError, SchemaValidatorCache
+from src.testla_screenplay_playwright.api.request_context_pool import APIRequestContextPool
+from src.testla_screenplay_playwright.api.types import RawResponse, RequestFile, Response, ResponseBodyFormat, ResponseTiming
+from src.testla_screenplay_playwright.api.utils import request_body_size
 
 
 # execute tests with: pytest <file> --headed
@@ -111,4 +124,292 @@ class TestAPI:
         )
 
         assert response.status == 200
-        assert response.body is None
\ No newline at end of file
+        assert response.body is None
+
+    def test_request_context_pool(self, playwright: Playwright):
+        pool = APIRequestContextPool(playwright, max_contexts=2)
+        first_actor = Actor.named("First Actor").can(UseAPI.from_pool(pool, base_url='https://jsonplaceholder.typicode.com'))
+        second_actor = Actor.named("Second Actor").can(UseAPI.from_pool(pool, base_url='https://jsonplaceholder.typicode.com'))
+
+        # both actors share one context
+        assert UseAPI.As(first_actor).get_request_context() == UseAPI.As(second_actor).get_request_context()
+        response: Response = first_actor.attempts_to(Get.From('/posts/1'))
+        assert response.status == 200
+        response = second_actor.attempts_to(Get.From('/posts/2'))
+        assert response.status == 200
+
+        UseAPI.As(first_actor).release()
+        UseAPI.As(second_actor).release()
+        assert pool.stats.created == 1
+        assert pool.stats.reuses == 1
+        pool.dispose()
+
+    def test_request_context_pool_exhausted(self, playwright: Playwright):
+        pool = APIRequestContextPool(playwright, max_contexts=1)
+        ability = UseAPI.from_pool(pool, base_url='https://jsonplaceholder.typicode.com')
+
+        # the only context is in use, so the pool fails instead of waiting forever
+        with pytest.raises(RuntimeError):
+            UseAPI.from_pool(pool, base_url='https://zippopotam.us')
+
+        ability.release()
+        UseAPI.from_pool(pool, base_url='https://zippopotam.us').release()
+        assert pool.stats.disposed == 1
+        pool.dispose()
+
+    def test_binary_body(self):
+        text: Response = self.actor.attempts_to(
+            Get.From('https://jsonplaceholder.typicode.com/posts').with_response_body_format(ResponseBodyFormat.TEXT),
+        )
+        expected_sha256 = hashlib.sha256(text.body.encode('utf-8')).hexdigest()
+
+        buffer: Response = self.actor.attempts_to(
+            Get.From('https://jsonplaceholder.typicode.com/posts').with_response_body_format(ResponseBodyFormat.BUFFER),
+        )
+        assert buffer.body == text.body.encode('utf-8')
+        assert buffer.sha256 == expected_sha256
+
+        file: Response = self.actor.attempts_to(
+            Get.From('https://jsonplaceholder.typicode.com/posts').with_response_body_format(ResponseBodyFormat.FILE),
+        )
+        assert file.body.path.read_bytes() == text.body.encode('utf-8')
+        assert file.body.size == len(text.body.encode('utf-8'))
+        assert file.sha256 == expected_sha256
+        file.body.path.unlink()
+
+    def test_lazy_body(self, playwright: Playwright):
+        decoded: List[bytes] = []
+
+        def json_decoder(raw: bytes) -> object:
+            decoded.append(raw)
+            return json.loads(raw)
+
+        actor = Actor.named("Lazy Actor").can(UseAPI.using(request_context=playwright.request.new_context(), json_decoder=json_decoder))
+        response: Response = actor.attempts_to(
+            Get.From('https://jsonplaceholder.typicode.com/posts/1'),
+        )
+
+        # checking the status does not decode the body
+        assert response.status == 200
+        assert len(decoded) == 0
+        # the body is decoded once on first access
+        assert response.body['id'] == 1
+        assert response.body['userId'] == 1
+        assert len(decoded) == 1
+
+    def test_timing(self):
+        response: Response = self.actor.attempts_to(
+            Get.From('https://jsonplaceholder.typicode.com/posts/1'),
+        )
+
+        assert response.timing.headers_ns > 0
+        assert response.timing.body_ns > 0
+        # duration is in milliseconds
+        assert response.duration == (response.timing.headers_ns + response.timing.body_ns) / 1_000_000
+        # the body is decoded lazily
+        assert response.timing.decode_ns is None
+        assert response.body['id'] == 1
+        assert response.timing.decode_ns > 0
+
+    def test_http_cache(self, playwright: Playwright):
+        actor = Actor.named("Caching Actor").can(UseAPI.using(request_context=playwright.request.new_context()).with_http_cache())
+
+        first: Response = actor.attempts_to(Get.From('https://jsonplaceholder.typicode.com/posts/1'))
+        # revalidated with If-None-Match and served from the cache on 304
+        second: Response = actor.attempts_to(Get.From('https://jsonplaceholder.typicode.com/posts/1'))
+        assert first.body == second.body
+        assert second.status == 200
+        assert UseAPI.As(actor).get_http_cache_stats() == {'hits': 1, 'misses': 1, 'not_modified': 1}
+
+        # within the ttl the cached response is served without a request
+        ttl_actor = Actor.named("TTL Actor").can(UseAPI.using(request_context=playwright.request.new_context()).with_http_cache(HttpCache(ttl=60)))
+        ttl_actor.attempts_to(Get.From('https://jsonplaceholder.typicode.com/posts/2'))
+        cached: Response = ttl_actor.attempts_to(Get.From('https://jsonplaceholder.typicode.com/posts/2'))
+        assert cached.body['id'] == 2
+        # the timing is the one of the cache lookup, the response is left out of latency statistics
+        assert cached.timing.cached
+        assert UseAPI.As(ttl_actor).get_http_cache_stats()['hits'] == 1
+
+    def test_http_cache_control(self, monkeypatch: pytest.MonkeyPatch):
+        now = [100.0]
+        monkeypatch.setattr('src.testla_screenplay_playwright.api.http_cache.monotonic', lambda: now[0])
+        cache = HttpCache(ttl=60)
+
+        def store(path: str, cache_control: str, etag: str | None = None) -> Hashable:
+            headers = {'cache-control': cache_control} if etag is None else {'cache-control': cache_control, 'etag': etag}
+            key = cache.key(path)
+            cache.update(key, RawResponse(200, headers, b'{}'))
+            return key
+
+        # max-age shortens the ttl
+        short = store('/short', 'max-age=10')
+        # the ttl is an upper bound for a longer max-age
+        long = store('/long', 'public, max-age=3600')
+        # no-cache is stored for revalidation, but never served without a request
+        revalidated = store('/revalidated', 'no-cache', etag='"1"')
+        assert store('/private', 'private, max-age=60') not in cache._entries
+        assert store('/no-store', 'no-store') not in cache._entries
+        assert store('/no-cache', 'no-cache') not in cache._entries
+
+        cached = cache.fresh(short)
+        assert cached.cached
+        assert cached.headers_ns > 0
+        assert cache.fresh(long) is not None
+        assert cache.fresh(revalidated) is None
+        assert cache.conditional_headers(revalidated, None) == {'If-None-Match': '"1"'}
+
+        now[0] += 30
+        assert cache.fresh(short) is None
+        assert cache.fresh(long) is not None
+        now[0] += 31
+        assert cache.fresh(long) is None
+        assert len(latency_samples([Response(None, 200, {}, 0.1, timing=ResponseTiming(100_000, 0, cached=True))])) == 0
+
+    def test_latency(self):
+        responses: List[Response] = [
+            self.actor.attempts_to(Get.From('https://jsonplaceholder.typicode.com/posts/1')) for _ in range(5)
+        ]
+
+        assert self.actor.asks(ResponseQuestion.has_been_received_within(responses[0], 10_000))
+        assert self.actor.asks(ResponseQuestion.has_not_been_received_within(responses[0], 0))
+        assert self.actor.asks(Latency.has_percentile_within(responses, 95, 10_000))
+        assert self.actor.asks(Latency.has_not_percentile_within(responses, 50, 0))
+        assert self.actor.asks(Latency.has_mean_within(responses, 10_000))
+        # the request is sent 5 times
+        assert self.actor.asks(Latency.has_max_within(Get.From('https://jsonplaceholder.typicode.com/posts/1'), 10_000, times=5))
+
+        exceeded = False
+        try:
+            self.actor.asks(Latency.has_percentile_within(responses, 95, 0))
+        except AssertionError:
+            exceeded = True
+        assert exceeded
+
+    def test_matches_schema(self):
+        schema = {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": { "type": "integer", "minimum": 1 },
+                    "userId": { "type": "integer" },
+                    "title": { "type": "string" },
+                    "body": { "type": "string" },
+                },
+                "required": ["id", "userId", "title", "body"],
+            },
+        }
+        response: Response = self.actor.attempts_to(Get.From('https://jsonplaceholder.typicode.com/posts'))
+
+        misses = SCHEMA_VALIDATORS.misses
+        assert self.actor.asks(ResponseQuestion.matches_schema(response, schema))
+        assert self.actor.asks(ResponseQuestion.matches_schema(response, schema))
+        # the schema was compiled once
+        assert SCHEMA_VALIDATORS.misses == misses + 1
+
+        wrong_schema = { "type": "array", "items": { "properties": { "id": { "type": "string" } } } }
+        assert self.actor.asks(ResponseQuestion.does_not_match_schema(response, wrong_schema))
+        message = ''
+        try:
+            self.actor.asks(ResponseQuestion.matches_schema(response, wrong_schema))
+        except AssertionError as error:
+            message = str(error)
+        # the error reports the failing JSON path
+        assert '$[0].id' in message
+
+    def test_schema_validator_cache(self):
+        pytest.importorskip('jsonschema')
+        cache = SchemaValidatorCache()
+        schema = { "type": "object", "properties": { "items": { "type": "array", "items": { "type": "integer" } } }, "required": ["items"] }
+
+        assert cache.errors(schema, { "items": [1, 2] }) == []
+        errors = cache.errors(schema, { "items": [1, "2", "3"] }, limit=1)
+        assert [error.path for error in errors] == ['$.items[1]']
+        # the schema object is found by its identity, an equal schema object by its content
+        assert cache.errors(json.loads(json.dumps(schema)), {}) == [SchemaError('$', "'items' is a required property")]
+        assert (cache.misses, cache.hits) == (1, 2)
+
+        # a compiled schema skips the cache
+        compiled = cache.validator(schema)
+        assert SchemaValidatorCache().errors(compiled, { "items": [] }) == []
+
+    def test_schema_without_jsonschema(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setitem(sys.modules, 'jsonschema.validators', None)
+
+        with pytest.raises(RuntimeError, match='pip install jsonschema'):
+            SchemaValidatorCache().errors({ "type": "object" }, {})
+
+    def test_has_body_matching(self):
+        response: Response = self.actor.attempts_to(Get.From('https://jsonplaceholder.typicode.com/posts'))
+
+        assert self.actor.asks(ResponseQuestion.has_body_matching(response, {
+            "$[0].id": 1,
+            "$[0].userId": 1,
+            "$[-1].id": 100,
+            "$[0].title": re.compile('^sunt'),
+        }))
+        assert self.actor.asks(ResponseQuestion.has_not_body_matching(response, { "$[0].id": 2 }))
+        # paths that do not exist never match
+        assert self.actor.asks(ResponseQuestion.has_not_body_matching(response, { "$[100].id": 101 }))
+
+    def test_first_mismatch(self):
+        body = { "a": { "b": True, "c": [1, False] } }
+
+        assert first_mismatch(body, { "$.a": { "b": True, "c": [1, False] } }) is None
+        # true is not equal to 1 in nested objects and arrays either
+        assert first_mismatch(body, { "$.a": { "b": 1, "c": [1, False] } }) == ('$.a', body['a'], { "b": 1, "c": [1, False] })
+        assert first_mismatch(body, { "$.a.c": [True, False] }) is not None
+        assert first_mismatch(body, { "$.a.c": [1, 0] }) is not None
+        assert first_mismatch({ "a": { "b": 1 } }, { "$.a": { "b": 1.0 } }) is None
+
+    def test_compile_json_path(self):
+        assert compile_json_path("$.a[0]['content-type']") == ('a', 0, 'content-type')
+        # single quoted names only escape quotes and backslashes, double quoted names are JSON strings
+        assert compile_json_path("$['a\"b']") == ('a"b',)
+        assert compile_json_path("$['it\\'s']") == ("it's",)
+        assert compile_json_path("$['back\\\\slash']") == ('back\\slash',)
+        assert compile_json_path('$["a\\"b"]') == ('a"b',)
+        assert first_mismatch({ 'a"b': 1 }, { "$['a\"b']": 1 }) is None
+
+    def test_upload_file(self, tmp_path):
+        path = tmp_path / 'post.json'
+        path.write_text(json.dumps({ "title": "foo", "body": "bar", "userId": 1 }))
+
+        response: Response = self.actor.attempts_to(
+            Post.To('https://jsonplaceholder.typicode.com/posts').with_file(path),
+        )
+        assert response.status == 201
+        # the content type is guessed from the file name
+        assert response.body['title'] == 'foo'
+        assert response.timing.upload_bytes == path.stat().st_size
+        assert response.timing.upload_throughput > 0
+
+        multipart: Response = self.actor.attempts_to(
+            Put.To('https://jsonplaceholder.typicode.com/posts/1').with_multipart(fields={ "title": "foo" }, files={ "attachment": path }),
+        )
+        assert multipart.status == 200
+        assert multipart.timing.upload_bytes == len('foo') + path.stat().st_size
+
+    def test_request_body_size(self, tmp_path):
+        path = tmp_path / 'post.json'
+        path.write_bytes(b'{}')
+
+        assert RequestFile.at(path).read() == b'{}'
+        assert request_body_size(RequestFile.at(path), None) == 2
+        # Playwright sends the other values as str(value), e.g. True as 'True'
+        multipart = { "title": "größe", "draft": True, "userId": 1, "rating": 4.5, "attachment": path }
+        assert request_body_size(None, multipart) == len('größe'.encode('utf-8')) + len('True') + len('1') + len('4.5') + 2
+        assert request_body_size(None, { "attachment": { "name": "a.txt", "mimeType": "text/plain", "buffer": b'abc' } }) == 3
+
+    def test_response_equality(self):
+        decoded: List[bytes] = []
+
+        def lazy(raw: bytes) -> Response:
+            return Response(None, 200, {}, 1.0, body_decoder=lambda: decoded.append(raw) or json.loads(raw))
+
+        # the lazily decoded body is part of equality and repr
+        assert lazy(b'{"id": 1}') == Response({ "id": 1 }, 200, {}, 1.0)
+        assert lazy(b'{"id": 1}') != lazy(b'{"id": 2}')
+        assert "body={'id': 1}" in repr(lazy(b'{"id": 1}'))
+        assert len(decoded) == 4
+        assert dataclasses.replace(lazy(b'{"id": 1}'), status=500) == Response({ "id": 1 }, 500, {}, 1.0)
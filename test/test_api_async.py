@@ -0,0 +1,107 @@
+import asyncio
+import pytest
+from typing import Callable, List
+from playwright.async_api import async_playwright
+from testla_screenplay import Actor
+
+from src.testla_screenplay_playwright.api.abilities.async_use_api import AsyncUseAPI
+from src.testla_screenplay_playwright.api.actions.abstract_request import ARequest
+from src.testla_screenplay_playwright.api.actions.get import Get
+from src.testla_screenplay_playwright.api.actions.head import Head
+from src.testla_screenplay_playwright.api.actions.post import Post
+from src.testla_screenplay_playwright.api.actions.send import Send
+from src.testla_screenplay_playwright.api.questions.response import Response as ResponseQuestion
+from src.testla_screenplay_playwright.api.single_flight import AsyncSingleFlight
+from src.testla_screenplay_playwright.api.types import RawResponse, Response
+
+
+# execute tests with: pytest <file>
+# the async ability runs on its own event loop in a worker thread (see run_async in conftest.py), so these tests do not use the sync playwright fixture.
+
+class TestAPIAsync:
+
+    def test_get(self, run_async: Callable):
+        async def run() -> Response:
+            async with async_playwright() as playwright:
+                request_context = await playwright.request.new_context()
+                actor = Actor.named("Test Actor").can(AsyncUseAPI.using(request_context=request_context))
+                response = await Get.From('https://jsonplaceholder.typicode.com/posts/1').perform_as_async(actor)
+                assert await ResponseQuestion.has_status_code(response, 200).answered_by_async(actor)
+                await request_context.dispose()
+            return response
+
+        response = run_async(run())
+        assert response.body['id'] == 1
+
+    def test_send_all(self, run_async: Callable):
+        async def run() -> list[Response]:
+            async with async_playwright() as playwright:
+                request_context = await playwright.request.new_context()
+                actor = Actor.named("Test Actor").can(AsyncUseAPI.using(request_context=request_context, max_concurrency=4))
+                responses = await Send.all(
+                    [Get.From(f'https://jsonplaceholder.typicode.com/posts/{i}') for i in range(1, 11)]
+                    + [
+                        Post.To('https://jsonplaceholder.typicode.com/posts').with_data({ "title": 'foo', "body": 'bar', "userId": 1 }),
+                        Head.From('https://jsonplaceholder.typicode.com/posts/1'),
+                    ],
+                ).perform_as_async(actor)
+                await request_context.dispose()
+            return responses
+
+        responses = run_async(run())
+        # responses are in the order of the requests
+        assert [response.body['id'] for response in responses[:10]] == list(range(1, 11))
+        assert responses[10].status == 201
+        assert responses[11].body is None
+
+    def test_request_coalescing(self, run_async: Callable):
+        async def run() -> tuple[list[Response], AsyncUseAPI]:
+            async with async_playwright() as playwright:
+                request_context = await playwright.request.new_context()
+                ability = AsyncUseAPI.using(request_context=request_context).with_request_coalescing()
+                actor = Actor.named("Polling Actor").can(ability)
+                responses = await Send.all([Get.From('https://jsonplaceholder.typicode.com/posts/1') for _ in range(5)]).perform_as_async(actor)
+                await request_context.dispose()
+            return responses, ability
+
+        responses, ability = run_async(run())
+        # the identical requests shared one request
+        assert ability.get_coalescing_stats() == {'sent': 1, 'shared': 4}
+        assert all(response.body['id'] == 1 for response in responses)
+        # every caller got its own copy
+        assert len({id(response.headers) for response in responses}) == 5
+
+    def test_coalescing_leader_cancelled(self, run_async: Callable):
+        sent: List[int] = []
+
+        async def send() -> RawResponse:
+            sent.append(len(sent) + 1)
+            await asyncio.sleep(0.05)
+            return RawResponse(200, {}, str(len(sent)).encode())
+
+        async def run() -> tuple[List[RawResponse], AsyncSingleFlight]:
+            single_flight = AsyncSingleFlight()
+            leader = asyncio.create_task(single_flight.do('key', send))
+            await asyncio.sleep(0)
+            followers = [asyncio.create_task(single_flight.do('key', send)) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await asyncio.gather(*followers), single_flight
+
+        responses, single_flight = run_async(run())
+        # one of the followers sent the request again and shared it with the others
+        assert len(sent) == 2
+        assert [response.body for response in responses] == [b'2'] * 3
+        assert single_flight.leaders == 2
+        assert single_flight.followers == 2
+
+    def test_sync_only_request(self, run_async: Callable):
+        class SyncOnlyRequest(ARequest):
+            def perform_as(self, actor: Actor) -> object:
+                return None
+
+        # requests that were written before AsyncUseAPI can still be created and used with UseAPI
+        request = SyncOnlyRequest()
+        assert request.perform_as(Actor.named("Test Actor")) is None
+        with pytest.raises(RuntimeError, match='SyncOnlyRequest does not support AsyncUseAPI'):
+            run_async(request.perform_as_async(Actor.named("Test Actor")))
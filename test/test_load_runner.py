@@ -0,0 +1,79 @@
+import pytest
+from typing import Callable
+from playwright.async_api import async_playwright
+from testla_screenplay import Actor
+
+from src.testla_screenplay_playwright.api.abilities.async_use_api import AsyncUseAPI
+from src.testla_screenplay_playwright.api.actions.get import Get
+from src.testla_screenplay_playwright.shared.actions.sleep import Sleep
+from src.testla_screenplay_playwright.shared.histogram import LatencyHistogram, LatencySamples
+from src.testla_screenplay_playwright.shared.load_runner import LoadRunner, arrival_times
+
+
+class FailingStatus(Get):
+    """Get that fails unless the status is 200."""
+
+    async def perform_as_async(self, actor: Actor) -> None:
+        response = await super().perform_as_async(actor)
+        assert response.status == 200
+
+
+class TestLoadRunner:
+
+    def test_histogram(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 10_001):
+            histogram.record(value * 1_000)
+
+        assert histogram.count == 10_000
+        assert histogram.max == 10_000_000
+        assert histogram.mean == 5_000_500
+        # percentiles are accurate to less than 1%
+        assert abs(histogram.percentile(50) - 5_000_000) / 5_000_000 < 0.01
+        assert abs(histogram.percentile(99) - 9_900_000) / 9_900_000 < 0.01
+        assert histogram.percentile(100) == 10_000_000
+
+    def test_percentile_out_of_range(self):
+        samples = LatencySamples([1.0, 2.0, 3.0])
+        assert samples.percentile(0) == 1.0
+        assert samples.percentile(100) == 3.0
+        for percentile in (-1, 101, float('nan')):
+            with pytest.raises(ValueError, match='percentile'):
+                LatencyHistogram().percentile(percentile)
+            with pytest.raises(ValueError, match='percentile'):
+                samples.percentile(percentile)
+
+    def test_arrival_times(self):
+        assert len(list(arrival_times(rate=10, duration=2))) == 20
+        # ramping from 10/s to 30/s for 2s is an average of 20/s
+        assert len(list(arrival_times(rate=10, duration=2, ramp_to=30))) == 40
+
+    def test_threads(self):
+        report = LoadRunner(lambda number: Actor.named(f"Virtual Actor {number}"), lambda: [Sleep.For(0.01)], virtual_actors=4).run(rate=50, duration=1)
+
+        assert report.iterations == 50
+        assert report.errors == 0
+        assert report.summary()['Sleep']['p50'] >= 10
+
+    def test_asyncio_against_stub_server(self, run_async: Callable, stub_server: str):
+        async def run():
+            async with async_playwright() as playwright:
+                request_context = await playwright.request.new_context(base_url=stub_server)
+                runner = LoadRunner(
+                    lambda number: Actor.named(f"Virtual Actor {number}").can(AsyncUseAPI.using(request_context)),
+                    lambda: [FailingStatus('/items'), FailingStatus('/broken')],
+                    virtual_actors=5,
+                )
+                report = await runner.run_async(rate=20, duration=2, ramp_to=40)
+                await request_context.dispose()
+            return report
+
+        report = run_async(run())
+        # every iteration fails at the second request
+        assert report.iterations == 0
+        assert report.errors == 60
+        assert report.errors_by_type == {'AssertionError': 60}
+        assert sum(report.errors_over_time.values()) == 60
+        summary = report.summary()
+        assert summary['FailingStatus']['count'] == 60
+        assert summary['FailingStatus']['p50'] <= summary['FailingStatus']['p99'] <= summary['FailingStatus']['max']
@@ -0,0 +1,60 @@
+from threading import Thread
+from time import perf_counter
+from typing import Callable
+from playwright.async_api import async_playwright
+from testla_screenplay import Actor
+
+from src.testla_screenplay_playwright.api.abilities.async_use_api import AsyncUseAPI
+from src.testla_screenplay_playwright.api.actions.get import Get
+from src.testla_screenplay_playwright.api.actions.send import Send
+from src.testla_screenplay_playwright.api.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+
+    def test_burst_then_rate(self):
+        limiter = RateLimiter(requests_per_second=100, burst=5)
+        waits = [limiter.reserve('http://localhost/items') for _ in range(10)]
+
+        # the burst is sent right away, the rest is spread at 10 ms
+        assert waits[:5] == [0.0] * 5
+        assert all(abs(wait - 0.01 * (number + 1)) < 0.005 for number, wait in enumerate(waits[5:]))
+        assert limiter.delayed == 5
+        assert limiter.requests == 10
+
+    def test_per_host(self):
+        limiter = RateLimiter(requests_per_second=1, burst=1)
+        assert limiter.reserve('http://first.example/items') == 0.0
+        assert limiter.reserve('http://second.example/items') == 0.0
+        assert limiter.reserve('http://first.example/other') > 0.9
+
+        shared = RateLimiter(requests_per_second=1, burst=1, per_host=False)
+        shared.reserve('http://first.example/items')
+        assert shared.reserve('http://second.example/items') > 0.9
+
+    def test_threads(self):
+        limiter = RateLimiter(requests_per_second=200, burst=1)
+        start = perf_counter()
+        threads = [Thread(target=lambda: [limiter.acquire('/items') for _ in range(10)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 40 requests at 200/s take about 195 ms, no matter how many threads send them
+        assert perf_counter() - start >= 0.19
+        assert limiter.requests == 40
+
+    def test_response_timing(self, run_async: Callable, stub_server: str):
+        async def run():
+            async with async_playwright() as playwright:
+                request_context = await playwright.request.new_context(base_url=stub_server)
+                actor = Actor.named("Limited Actor").can(AsyncUseAPI.using(request_context).with_rate_limiter(RateLimiter(requests_per_second=50)))
+                responses = await Send.all([Get.From('/items') for _ in range(5)]).perform_as_async(actor)
+                await request_context.dispose()
+            return responses
+
+        responses = run_async(run())
+        assert all(response.status == 200 for response in responses)
+        # the last request waited for 4 slots of 20 ms
+        assert max(response.timing.rate_limit_ns for response in responses) >= 70_000_000
@@ -0,0 +1,95 @@
+import pytest
+from http.server import BaseHTTPRequestHandler
+from typing import Callable, Dict
+from playwright.async_api import async_playwright
+from testla_screenplay import Actor
+
+from src.testla_screenplay_playwright.api.abilities.async_use_api import AsyncUseAPI
+from src.testla_screenplay_playwright.api.actions.get import Get
+from src.testla_screenplay_playwright.api.actions.post import Post
+from src.testla_screenplay_playwright.api.retry import RetryAttempts, RetryPolicy
+from src.testla_screenplay_playwright.api.types import RawResponse, RequestMethod
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Answers /flaky/<n> with 502 for the first n requests and with 200 afterwards."""
+    requests: Dict[str, int] = {}
+
+    def _answer(self):
+        count = FlakyHandler.requests[self.path] = FlakyHandler.requests.get(self.path, 0) + 1
+        failures = int(self.path.rsplit('/', 1)[-1])
+        self.send_response(502 if count <= failures else 200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    do_GET = _answer
+    do_POST = _answer
+
+    def log_message(self, *args):
+        pass
+
+
+class TestRetry:
+
+    def test_backoff(self):
+        policy = RetryPolicy(max_attempts=5, backoff=0.1, max_backoff=0.3, jitter=False)
+        failed = RawResponse(502, {}, None)
+
+        assert [policy.next_backoff(attempt, 0, response=failed) for attempt in range(1, 6)] == [0.1, 0.2, 0.3, 0.3, None]
+        # other statuses and errors are not retried
+        assert policy.next_backoff(1, 0, response=RawResponse(404, {}, None)) is None
+        assert policy.next_backoff(1, 0, error=ValueError()) is None
+        # a retry would exceed the budget
+        assert RetryPolicy(backoff=1, budget=1.5, jitter=False).next_backoff(1, 1, response=failed) is None
+        # Retry-After is respected up to max_backoff
+        assert policy.next_backoff(1, 0, response=RawResponse(429, {'retry-after': '60'}, None)) == 0.3
+        # jitter waits between half and the full backoff
+        assert 0.05 <= RetryPolicy(backoff=0.1).next_backoff(1, 0, response=failed) <= 0.1
+
+    def test_attempts(self):
+        attempts = RetryAttempts(RetryPolicy(max_attempts=2, backoff=0.5, jitter=False))
+        failed = RawResponse(502, {}, None)
+
+        assert attempts.next_backoff(response=failed) == 0.5
+        attempts.backed_off(0.5)
+        # the last attempt is not retried, its response is returned with the bookkeeping
+        assert attempts.next_backoff(response=failed) is None
+        result = attempts.result(failed)
+        assert (result.attempts, result.backoff_ns) == (2, 500_000_000)
+        assert failed.attempts == 1
+
+    def test_idempotent_only(self):
+        assert RetryPolicy().retries(RequestMethod.GET)
+        assert RetryPolicy().retries(RequestMethod.PUT)
+        assert not RetryPolicy().retries(RequestMethod.POST)
+        assert RetryPolicy(idempotent_only=False).retries(RequestMethod.POST)
+
+    @pytest.mark.parametrize('stub_server', [FlakyHandler], indirect=True)
+    def test_retries(self, run_async: Callable, stub_server: str):
+        async def run():
+            async with async_playwright() as playwright:
+                request_context = await playwright.request.new_context(base_url=stub_server)
+                actor = Actor.named("Retrying Actor").can(AsyncUseAPI.using(request_context).with_retry_policy(RetryPolicy(backoff=0.01)))
+                responses = [
+                    await Get.From('/get/2').perform_as_async(actor),
+                    await Get.From('/get/5').perform_as_async(actor),
+                    # POST is not idempotent, unless the request allows it
+                    await Post.To('/post/1').perform_as_async(actor),
+                    await Post.To('/other-post/1').with_retry_policy(RetryPolicy(backoff=0.01, idempotent_only=False)).perform_as_async(actor),
+                ]
+                await request_context.dispose()
+            return responses
+
+        recovered, exhausted, post, retried_post = run_async(run())
+        assert recovered.status == 200
+        assert recovered.timing.attempts == 3
+        assert recovered.timing.backoff_ns > 0
+        # the last response is returned once all attempts failed
+        assert exhausted.status == 502
+        assert exhausted.timing.attempts == 3
+        assert post.status == 502
+        assert post.timing.attempts == 1
+        assert retried_post.status == 200
+        assert retried_post.timing.attempts == 2
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import pytest
+from http.server import BaseHTTPRequestHandler
+from threading import Thread
+from time import sleep
+from typing import Callable, List
+from playwright.async_api import async_playwright
+from testla_screenplay import Actor
+
+from src.testla_screenplay_playwright.api.abilities.async_use_api import AsyncUseAPI
+from src.testla_screenplay_playwright.api.actions.get import Get
+from src.testla_screenplay_playwright.api.token_provider import AsyncTokenProvider, Token, TokenProvider
+
+
+class AuthHandler(BaseHTTPRequestHandler):
+    """Answers with the Authorization header of the request, or with 401 for the token 'revoked'."""
+
+    def do_GET(self):
+        authorization = self.headers.get('Authorization')
+        body = json.dumps({ "authorization": authorization }).encode()
+        self.send_response(401 if authorization == 'Bearer revoked' else 200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTokenProvider:
+
+    def test_single_fetch_across_threads(self):
+        def fetch() -> Token:
+            sleep(0.1)
+            return Token('secret', expires_in=3600)
+
+        provider = TokenProvider(fetch)
+        tokens: List[str] = []
+        threads = [Thread(target=lambda: tokens.append(provider.token())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert tokens == ['secret'] * 8
+        assert provider.fetches == 1
+
+    def test_refresh_before_expiry(self):
+        tokens = iter(['first', 'second', 'third'])
+        provider = TokenProvider(lambda: Token(next(tokens), expires_in=0.2), refresh_margin=0.1)
+
+        assert provider.token() == 'first'
+        assert provider.token() == 'first'
+        # within the refresh margin of the expiry
+        sleep(0.15)
+        assert provider.token() == 'second'
+        provider.invalidate('first')
+        assert provider.token() == 'second'
+        provider.invalidate('second')
+        assert provider.token() == 'third'
+
+    def test_short_lived_token(self):
+        tokens = iter(['first', 'second'])
+        # the token lives shorter than the refresh margin of 30 seconds
+        provider = TokenProvider(lambda: Token(next(tokens), expires_in=0.2))
+
+        assert [provider.token() for _ in range(5)] == ['first'] * 5
+        assert provider.fetches == 1
+        # refreshed after half of its lifetime
+        sleep(0.1)
+        assert provider.token() == 'second'
+
+    def test_headers(self):
+        provider = TokenProvider(lambda: Token.from_oauth({ "access_token": 'secret', "token_type": 'Bearer' }))
+
+        assert provider.with_token(None, provider.token()) == {'Authorization': 'Bearer secret'}
+        # headers set by the request win
+        assert provider.with_token({'authorization': 'Basic abc'}, provider.token()) == {'authorization': 'Basic abc'}
+        assert TokenProvider(lambda: Token('key'), header='X-Api-Key', scheme=None).with_token({}, 'key') == {'X-Api-Key': 'key'}
+
+    @pytest.mark.parametrize('stub_server', [AuthHandler], indirect=True)
+    def test_injected_into_requests(self, run_async: Callable, stub_server: str):
+        tokens = iter(['revoked', 'fresh'])
+
+        async def fetch() -> Token:
+            await asyncio.sleep(0.05)
+            return Token(next(tokens), expires_in=3600)
+
+        async def run():
+            provider = AsyncTokenProvider(fetch)
+            async with async_playwright() as playwright:
+                request_context = await playwright.request.new_context(base_url=stub_server)
+                actors = [Actor.named(f"Actor {number}").can(AsyncUseAPI.using(request_context).with_token_provider(provider)) for number in range(3)]
+                first = await asyncio.gather(*[Get.From('/me').perform_as_async(actor) for actor in actors])
+                second = await Get.From('/me').perform_as_async(actors[0])
+                await request_context.dispose()
+            return provider, first, second
+
+        provider, first, second = run_async(run())
+        # the actors shared one token
+        assert [response.status for response in first] == [401] * 3
+        # the revoked token was replaced by a fresh one
+        assert second.status == 200
+        assert second.body == { "authorization": 'Bearer fresh' }
+        assert provider.fetches == 2
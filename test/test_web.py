@@ -1,6 +1,9 @@
+import os
 import pytest
+from pathlib import Path
+from time import perf_counter, time
 from typing import List
-from playwright.sync_api import Page, BrowserContext, Cookie, expect
+from playwright.sync_api import Browser, Page, BrowserContext, Cookie, Error, Locator, expect
 from testla_screenplay import Actor
 from src.testla_screenplay_playwright.web.abilities.browse_the_web import BrowseTheWeb
 from src.testla_screenplay_playwright.web.actions.navigate import Navigate
@@ -18,7 +21,11 @@ from src.testla_screenplay_playwright.web.actions.set import Set
 from src.testla_screenplay_playwright.web.actions.remove import Remove
 from src.testla_screenplay_playwright.web.actions.wait import Wait
 from src.testla_screenplay_playwright.web.questions.element import Element
-from src.testla_screenplay_playwright.web.types import SelectorOptions, SubSelector, SubSelectorOptions
+from src.testla_screenplay_playwright.web.context_pool import BrowserContextPool
+from src.testla_screenplay_playwright.web.request_blocking import RequestBlocking
+from src.testla_screenplay_playwright.web.storage_state_cache import StorageStateCache
+from src.testla_screenplay_playwright.web.types import ElementCheck, SelectorOptions, SubSelector, SubSelectorOptions
+from src.testla_screenplay_playwright.web.utils import serialize_element_check, trusts_auto_wait
 
 
 # execute tests with: pytest <file> --headed
@@ -42,6 +49,118 @@ class TestWeb:
         expect(BrowseTheWeb.As(self.actor).get_page()).to_have_url(url)
 
 
+    def test_block_requests(self):
+        stats = BrowseTheWeb.As(self.actor).block_requests(RequestBlocking(resource_types=['image', 'font', 'media'], estimated_bytes={'image': 10_000}))
+
+        self.actor.attempts_to(
+            Navigate.to("https://the-internet.herokuapp.com/hovers")
+        )
+        # the page is loaded without its images
+        expect(BrowseTheWeb.As(self.actor).get_page().locator('div.figure img').first).to_have_js_property('naturalWidth', 0)
+        assert stats.blocked_by_type['image'] > 0
+        assert stats.bytes_saved == stats.blocked_by_type['image'] * 10_000
+        assert stats.allowed > 0
+
+
+    def test_har_record_and_replay(self, browser: Browser, tmp_path: Path):
+        har = tmp_path / 'tables.har'
+
+        # first run: the traffic is recorded and written once the context is closed
+        context = browser.new_context()
+        actor = Actor.named("Recording Actor").can(BrowseTheWeb.using(page=context.new_page()))
+        assert BrowseTheWeb.As(actor).use_har(har) == 'record'
+        actor.attempts_to(
+            Navigate.to("https://the-internet.herokuapp.com/tables"),
+        )
+        context.close()
+        assert har.exists()
+
+        # second run: the page is served from the HAR file
+        context = browser.new_context()
+        actor = Actor.named("Replaying Actor").can(BrowseTheWeb.using(page=context.new_page()))
+        assert BrowseTheWeb.As(actor).use_har(har) == 'replay'
+        actor.attempts_to(
+            Navigate.to("https://the-internet.herokuapp.com/tables"),
+        )
+        assert actor.asks(Element.to_be_visible("h3", SelectorOptions(has_text="Data Tables")))
+
+        # requests that were not recorded are aborted
+        not_recorded = False
+        try:
+            actor.attempts_to(
+                Navigate.to("https://the-internet.herokuapp.com/login"),
+            )
+        except:
+            not_recorded = True
+        assert not_recorded
+        context.close()
+
+
+    def test_context_pool(self, browser: Browser):
+        pool = BrowserContextPool(browser, size=1, max_uses=2)
+
+        ability = BrowseTheWeb.from_pool(pool)
+        actor = Actor.named("Pooled Actor").can(ability)
+        actor.attempts_to(
+            Navigate.to("https://the-internet.herokuapp.com/login"),
+            Set.local_storage_items({"pooled": True}),
+        )
+        first_page = ability.get_page()
+        ability.release()
+
+        # the warm context is reused and was reset
+        ability = BrowseTheWeb.from_pool(pool)
+        assert ability.get_page() == first_page
+        assert ability.get_page().url == "about:blank"
+        assert len(ability.get_page().context.cookies()) == 0
+        actor = Actor.named("Second Pooled Actor").can(ability)
+        actor.attempts_to(
+            Navigate.to("https://the-internet.herokuapp.com/login"),
+        )
+        assert actor.attempts_to(Get.local_storage_item("pooled")) is None
+        ability.release()
+
+        # max_uses reached -> a new context is created
+        ability = BrowseTheWeb.from_pool(pool)
+        assert ability.get_page() != first_page
+        ability.release()
+
+        assert pool.metrics.leases == 3
+        assert pool.metrics.reuses == 1
+        assert pool.metrics.recycled == 1
+        pool.close()
+
+    def test_context_pool_exhausted(self, browser: Browser):
+        pool = BrowserContextPool(browser, size=1)
+        ability = BrowseTheWeb.from_pool(pool)
+
+        # the only context is leased, so the pool fails instead of waiting forever
+        with pytest.raises(RuntimeError):
+            BrowseTheWeb.from_pool(pool)
+
+        ability.release()
+        ability = BrowseTheWeb.from_pool(pool)
+        assert pool.metrics.reuses == 1
+        ability.release()
+        pool.close()
+
+    def test_context_pool_create_failure(self, browser: Browser, monkeypatch: pytest.MonkeyPatch):
+        pool = BrowserContextPool(browser, size=1)
+
+        def failing_new_context(**kwargs):
+            raise Error("browser has been closed")
+
+        monkeypatch.setattr(browser, 'new_context', failing_new_context)
+        with pytest.raises(Error):
+            BrowseTheWeb.from_pool(pool)
+        monkeypatch.undo()
+
+        # the slot of the failed context is given back, so the pool is not exhausted
+        ability = BrowseTheWeb.from_pool(pool)
+        assert pool.metrics.created == 1
+        ability.release()
+        pool.close()
+
     def test_drag_and_drop(self):
         self.actor.attempts_to(
             Navigate.to("https://the-internet.herokuapp.com/drag_and_drop")
@@ -142,6 +261,95 @@ class TestWeb:
             )
         )
 
+    def test_compiled_selector_round_trips(self, monkeypatch: pytest.MonkeyPatch):
+        # count the browser round trips spent on waiting before the actual action
+        waits: List[Locator] = []
+        original_wait_for = Locator.wait_for
+
+        def counting_wait_for(locator: Locator, *args, **kwargs):
+            waits.append(locator)
+            return original_wait_for(locator, *args, **kwargs)
+
+        monkeypatch.setattr(Locator, 'wait_for', counting_wait_for)
+
+        self.actor.attempts_to(
+            Navigate.to("https://the-internet.herokuapp.com/tables"),
+            Click.on(
+                '[id="table1"]',
+                SelectorOptions(
+                    sub_selector=SubSelector(
+                        selector='tbody tr',
+                        options=SubSelectorOptions(
+                            has_text='Conway',
+                            sub_selector=SubSelector(
+                                'td:has-text("$50.00")'
+                            )
+                        )
+                    )
+                )
+            )
+        )
+        # the three level chain is compiled into a single locator with a single wait
+        assert len(waits) == 1
+
+    def test_trust_auto_wait(self, page: Page, monkeypatch: pytest.MonkeyPatch):
+        waits: List[Locator] = []
+        original_wait_for = Locator.wait_for
+
+        def counting_wait_for(locator: Locator, *args, **kwargs):
+            waits.append(locator)
+            return original_wait_for(locator, *args, **kwargs)
+
+        monkeypatch.setattr(Locator, 'wait_for', counting_wait_for)
+
+        actor = Actor.named("Trusting Actor").can(BrowseTheWeb.using(page=page, trust_auto_wait=True))
+        actor.attempts_to(
+            Navigate.to("https://the-internet.herokuapp.com/login"),
+            Fill.In('[id="username"]', 'tomsmith'),
+            Type.In('[id="password"]', 'SuperSecretPassword!'),
+        )
+        # fill and type wait for the element to be actionable on their own
+        assert len(waits) == 0
+
+        # the explicit wait is kept for Wait.for_selector and can be enforced per selector
+        actor.attempts_to(
+            Wait.for_selector('[id="username"]'),
+            Click.on('[class="radius"]', SelectorOptions(trust_auto_wait=False)),
+        )
+        assert len(waits) == 2
+        expect(page).to_have_url("https://the-internet.herokuapp.com/secure")
+
+        # without the explicit wait the timeout of the SelectorOptions is passed on to the action
+        with pytest.raises(Error, match="Timeout 500ms exceeded"):
+            actor.attempts_to(Click.on('[id="missing"]', SelectorOptions(timeout=500)))
+        assert len(waits) == 2
+
+        # actions do not wait for an element to disappear, so the explicit wait is kept for 'hidden' and 'detached'
+        assert trusts_auto_wait(True, SelectorOptions(state='visible'), 'visible')
+        assert not trusts_auto_wait(True, SelectorOptions(state='hidden'), 'hidden')
+
+    def test_locator_cache(self):
+        cache = BrowseTheWeb.As(self.actor).locator_cache
+
+        self.actor.attempts_to(
+            Navigate.to("https://the-internet.herokuapp.com/login"),
+            Fill.In('[id="username"]', 'tomsmith'),
+            Type.In('[id="username"]', '!'),
+            Click.on('[id="username"]'),
+        )
+        # the selector is resolved once and reused by the following actions
+        assert cache.misses == 1
+        assert cache.hits == 2
+
+        # the compiled selector does not depend on the document, so it is reused after a navigation
+        self.actor.attempts_to(
+            Navigate.to("https://the-internet.herokuapp.com/login"),
+            Fill.In('[id="username"]', 'tomsmith'),
+        )
+        assert len(cache) == 1
+        assert cache.misses == 1
+        assert cache.hits == 3
+
     def test_cookies(self):
         context: BrowserContext = BrowseTheWeb.As(self.actor).get_page().context
 
@@ -177,6 +385,50 @@ class TestWeb:
         # assert that cookies are retrieved successfully
         assert get_cookies == cookies_to_add
 
+    def test_storage_state_cache(self, browser: Browser, tmp_path: Path):
+        cache = StorageStateCache(tmp_path, ttl=60.0)
+        actor = Actor.named("Caching Actor").can(BrowseTheWeb.using(page=BrowseTheWeb.As(self.actor).get_page(), storage_state_cache=cache))
+
+        # nothing cached yet -> log in via the UI and save the storage state
+        assert not BrowseTheWeb.As(actor).restore_storage_state('tomsmith')
+        actor.attempts_to(
+            Navigate.to("https://the-internet.herokuapp.com/login"),
+            Fill.In('[id="username"]', 'tomsmith'),
+            Type.In('[id="password"]', 'SuperSecretPassword!'),
+            Click.on('[class="radius"]'),
+        )
+        BrowseTheWeb.As(actor).save_storage_state('tomsmith')
+
+        # a new context starts logged in
+        context = cache.new_context(browser, 'tomsmith')
+        other_actor = Actor.named("Other Actor").can(BrowseTheWeb.using(page=context.new_page()))
+        other_actor.attempts_to(
+            Navigate.to("https://the-internet.herokuapp.com/secure"),
+        )
+        expect(BrowseTheWeb.As(other_actor).get_page()).to_have_url("https://the-internet.herokuapp.com/secure")
+        context.close()
+
+    def test_storage_state_cache_stale_lock(self, tmp_path: Path):
+        cache = StorageStateCache(tmp_path, lock_timeout=1.0)
+        lock_path = cache.path_for('tomsmith').with_suffix('.lock')
+
+        # the lock of a crashed worker is broken
+        lock_path.touch()
+        os.utime(lock_path, (time() - 10, time() - 10))
+        with cache.lock('tomsmith'):
+            assert lock_path.exists()
+        assert not lock_path.exists()
+
+        # another worker broke the stale lock first and holds a fresh one, which is kept
+        lock_path.touch()
+        os.utime(lock_path, (time() - 10, time() - 10))
+        stale = lock_path.stat()
+        lock_path.unlink()
+        lock_path.touch()
+        cache._break_stale_lock(lock_path, stale)
+        assert lock_path.exists()
+        assert [path.name for path in tmp_path.iterdir()] == [lock_path.name]
+
     def test_session_and_local_storage(self):
         self.actor.attempts_to(
             Navigate.to('https://google.com'),
@@ -223,6 +475,45 @@ class TestWeb:
         )
         assert session_deleted is None
 
+    def test_bulk_session_and_local_storage(self):
+        flags = {f'flag{i}': i % 2 == 0 for i in range(50)}
+
+        self.actor.attempts_to(
+            Navigate.to('https://google.com'),
+
+            Set.local_storage_items(flags),
+            Set.session_storage_items({'sessionKey': 'sessionValue', 'sessionObject': {'a': [1, 2]}}),
+        )
+
+        # get some and all items
+        local = self.actor.attempts_to(
+            Get.local_storage_items(['flag0', 'flag1', '???']),
+        )
+        assert local == {'flag0': True, 'flag1': False, '???': None}
+
+        all_local = self.actor.attempts_to(
+            Get.all_local_storage(),
+        )
+        assert flags.items() <= all_local.items()
+
+        session = self.actor.attempts_to(
+            Get.all_session_storage(),
+        )
+        assert session['sessionObject'] == {'a': [1, 2]}
+
+        # remove items and verify that they were deleted
+        local_deleted = self.actor.attempts_to(
+            Remove.local_storage_items(['flag0', 'flag1']),
+            Get.local_storage_items(['flag0', 'flag1', 'flag2']),
+        )
+        assert local_deleted == {'flag0': None, 'flag1': None, 'flag2': True}
+
+        session_deleted = self.actor.attempts_to(
+            Remove.session_storage_items(['sessionKey', 'sessionObject']),
+            Get.session_storage_items(['sessionKey', 'sessionObject']),
+        )
+        assert session_deleted == {'sessionKey': None, 'sessionObject': None}
+
     def test_element_visible(self):
         self.actor.attempts_to(
             Navigate.to('https://the-internet.herokuapp.com/tables'),
@@ -315,4 +606,67 @@ class TestWeb:
             self.actor.asks(Element.not_to_have_value('[id="username"]', 'test'))
         except:
             not_value_res = True
-        assert not_value_res
\ No newline at end of file
+        assert not_value_res
+
+    def test_element_all_of(self):
+        self.actor.attempts_to(
+            Navigate.to('https://the-internet.herokuapp.com/login'),
+            Fill.In('[id="username"]', 'test'),
+        )
+
+        assert self.actor.asks(Element.all_of([
+            Element.to_be_visible("h2", SelectorOptions(has_text="Login Page")),
+            Element.not_to_be_visible("h2", SelectorOptions(has_text="this does not exist")),
+            Element.to_be_enabled('[id="password"]'),
+            Element.to_have_text("h2", "Login Page"),
+            Element.to_have_value('[id="username"]', 'test'),
+            Element.not_to_have_value('[id="username"]', 'this value is wrong'),
+        ]))
+
+        # every failed check is reported at once
+        failures = ''
+        try:
+            self.actor.asks(Element.all_of([
+                Element.to_have_text("h2", "this text does not exist"),
+                Element.to_be_visible("h2"),
+                Element.to_have_value('[id="username"]', 'this value is wrong'),
+            ], timeout=1000.0))
+        except AssertionError as error:
+            failures = str(error)
+        assert failures.startswith('2 of 3 element checks failed')
+
+    def test_element_all_of_shadow_dom(self):
+        page = BrowseTheWeb.As(self.actor).get_page()
+        page.set_content("""
+            <h2>Light DOM</h2>
+            <shadow-host></shadow-host>
+            <script>
+                document.querySelector('shadow-host').attachShadow({ mode: 'open' }).innerHTML = '<h3>Shadow DOM</h3>';
+            </script>
+        """)
+
+        # the page can not find elements in shadow roots, Playwright validates these checks
+        assert self.actor.asks(Element.all_of([
+            Element.to_be_visible("h2"),
+            Element.to_have_text("h3", "Shadow DOM"),
+        ]))
+        failures = ''
+        try:
+            self.actor.asks(Element.all_of([Element.not_to_be_visible("h3")], timeout=1000.0))
+        except AssertionError as error:
+            failures = str(error)
+        assert failures.startswith('1 of 1 element checks failed')
+
+        # the checks validated by Playwright share the timeout instead of getting it each
+        start_time = perf_counter()
+        with pytest.raises(AssertionError, match='3 of 3 element checks failed'):
+            self.actor.asks(Element.all_of([
+                Element.not_to_be_visible("h3"),
+                Element.to_have_text("h3", "this text does not exist"),
+                Element.to_be_visible("h3", SelectorOptions(timeout=5000.0, state='attached', has_text="this does not exist")),
+            ], timeout=1000.0))
+        assert perf_counter() - start_time < 2.0
+
+        # states are only waited for by Playwright
+        assert serialize_element_check(ElementCheck("h2", 'visible')) is not None
+        assert serialize_element_check(ElementCheck("h2", 'visible', options=SelectorOptions(state='attached'))) is None
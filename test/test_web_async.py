@@ -0,0 +1,73 @@
+import asyncio
+from typing import Callable
+from playwright.async_api import Browser, async_playwright, expect
+from testla_screenplay import Actor
+from src.testla_screenplay_playwright.web.abilities.async_browse_the_web import AsyncBrowseTheWeb
+from src.testla_screenplay_playwright.web.actions.navigate import Navigate
+from src.testla_screenplay_playwright.web.actions.click import Click
+from src.testla_screenplay_playwright.web.actions.fill import Fill
+from src.testla_screenplay_playwright.web.actions.type import Type
+from src.testla_screenplay_playwright.web.actions.wait import Wait
+from src.testla_screenplay_playwright.web.questions.element import Element
+from src.testla_screenplay_playwright.web.types import SelectorOptions, SubSelector, SubSelectorOptions
+
+
+# execute tests with: pytest <file>
+# the async ability runs on its own event loop in a worker thread (see run_async in conftest.py), so these tests do not use the sync page fixture.
+
+async def login(browser: Browser, name: str) -> str:
+    page = await browser.new_page()
+    actor = Actor.named(name).can(AsyncBrowseTheWeb.using(page=page))
+
+    await Navigate.to("https://the-internet.herokuapp.com/login").perform_as_async(actor)
+    await Fill.In('[id="username"]', 'tomsmith').perform_as_async(actor)
+    await Type.In('[id="password"]', 'SuperSecretPassword!').perform_as_async(actor)
+    await Click.on('[class="radius"]').perform_as_async(actor)
+
+    await expect(AsyncBrowseTheWeb.As(actor).get_page()).to_have_url("https://the-internet.herokuapp.com/secure")
+    url = AsyncBrowseTheWeb.As(actor).get_page().url
+    await page.close()
+    return url
+
+
+class TestWebAsync:
+
+    def test_concurrent_pages(self, run_async: Callable):
+        async def run():
+            async with async_playwright() as playwright:
+                browser = await playwright.chromium.launch()
+                # one event loop drives several pages at once
+                urls = await asyncio.gather(*[login(browser, f"Actor {i}") for i in range(3)])
+                await browser.close()
+            return urls
+
+        assert run_async(run()) == ["https://the-internet.herokuapp.com/secure"] * 3
+
+    def test_wait_and_element(self, run_async: Callable):
+        async def run():
+            async with async_playwright() as playwright:
+                browser = await playwright.chromium.launch()
+                page = await browser.new_page()
+                actor = Actor.named("Test Actor").can(AsyncBrowseTheWeb.using(page=page))
+
+                await Navigate.to("https://the-internet.herokuapp.com/tables").perform_as_async(actor)
+                await Wait.for_selector(
+                    '[id="table1"]',
+                    SelectorOptions(
+                        sub_selector=SubSelector(
+                            selector='tbody tr',
+                            options=SubSelectorOptions(
+                                has_text='Conway',
+                                sub_selector=SubSelector(
+                                    'td:has-text("$50.00")'
+                                )
+                            )
+                        )
+                    )
+                ).perform_as_async(actor)
+                visible = await Element.to_be_visible("h3", SelectorOptions(has_text="Data Tables")).answered_by_async(actor)
+                hidden = await Element.not_to_be_visible("h3", SelectorOptions(has_text="this does not exist")).answered_by_async(actor)
+                await browser.close()
+            return visible and hidden
+
+        assert run_async(run())